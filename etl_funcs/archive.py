@@ -0,0 +1,142 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+
+#  =============================== Page archive - Record and replay ================================ #
+
+ARCHIVE_DIR = "temp/archive"
+
+class PageArchive:
+
+    """
+    This class is a compressed, content-addressed archive of every page fetched by the scraper. Page
+    bodies are stored gzipped under the SHA-256 of their content, so a page which didn't change
+    between runs (or two URLs serving the same body) is only stored once. Each run gets its own
+    manifest, a JSONL file listing the URL, status code and content hash of every page it fetched,
+    so the exact pages seen by any past run can be read back, e.g. to reprocess them with new
+    parsing rules or to benchmark the parsers on a fixed corpus.
+    """
+
+    def __init__(self, archive_dir: str = ARCHIVE_DIR) -> None:
+
+        self.objects_dir = os.path.join(archive_dir, "objects")
+        self.manifests_dir = os.path.join(archive_dir, "manifests")
+        self.run_id = None
+        self._lock = threading.Lock()
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.manifests_dir, exist_ok=True)
+
+    def _object_path(self, digest: str) -> str:
+
+        """
+        This method returns the path of the file holding the body with the given content hash.
+
+        Parameters:
+        digest (str): SHA-256 of the body
+
+        Returned value:
+        str: path of the compressed body
+        """
+
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.html.gz")
+
+    def record(self, url: str, text: str, status_code: int) -> None:
+
+        """
+        This method archives a fetched page and adds it to the manifest of the current run (started
+        on the first recorded page).
+
+        Parameters:
+        url (str): URL of the page
+        text (str): body of the page
+        status_code (int): HTTP status code of the page
+
+        Returned value:
+        None
+        """
+
+        content = text.encode("utf-8")
+        digest = hashlib.sha256(content).hexdigest()
+        path = self._object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with gzip.open(temp_path, "wb") as f:
+                f.write(content)
+            os.replace(temp_path, path)
+
+        line = json.dumps({"url": url, "status_code": status_code, "sha256": digest, "fetched_at": time.time()})
+
+        with self._lock:
+            if self.run_id is None:
+                self.run_id = datetime.now().strftime("%Y%m%dT%H%M%S")
+                logging.info(f"Archiving fetched pages as run {self.run_id}.")
+            with open(os.path.join(self.manifests_dir, f"{self.run_id}.jsonl"), "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+
+    def list_runs(self) -> list:
+
+        """
+        This method lists the archived runs, oldest first.
+
+        Parameters:
+        None
+
+        Returned value:
+        list: run ids
+        """
+
+        return sorted(file_name[:-len(".jsonl")] for file_name in os.listdir(self.manifests_dir) if file_name.endswith(".jsonl"))
+
+    def load_manifest(self, run_id: str = "latest") -> dict:
+
+        """
+        This method reads the manifest of an archived run. When a URL was fetched more than once in
+        the run, its last fetch is kept.
+
+        Parameters:
+        run_id (str): id of the run, or "latest" for the most recent one
+
+        Returned value:
+        dict: manifest entry (status code and content hash) of each URL
+        """
+
+        if run_id == "latest":
+            runs = self.list_runs()
+            if not runs:
+                raise FileNotFoundError(f"No archived runs found in {self.manifests_dir}.")
+            run_id = runs[-1]
+
+        manifest = {}
+        with open(os.path.join(self.manifests_dir, f"{run_id}.jsonl"), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError: # line left half-written by an interrupted run
+                    continue
+                manifest[entry["url"]] = entry
+
+        logging.info(f"Archived run {run_id}: {len(manifest)} pages.")
+
+        return manifest
+
+    def read(self, digest: str) -> str:
+
+        """
+        This method reads an archived body.
+
+        Parameters:
+        digest (str): SHA-256 of the body
+
+        Returned value:
+        str: body of the page
+        """
+
+        with gzip.open(self._object_path(digest), "rb") as f:
+            return f.read().decode("utf-8")
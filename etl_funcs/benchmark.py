@@ -0,0 +1,592 @@
+import json
+import logging
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+import pandas as pd
+from etl_funcs import html_parser
+from etl_funcs.archive import PageArchive
+from etl_funcs.transform import build_dimension, register_dimension_ids, register_character_ids
+from etl_funcs.key_registry import KeyRegistry
+from etl_funcs.scraper import CharacterRecord
+from etl_funcs.scraper import parse_wuwa_character_page, parse_genshin_character_list, parse_zzz_character_page, \
+    parse_hsr_character_list, parse_hsr_character_page, parse_ow_character_list
+
+#  =================================== Benchmarks - Page corpus ==================================== #
+
+# Game and parsing function of each kind of page, by URL prefix, with the extra arguments of the function
+PAGE_PARSERS = {
+    "https://wutheringwaves.fandom.com/wiki/": ("wuthering_waves", parse_wuwa_character_page, []),
+    "https://genshin-impact.fandom.com/wiki/Character/List": ("genshin_impact", parse_genshin_character_list, []),
+    "https://zenless-zone-zero.fandom.com/wiki/": ("zenless_zone_zero", parse_zzz_character_page, []),
+    "https://www.thegamer.com/honkai-star-rail-playable-character-age-height-path-element/": ("honkai_star_rail", parse_hsr_character_list, []),
+    "https://honkai-star-rail.fandom.com/wiki/": ("honkai_star_rail", parse_hsr_character_page, []),
+    "https://overwatch.fandom.com/wiki/Heroes": ("overwatch_2", parse_ow_character_list, [{}]) # characters missing from the gender dictionary are parsed as well
+}
+
+# Size of the synthetic pages, well above the current size of the real ones
+SYNTHETIC_GENSHIN_ROWS = 5000
+SYNTHETIC_HSR_ROWS = 1000
+SYNTHETIC_OW_ROWS = 1000
+SYNTHETIC_ARTICLE_PARAGRAPHS = 2000 # paragraphs of article text around the infobox of a character page
+
+def get_parse_function(url: str) -> tuple | None:
+
+    """
+    This function gets the game and parsing function of a page, from its URL.
+
+    Parameters:
+    url (str): URL of the page
+
+    Returned value:
+    tuple | None: game, parsing function and its extra arguments, or None if the page isn't parsed by the scraper
+    """
+
+    for prefix, parser in PAGE_PARSERS.items():
+        if url.startswith(prefix):
+            return parser
+
+    return None
+
+def load_archived_pages(run_id: str = "latest") -> list:
+
+    """
+    This function loads the pages of an archived run, to be used as the fixed benchmark corpus.
+    Pages which aren't parsed by the scraper (e.g. MediaWiki API answers) are left out.
+
+    Parameters:
+    run_id (str): id of the archived run, or "latest" for the most recent one
+
+    Returned value:
+    list: benchmark samples (dictionaries with the game, source, page content, parsing function and its arguments)
+    """
+
+    archive = PageArchive()
+    samples = []
+
+    for url, entry in archive.load_manifest(run_id).items():
+        parser = get_parse_function(url)
+        if parser is None or entry["status_code"] != 200:
+            continue
+        game, parse_func, args = parser
+        samples.append({"game": game, "source": url, "page_text": archive.read(entry["sha256"]), "parse_func": parse_func, "args": args})
+
+    return samples
+
+def _build_table_page(rows: list, tables_before: int = 0, tbody: bool = True) -> str:
+
+    """
+    This function builds a page holding a wiki-like table, with a header row, after the given
+    number of unrelated tables.
+
+    Parameters:
+    rows (list): cell texts of each row
+    tables_before (int): number of tables placed before the character table
+    tbody (bool): if False, the rows of the tables aren't wrapped in a tbody element (which some backends add and others don't)
+
+    Returned value:
+    str: HTML content of the page
+    """
+
+    body_start, body_end = ("<tbody>", "</tbody>") if tbody else ("", "")
+    other_tables = f"<table>{body_start}<tr><td>Navigation</td></tr>{body_end}</table>" * tables_before
+    body = "".join("<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+
+    return f"<html><body>{other_tables}<table>{body_start}<tr><th>Header</th></tr>{body}{body_end}</table></body></html>"
+
+def build_synthetic_pages() -> list:
+
+    """
+    This function builds scaled-up pages with the structure of the real ones (a 5,000-row Genshin
+    character list, long character pages, etc.), to see how parsing grows with page size.
+
+    Parameters:
+    None
+
+    Returned value:
+    list: benchmark samples (dictionaries with the game, source, page content, parsing function and its arguments)
+    """
+
+    genshin_rows = [["Icon", f"Character {i}", "5", "Pyro", "Sword", "Mondstadt", "Medium Female", "September 28, 2020", "1.0"]
+                    for i in range(SYNTHETIC_GENSHIN_ROWS)]
+    hsr_rows = [[f"Character {i}", "Destruction", "Adult Female"] for i in range(SYNTHETIC_HSR_ROWS)]
+    ow_rows = [["Icon", "Damage", f"Character {i}", "Hitscan", "United Kingdom", "London", "24-May-16"] for i in range(SYNTHETIC_OW_ROWS)]
+
+    infobox_fields = {"gender": "Female", "nation": "Huanglong", "faction": "Stellaron Hunters", "releaseDate": "May 22, 2024<br/>Version 1.0",
+                      "release_date": "April 26, 2023"}
+    infobox = "".join(f'<div class="pi-item pi-data" data-source="{source}"><h3 class="pi-data-label">{source}</h3>'
+                      f'<div class="pi-data-value">{value}</div></div>' for source, value in infobox_fields.items())
+    article = "".join(f"<p>Paragraph {i} of the character's story, with <a href='#'>a link</a> and <b>some markup</b>.</p>"
+                      for i in range(SYNTHETIC_ARTICLE_PARAGRAPHS))
+    character_page = (f"<html><body><h1 class='page-header__title'><span class='mw-page-title-main'>Character</span></h1>"
+                      f"<main><aside class='portable-infobox pi-background pi-border-color pi-theme-wikia pi-layout-default'>{infobox}</aside>"
+                      f"{article}</main></body></html>")
+
+    return [
+        {"game": "genshin_impact", "source": f"synthetic: {SYNTHETIC_GENSHIN_ROWS}-row character list", "page_text": _build_table_page(genshin_rows),
+         "parse_func": parse_genshin_character_list, "args": []},
+        {"game": "honkai_star_rail", "source": f"synthetic: {SYNTHETIC_HSR_ROWS}-row character table", "page_text": _build_table_page(hsr_rows),
+         "parse_func": parse_hsr_character_list, "args": []},
+        {"game": "overwatch_2", "source": f"synthetic: {SYNTHETIC_OW_ROWS}-row hero list", "page_text": _build_table_page(ow_rows, 1),
+         "parse_func": parse_ow_character_list, "args": [{}]},
+        {"game": "overwatch_2", "source": f"synthetic: {SYNTHETIC_OW_ROWS}-row hero list without tbody", "page_text": _build_table_page(ow_rows, 1, False),
+         "parse_func": parse_ow_character_list, "args": [{}]},
+        {"game": "wuthering_waves", "source": "synthetic: long character page", "page_text": character_page,
+         "parse_func": parse_wuwa_character_page, "args": []},
+        {"game": "zenless_zone_zero", "source": "synthetic: long character page", "page_text": character_page,
+         "parse_func": parse_zzz_character_page, "args": []},
+        {"game": "honkai_star_rail", "source": "synthetic: long character page", "page_text": character_page,
+         "parse_func": parse_hsr_character_page, "args": []}
+    ]
+
+#  =============================== Benchmarks - HTML parser backends =============================== #
+
+BENCHMARK_REPEAT = 5 # number of times each page is parsed
+
+def measure_parse(page_text: str, parse_func, args: list, backend: str, repeat: int) -> dict:
+
+    """
+    This function measures the time and memory taken to parse a page with a backend. Time is
+    measured first, without memory tracing (which slows Python code down), then the peak memory
+    allocated during one more parse is measured.
+
+    Parameters:
+    page_text (str): HTML content of the page
+    parse_func (function): parsing function
+    args (list): extra arguments of the parsing function
+    backend (str): HTML parser backend
+    repeat (int): number of timed parses
+
+    Returned value:
+    dict: median and best parse time (ms) and peak memory (KiB)
+    """
+
+    html_parser.HTML_PARSER_BACKEND = backend
+    timings = []
+
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            parse_func(page_text, *args)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        tracemalloc.start()
+        parse_func(page_text, *args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        html_parser.HTML_PARSER_BACKEND = None
+
+    return {
+        "median_ms": round(statistics.median(timings), 3),
+        "best_ms": round(min(timings), 3),
+        "peak_memory_kib": round(peak / 1024, 1)
+    }
+
+def parse_with_backend(page_text: str, parse_func, args: list, backend: str, partial: bool = True):
+
+    """
+    This function parses a page with a backend and returns what the parsing function read, or the
+    error it raised.
+
+    Parameters:
+    page_text (str): HTML content of the page
+    parse_func (function): parsing function
+    args (list): extra arguments of the parsing function
+    backend (str): HTML parser backend
+    partial (bool): if False, the whole page is parsed instead of the target subtrees only
+
+    Returned value:
+    list | dict | str: output of the parsing function, or the representation of its error
+    """
+
+    html_parser.HTML_PARSER_BACKEND = backend
+    html_parser.PARTIAL_PARSING = partial
+
+    try:
+        return parse_func(page_text, *args)
+    except Exception as error:
+        return repr(error)
+    finally:
+        html_parser.HTML_PARSER_BACKEND = None
+        html_parser.PARTIAL_PARSING = True
+
+def benchmark_parser_backends(samples: list, repeat: int = BENCHMARK_REPEAT) -> list:
+
+    """
+    This function parses every page with each available backend (only the subtrees read by the
+    parsing function are built) and, as a reference, builds the whole page with html.parser, which
+    is what every page used to cost before the targeted parsing was introduced. The output of each
+    backend is checked against the output of html.parser over the whole page, since a backend
+    keeping the wrong subtrees (or reading a different table) would make its timings meaningless.
+
+    Parameters:
+    samples (list): benchmark samples
+    repeat (int): number of timed parses of each page with each backend
+
+    Returned value:
+    list: one result dictionary per page and backend
+    """
+
+    results = []
+
+    for sample in samples:
+        page_info = {"game": sample["game"], "source": sample["source"], "size_kib": round(len(sample["page_text"]) / 1024, 1)}
+
+        whole_page = measure_parse(sample["page_text"], lambda text: html_parser.parse_html(text, None, "html.parser"), [],
+                                   "html.parser", repeat)
+        results.append({**page_info, "backend": "html.parser (whole page)", **whole_page})
+
+        reference = parse_with_backend(sample["page_text"], sample["parse_func"], sample["args"], "html.parser", partial = False)
+
+        for backend in html_parser.get_available_backends():
+            same_output = parse_with_backend(sample["page_text"], sample["parse_func"], sample["args"], backend) == reference
+            if not same_output:
+                logging.warning(f"The {backend} backend doesn't parse the page \"{sample['source']}\" like html.parser does over the whole page.")
+
+            results.append({**page_info, "backend": backend, "same_output": same_output,
+                            **measure_parse(sample["page_text"], sample["parse_func"], sample["args"], backend, repeat)})
+
+    return results
+
+#  ============================== Benchmarks - Extraction throughput =============================== #
+
+def benchmark_games(samples: list, repeat: int = BENCHMARK_REPEAT) -> dict:
+
+    """
+    This function runs the extraction logic of each game (parsing its pages, then building the
+    DataFrame saved by its extractor) over the benchmark samples, with the configured backend.
+    Network time is left out, since the pages are read from disk.
+
+    Parameters:
+    samples (list): benchmark samples
+    repeat (int): number of times each page is parsed
+
+    Returned value:
+    dict: pages per second, p50 and p99 parse time (ms), DataFrame construction time (ms) and peak memory (KiB) of each game
+    """
+
+    results = {}
+    games = list(dict.fromkeys(sample["game"] for sample in samples))
+
+    for game in games:
+        game_samples = [sample for sample in samples if sample["game"] == game]
+        timings = []
+
+        # 1. Timing the parsing of every page
+
+        for _ in range(repeat):
+            records = []
+            for sample in game_samples:
+                start = time.perf_counter()
+                record = sample["parse_func"](sample["page_text"], *sample["args"])
+                timings.append((time.perf_counter() - start) * 1000)
+                records.extend(record if isinstance(record, list) else [record])
+
+        # 2. Timing the DataFrame construction
+
+        start = time.perf_counter()
+        pd.DataFrame(records).to_csv()
+        dataframe_ms = (time.perf_counter() - start) * 1000
+
+        # 3. Measuring the peak memory of a whole pass
+
+        tracemalloc.start()
+        records = []
+        for sample in game_samples:
+            record = sample["parse_func"](sample["page_text"], *sample["args"])
+            records.extend(record if isinstance(record, list) else [record])
+        pd.DataFrame(records).to_csv()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results[game] = {
+            "pages": len(game_samples),
+            "records": len(records),
+            "pages_per_second": round(len(timings) / (sum(timings) / 1000), 2),
+            "p50_parse_ms": round(statistics.median(timings), 3),
+            "p99_parse_ms": round(statistics.quantiles(timings, n = 100, method = "inclusive")[98] if len(timings) > 1 else timings[0], 3),
+            "dataframe_ms": round(dataframe_ms, 3),
+            "peak_memory_kib": round(peak / 1024, 1)
+        }
+
+    return results
+
+#  ============================ Benchmarks - Star schema transformation ============================ #
+
+KEY_BENCHMARK_ROWS = [10000, 100000, 1000000] # sizes of the synthetic facts tables
+KEY_BENCHMARK_LARGE_ROWS = [3000000] # larger sizes, only benchmarked on request: every row also goes through the SQLite key registry, which takes minutes at these sizes
+KEY_BENCHMARK_DIMENSION_SIZE = 200 # number of distinct values of the synthetic dimension
+
+def benchmark_key_assignment(row_counts: list = KEY_BENCHMARK_ROWS, dimension_size: int = KEY_BENCHMARK_DIMENSION_SIZE,
+                             repeat: int = 3) -> list:
+
+    """
+    This function times the assignment of ids for synthetic facts tables of growing size, to check
+    that it scales linearly with the number of rows (the time per row should stay about the same for
+    every size). Two costs are timed: building the dimension table, with the dimension id of each
+    row, and getting the ids from the key registry, as build_star_schema does (the ids of the
+    dimension values and of the characters, one per row). The registry is a SQLite file of its own
+    for each size; its first pass registers every key and the next ones read them back.
+
+    Parameters:
+    row_counts (list): number of rows of each facts table
+    dimension_size (int): number of distinct values of the dimension
+    repeat (int): number of times the ids of each table are assigned; the fastest time is kept
+
+    Returned value:
+    list: rows, time (ms) and time per row (ns) of each size, without and with the key registry
+    """
+
+    dimension_values = [f"Region {i}" for i in range(dimension_size)]
+    results = []
+
+    with tempfile.TemporaryDirectory() as registry_dir:
+        for rows in row_counts:
+            values = pd.Series(dimension_values).sample(rows, replace = True, random_state = 0).reset_index(drop = True)
+            names = pd.Series([f"Character {i}" for i in range(rows)])
+            timings = []
+            registry_timings = []
+
+            for _ in range(repeat):
+                start = time.perf_counter()
+                build_dimension(values, "region")
+                timings.append(time.perf_counter() - start)
+
+            registry = KeyRegistry(os.path.join(registry_dir, f"key_registry_{rows}.sqlite"))
+
+            try:
+                for _ in range(repeat + 1):
+                    start = time.perf_counter()
+                    dimension_df, ids = build_dimension(values, "region")
+                    register_dimension_ids("benchmark", "region", dimension_df, registry)[ids.to_numpy()]
+                    register_character_ids("benchmark", names, registry)
+                    registry_timings.append(time.perf_counter() - start)
+            finally:
+                registry.close()
+
+            results.append({
+                "rows": rows,
+                "time_ms": round(min(timings) * 1000, 3),
+                "ns_per_row": round(min(timings) * 1e9 / rows, 1),
+                "new_keys_ms": round(registry_timings[0] * 1000, 3),
+                "registered_keys_ms": round(min(registry_timings[1:]) * 1000, 3),
+                "registered_keys_ns_per_row": round(min(registry_timings[1:]) * 1e9 / rows, 1)
+            })
+
+    return results
+
+MEMORY_BENCHMARK_ROWS = 100000 # characters of the synthetic extraction output
+
+def _measure_allocation(build) -> int:
+
+    """
+    This function measures the memory allocated by a function for the objects it returns.
+
+    Parameters:
+    build (function): function building the objects
+
+    Returned value:
+    int: bytes still allocated once the function returned
+    """
+
+    tracemalloc.start()
+    objects = build()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+
+    return allocated
+
+def benchmark_record_memory(rows: int = MEMORY_BENCHMARK_ROWS, dimension_size: int = KEY_BENCHMARK_DIMENSION_SIZE) -> dict:
+
+    """
+    This function measures the memory taken per character by the extraction output, held as
+    dictionaries or as CharacterRecord objects, and by the character table, with its dimension and
+    release date columns held as strings or as categoricals. The field values are shared by
+    both layouts, so only the containers are measured.
+
+    Parameters:
+    rows (int): number of synthetic characters
+    dimension_size (int): number of distinct values of each dimension
+
+    Returned value:
+    dict: bytes per character of each layout
+    """
+
+    values = [{"name": f"Character {i}", "gender": ["Female", "Male"][i % 2], "region": f"Region {i % dimension_size}",
+               "release_date": f"Day {i % dimension_size}"} for i in range(rows)]
+
+    dict_bytes = _measure_allocation(lambda: [dict(char) for char in values])
+    record_bytes = _measure_allocation(lambda: [CharacterRecord(**char) for char in values])
+
+    char_df = pd.DataFrame(values)
+    object_bytes = int(char_df.memory_usage(deep = True).sum())
+    categorical_bytes = int(char_df.astype({column: "category" for column in ["gender", "region", "release_date"]}).memory_usage(deep = True).sum())
+
+    return {
+        "rows": rows,
+        "dict_bytes_per_character": round(dict_bytes / rows, 1),
+        "record_bytes_per_character": round(record_bytes / rows, 1),
+        "object_table_bytes_per_character": round(object_bytes / rows, 1),
+        "categorical_table_bytes_per_character": round(categorical_bytes / rows, 1)
+    }
+
+#  ===================================== Benchmarks - Results ====================================== #
+
+BENCHMARK_RESULTS_DIR = "temp/benchmarks"
+
+def get_commit_id() -> str:
+
+    """
+    This function gets the id of the current git commit, so results can be compared between commits.
+
+    Parameters:
+    None
+
+    Returned value:
+    str: short commit id, or "unknown" outside a git repository
+    """
+
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output = True, text = True, check = True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def save_benchmark_results(results: dict, results_dir: str = BENCHMARK_RESULTS_DIR) -> str:
+
+    """
+    This function saves benchmark results as a JSON file named after the commit and time of the run.
+
+    Parameters:
+    results (dict): benchmark results
+    results_dir (str): directory of the result files
+
+    Returned value:
+    str: path of the saved file
+    """
+
+    os.makedirs(results_dir, exist_ok = True)
+    path = os.path.join(results_dir, f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{results['commit']}.json")
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent = 2)
+
+    return path
+
+def compare_benchmark_results(baseline_path: str, current_path: str) -> None:
+
+    """
+    This function logs how the throughput and memory of each game changed between two saved runs.
+
+    Parameters:
+    baseline_path (str): result file of the baseline run
+    current_path (str): result file of the current run
+
+    Returned value:
+    None
+    """
+
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = json.load(f)["games"]
+    with open(current_path, "r", encoding="utf-8") as f:
+        current = json.load(f)["games"]
+
+    for game in current:
+        if game not in baseline:
+            continue
+        speedup = current[game]["pages_per_second"] / baseline[game]["pages_per_second"]
+        memory = current[game]["peak_memory_kib"] / baseline[game]["peak_memory_kib"]
+        logging.info(f"{game}: {speedup:.2f}x pages per second, {memory:.2f}x peak memory, "
+                     f"p99 parse time {baseline[game]['p99_parse_ms']:.2f} -> {current[game]['p99_parse_ms']:.2f} ms")
+
+def log_benchmark_summary(results: dict) -> None:
+
+    """
+    This function logs the results of each game, the median parse time of each backend and the
+    time taken to assign dimension ids, with and without the key registry.
+
+    Parameters:
+    results (dict): benchmark results
+
+    Returned value:
+    None
+    """
+
+    for game, game_results in results["games"].items():
+        logging.info(f"{game}: {game_results['pages']} pages, {game_results['pages_per_second']:.1f} pages per second, "
+                     f"p50 {game_results['p50_parse_ms']:.2f} ms, p99 {game_results['p99_parse_ms']:.2f} ms, "
+                     f"DataFrame {game_results['dataframe_ms']:.2f} ms, peak memory {game_results['peak_memory_kib']:.0f} KiB")
+
+    backends = list(dict.fromkeys(result["backend"] for result in results["backends"]))
+
+    for backend in backends:
+        backend_results = [result for result in results["backends"] if result["backend"] == backend]
+        logging.info(f"{backend}: median parse time {statistics.median(result['median_ms'] for result in backend_results):.2f} ms, "
+                     f"max peak memory {max(result['peak_memory_kib'] for result in backend_results):.0f} KiB")
+
+    for result in results.get("key_assignment", []):
+        logging.info(f"Dimension id assignment: {result['rows']} rows in {result['time_ms']:.1f} ms ({result['ns_per_row']:.1f} ns per row); "
+                     f"with the key registry {result['new_keys_ms']:.1f} ms for new keys, {result['registered_keys_ms']:.1f} ms for "
+                     f"registered keys ({result['registered_keys_ns_per_row']:.1f} ns per row)")
+
+    memory = results.get("record_memory")
+    if memory:
+        logging.info(f"Memory per character: {memory['dict_bytes_per_character']:.0f} B as dict, {memory['record_bytes_per_character']:.0f} B "
+                     f"as CharacterRecord; {memory['object_table_bytes_per_character']:.0f} B in a string table, "
+                     f"{memory['categorical_table_bytes_per_character']:.0f} B in a categorical table")
+
+def run_benchmarks(run_id: str = "latest", synthetic: bool = True, large_key_tables: bool = False) -> dict:
+
+    """
+    This function benchmarks the extraction logic over the pages of an archived run and the
+    synthetic pages, then saves and logs the results. If the run isn't archived, only the
+    synthetic pages are benchmarked.
+
+    Parameters:
+    run_id (str): id of the archived run used as corpus, or "latest" for the most recent one
+    synthetic (bool): if True, the synthetic pages are added to the corpus
+    large_key_tables (bool): if True, the ids are also assigned for the sizes of KEY_BENCHMARK_LARGE_ROWS
+
+    Returned value:
+    dict: benchmark results
+    """
+
+    # 1. Loading the corpus; without an archived run (e.g. on a fresh checkout), only the synthetic pages are used
+    try:
+        samples = load_archived_pages(run_id)
+    except FileNotFoundError as error:
+        if not synthetic:
+            raise
+        logging.warning(f"Archived run {run_id} not available, benchmarking the synthetic pages only: {error}")
+        samples = []
+        run_id = None
+
+    if synthetic:
+        samples += build_synthetic_pages()
+
+    results = {
+        "commit": get_commit_id(),
+        "created_at": datetime.now().isoformat(timespec = "seconds"),
+        "corpus": run_id,
+        "backend": html_parser.get_parser_backend(),
+        "games": benchmark_games(samples),
+        "backends": benchmark_parser_backends(samples),
+        "key_assignment": benchmark_key_assignment(KEY_BENCHMARK_ROWS + (KEY_BENCHMARK_LARGE_ROWS if large_key_tables else [])),
+        "record_memory": benchmark_record_memory()
+    }
+
+    log_benchmark_summary(results)
+    logging.info(f"Benchmark results saved to {save_benchmark_results(results)}.")
+
+    return results
+
+if __name__ == "__main__":
+
+    logging.basicConfig(level=logging.INFO)
+
+    run_benchmarks()
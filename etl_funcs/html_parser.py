@@ -0,0 +1,293 @@
+from bs4 import BeautifulSoup, SoupStrainer
+
+#  ================================ HTML parsing - Parser backends ================================= #
+
+# Optional backends: lxml is a C parser used through BeautifulSoup; selectolax (Lexbor engine) is a
+# standalone C parser, much faster, used to cut the needed subtrees out of the page before they are
+# handed to BeautifulSoup
+try:
+    import lxml
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+    SELECTOLAX_AVAILABLE = True
+except ImportError:
+    SELECTOLAX_AVAILABLE = False
+
+HTML_PARSER_BACKEND = None # "selectolax", "lxml" or "html.parser"; None picks the fastest backend installed
+PARTIAL_PARSING = True # only build the target subtrees of a page; when False, the whole page is parsed (the reference output of the benchmarks)
+TABLE_PART_TAGS = ["tbody", "thead", "tfoot", "tr"] # fragments which are dropped by lxml unless wrapped in a table
+
+def get_available_backends() -> list:
+
+    """
+    This function lists the HTML parser backends which can be used, fastest first.
+
+    Parameters:
+    None
+
+    Returned value:
+    list: names of the available backends
+    """
+
+    backends = []
+
+    if SELECTOLAX_AVAILABLE:
+        backends.append("selectolax")
+    if LXML_AVAILABLE:
+        backends.append("lxml")
+    backends.append("html.parser")
+
+    return backends
+
+def get_parser_backend() -> str:
+
+    """
+    This function gets the HTML parser backend to be used: the configured one, or the fastest one
+    installed if none is configured.
+
+    Parameters:
+    None
+
+    Returned value:
+    str: name of the backend
+    """
+
+    if HTML_PARSER_BACKEND is None:
+        return get_available_backends()[0]
+
+    if HTML_PARSER_BACKEND not in get_available_backends():
+        raise ValueError(f"HTML parser backend not available: {HTML_PARSER_BACKEND}")
+
+    return HTML_PARSER_BACKEND
+
+#  ================================ HTML parsing - Partial parsing ================================= #
+
+def _to_css_selector(targets: list) -> str:
+
+    """
+    This function converts a list of targets into a CSS selector (e.g. "h1, aside.portable-infobox").
+
+    Parameters:
+    targets (list): (tag, class) tuples; the class can be None
+
+    Returned value:
+    str: CSS selector
+    """
+
+    return ", ".join(tag if class_name is None else f"{tag}.{class_name}" for tag, class_name in targets)
+
+def _to_soup_strainer(targets: list) -> SoupStrainer:
+
+    """
+    This function converts a list of targets into a SoupStrainer. Tags are only strained by name:
+    while the page is being parsed, the class attribute is still a single string, so a class filter
+    never matches elements with several classes (e.g. <aside class="portable-infobox pi-background">).
+    The parsing functions pick the target elements by class in the kept tree.
+
+    Parameters:
+    targets (list): (tag, class) tuples; the class can be None
+
+    Returned value:
+    SoupStrainer: strainer keeping the target tags and their content
+    """
+
+    return SoupStrainer(list(dict.fromkeys(tag for tag, _ in targets)))
+
+def _extract_fragments(page_text: str, targets: list) -> str:
+
+    """
+    This function cuts the target subtrees out of a page with selectolax. Targets nested inside
+    another target are skipped, since they are already part of its HTML.
+
+    Parameters:
+    page_text (str): HTML content of the page
+    targets (list): (tag, class) tuples; the class can be None
+
+    Returned value:
+    str: HTML of the target subtrees, in document order
+    """
+
+    selector = _to_css_selector(targets)
+    tags = [tag for tag, _ in targets]
+    fragments = []
+
+    for node in LexborHTMLParser(page_text).css(selector):
+        parent = node.parent
+        while parent is not None and not (parent.tag in tags and parent.css_matches(selector)):
+            parent = parent.parent
+        if parent is not None:
+            continue
+
+        # lxml drops table parts which aren't inside a table
+        fragments.append(f"<table>{node.html}</table>" if node.tag in TABLE_PART_TAGS else node.html)
+
+    return "".join(fragments)
+
+def parse_html(page_text: str, targets: list = None, backend: str = None) -> BeautifulSoup:
+
+    """
+    This function parses a page with the selected backend. When targets are given, only the target
+    tags and their content are built into the returned tree, which is what the parsing functions
+    read anyway (e.g. the infobox or the tables of a page). With lxml and html.parser, every tag
+    with a target name is kept, whatever its class, so the parsing functions must still pick the
+    target elements by class. The result is always a BeautifulSoup
+    tree, so the parsing functions don't depend on the backend.
+
+    Parameters:
+    page_text (str): HTML content of the page
+    targets (list): (tag, class) tuples of the subtrees to be kept, e.g. [("aside", "portable-infobox")]; the whole page is parsed if None
+    backend (str): "selectolax", "lxml" or "html.parser"; the configured backend is used if None
+
+    Returned value:
+    BeautifulSoup: parsed page (or target subtrees)
+    """
+
+    backend = backend or get_parser_backend()
+    tree_builder = "lxml" if LXML_AVAILABLE else "html.parser"
+
+    if not PARTIAL_PARSING:
+        targets = None
+
+    if backend == "selectolax":
+        if targets is None:
+            return BeautifulSoup(page_text, tree_builder)
+        return BeautifulSoup(_extract_fragments(page_text, targets), tree_builder)
+
+    if targets is None:
+        return BeautifulSoup(page_text, backend)
+
+    return BeautifulSoup(page_text, backend, parse_only = _to_soup_strainer(targets))
+
+#  ===================================== HTML parsing - Tables ===================================== #
+
+def _read_cells(table, backend: str) -> list:
+
+    """
+    This function lists the cells of each body row of a table, visiting each row and each cell once.
+    The body rows are those of the tbody elements of the table, or its direct rows when it has no
+    tbody (html.parser and lxml don't add one, unlike selectolax), so the rows read don't depend on
+    the backend. Rows of tables nested in its cells aren't read.
+
+    Parameters:
+    table: table element, as a BeautifulSoup tag or a selectolax node
+    backend (str): backend the table was parsed with
+
+    Returned value:
+    list: (text, rowspan) tuples of the cells of each row
+    """
+
+    if backend == "selectolax":
+        parts = [part for part in table.iter() if part.tag == "tbody"] or [table]
+        return [[(cell.text(deep = True), cell.attributes.get("rowspan")) for cell in row.iter() if cell.tag == "td"]
+                for part in parts for row in part.iter() if row.tag == "tr"]
+
+    parts = table.find_all("tbody", recursive = False) or [table]
+
+    return [[(cell.get_text(), cell.get("rowspan")) for cell in row.find_all("td", recursive = False)]
+            for part in parts for row in part.find_all("tr", recursive = False)]
+
+def read_table_rows(page_text: str, table_index: int, skip_rows: int = 1, expand_rowspans: bool = False, backend: str = None) -> list:
+
+    """
+    This function reads the cell texts of a table of a page in a single pass: each row is visited
+    once and its cells are listed once, instead of being searched again for every column. With the
+    selectolax backend, the cells are read straight from its tree, without building a BeautifulSoup
+    tree. Rows can have different numbers of cells (ragged rows are kept as they are). When rowspans
+    are expanded, a cell spanning several rows is repeated in each of them, at the same position.
+
+    Parameters:
+    page_text (str): HTML content of the page
+    table_index (int): position of the table among the table elements of the page (nested tables included, in document order)
+    skip_rows (int): number of header rows to be skipped
+    expand_rowspans (bool): if True, cells with a rowspan are repeated in the rows they span
+    backend (str): "selectolax", "lxml" or "html.parser"; the configured backend is used if None
+
+    Returned value:
+    list: cell texts of each row
+    """
+
+    backend = backend or get_parser_backend()
+
+    if backend == "selectolax":
+        table = LexborHTMLParser(page_text).css("table")[table_index]
+    else:
+        table = parse_html(page_text, [("table", None)], backend).find_all("table")[table_index]
+
+    rows = []
+    pending = {} # position of each spanning cell: (text, number of rows still spanned)
+
+    for cells in _read_cells(table, backend)[skip_rows:]:
+        row = []
+        next_pending = {}
+        cell_index = 0
+
+        while cell_index < len(cells) or len(row) in pending:
+            position = len(row)
+
+            if position in pending: # cell spanning from a row above
+                text, remaining = pending.pop(position)
+            else:
+                text, rowspan = cells[cell_index]
+                cell_index += 1
+                try:
+                    remaining = int(rowspan or 1) if expand_rowspans else 1
+                except ValueError:
+                    remaining = 1
+
+            row.append(text)
+            if remaining > 1:
+                next_pending[position] = (text, remaining - 1)
+
+        # spanning cells past the end of a short row still span it
+        for position, (text, remaining) in pending.items():
+            if remaining > 1:
+                next_pending[position] = (text, remaining - 1)
+
+        pending = next_pending
+        rows.append(row)
+
+    return rows
+
+def read_table_columns(page_text: str, table_index: int, columns: dict, skip_rows: int = 1, expand_rowspans: bool = False) -> dict:
+
+    """
+    This function reads the given columns of a table of a page as arrays, so each column is
+    cleaned with a single comprehension instead of once per row. Each column is given by its position in the row (negative positions count
+    from the end of the row, which keeps ragged rows aligned on their last cells) or by a function
+    which picks the cell from the row.
+
+    Parameters:
+    page_text (str): HTML content of the page
+    table_index (int): position of the table among the table elements of the page (nested tables included, in document order)
+    columns (dict): position (int) or picking function of each column, by column name
+    skip_rows (int): number of header rows to be skipped
+    expand_rowspans (bool): if True, cells with a rowspan are repeated in the rows they span
+
+    Returned value:
+    dict: list of cell texts of each column
+    """
+
+    rows = read_table_rows(page_text, table_index, skip_rows, expand_rowspans)
+
+    return {name: [column(row) if callable(column) else row[column] for row in rows] for name, column in columns.items()}
+
+def columns_to_records(columns: dict) -> list:
+
+    """
+    This function converts column arrays into a list of records. The list parsers hand records on,
+    not columns, since every extractor yields one record per character: the records are journaled
+    with their page, completed with the fields of each character page (Honkai: Star Rail) and
+    streamed to the stage store or the loader along with those of the other games.
+
+    Parameters:
+    columns (dict): list of values of each column, by column name
+
+    Returned value:
+    list: list of dictionaries, one per row
+    """
+
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
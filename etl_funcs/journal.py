@@ -0,0 +1,92 @@
+import json
+import logging
+import os
+import threading
+
+#  =============================== Extraction journal - Checkpoints ================================ #
+
+JOURNAL_DIR = "temp/journals"
+
+class ExtractionJournal:
+
+    """
+    This class is a durable, append-only journal of the records collected by an extractor. Every
+    record is written to a JSONL file (one JSON object per line) and flushed to disk as soon as it
+    is parsed, so the work done before a failure is never lost. When the extractor runs again (e.g.
+    on an Airflow retry), the completed records are read back and their pages are not requested
+    again. The journal is cleared once the extractor has saved its output.
+    """
+
+    def __init__(self, name: str, journal_dir: str = JOURNAL_DIR) -> None:
+
+        self.path = os.path.join(journal_dir, f"{name}.jsonl")
+        self._lock = threading.Lock()
+        os.makedirs(journal_dir, exist_ok=True)
+
+    def completed(self) -> dict:
+
+        """
+        This method reads the records already collected by a previous run. A last line which was
+        only partially written (the process was killed while writing it) is ignored.
+
+        Parameters:
+        None
+
+        Returned value:
+        dict: collected records, by key
+        """
+
+        records = {}
+
+        if not os.path.exists(self.path):
+            return records
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                records[entry["key"]] = entry["record"]
+
+        if records:
+            logging.info(f"Resuming extraction: {len(records)} records already collected in {self.path}.")
+
+        return records
+
+    def append(self, key: str, record) -> None:
+
+        """
+        This method appends a record to the journal and flushes it to disk.
+
+        Parameters:
+        key (str): key of the record (e.g. the URL of the page it was parsed from)
+        record: collected record (any JSON-serialisable value)
+
+        Returned value:
+        None
+        """
+
+        line = json.dumps({"key": key, "record": record}, ensure_ascii=False)
+
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def clear(self) -> None:
+
+        """
+        This method removes the journal, once the records have been saved as the extractor's output.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,169 @@
+import logging
+import os
+import sqlite3
+import threading
+
+#  ================================= Key registry - Surrogate keys ================================= #
+
+KEY_REGISTRY_PATH = "temp/key_registry.sqlite"
+KEY_LOOKUP_BATCH_SIZE = 500 # values looked up per query (SQLite limits the number of query parameters)
+CHARACTER_KEY = "character" # key kind of the characters (identified by name) next to the dimensions of a schema
+
+class KeyRegistryError(Exception):
+
+    """
+    This exception is raised when the ids given by the key registry clash with the rows already
+    loaded into the database, e.g. when the registry file was lost after a load.
+    """
+
+class KeyRegistry:
+
+    """
+    This class keeps the surrogate keys of the star schemas (dimension ids and character ids)
+    stable across runs. Each value of a dimension (and each character, by name) gets an id the first
+    time it's seen, the next one after the largest id of its dimension, and keeps it in every later
+    run, so adding a region or a character never renumbers the other rows and the loads can be
+    upserts instead of full reloads. The keys are stored in a SQLite file, shared by every process
+    of the ETL running on the host (e.g. the Airflow tasks). The database stays the reference: when
+    the registry has no keys for a schema (the file was lost, or the ETL runs on another host), it
+    is seeded from the tables already loaded, and the load refuses rows whose id is already taken by
+    another value (see loader.py).
+    """
+
+    def __init__(self, path: str = KEY_REGISTRY_PATH) -> None:
+
+        self.path = path
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._conn = sqlite3.connect(path, timeout = 30, check_same_thread = False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS surrogate_keys (
+                schema TEXT NOT NULL,
+                dimension TEXT NOT NULL,
+                value TEXT NOT NULL,
+                id INTEGER NOT NULL,
+                PRIMARY KEY (schema, dimension, value)
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS surrogate_keys_ids ON surrogate_keys (schema, dimension, id)")
+        self._conn.commit()
+
+    def get_ids(self, schema: str, dimension: str, values: list) -> dict:
+
+        """
+        This method returns the id of each value of a dimension, giving new ids to the values not
+        registered yet, in the order they are given.
+
+        Parameters:
+        schema (str): name of the game schema
+        dimension (str): name of the dimension (CHARACTER_KEY for the characters)
+        values (list): values of the dimension (duplicates and missing values are ignored)
+
+        Returned value:
+        dict: id of each value
+        """
+
+        values = [value for value in dict.fromkeys(values) if isinstance(value, str)]
+
+        ids = {}
+
+        with self._lock:
+            # 1. Reading the ids of the registered values (only the given ones, so memory use doesn't depend on
+            # the size of the registry); new ids are given in the same transaction, so processes sharing the
+            # file never give the same id twice
+            with self._conn:
+                self._conn.execute("BEGIN IMMEDIATE")
+                for start in range(0, len(values), KEY_LOOKUP_BATCH_SIZE):
+                    batch = values[start:start + KEY_LOOKUP_BATCH_SIZE]
+                    query = f"SELECT value, id FROM surrogate_keys WHERE schema = ? AND dimension = ? AND value IN ({', '.join(['?'] * len(batch))})"
+                    ids.update(self._conn.execute(query, (schema, dimension, *batch)).fetchall())
+
+                # 2. Registering the new values after the largest id of the dimension
+                new_values = [value for value in values if value not in ids]
+                next_id = self._conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM surrogate_keys WHERE schema = ? AND dimension = ?",
+                                             (schema, dimension)).fetchone()[0]
+                new_rows = [(schema, dimension, value, next_id + i) for i, value in enumerate(new_values)]
+                self._conn.executemany("INSERT INTO surrogate_keys (schema, dimension, value, id) VALUES (?, ?, ?, ?)", new_rows)
+
+        if new_rows:
+            logging.debug(f"Registered {len(new_rows)} new keys for {schema}.{dimension}.")
+
+        ids.update((value, id) for _, _, value, id in new_rows)
+
+        return {value: ids[value] for value in values}
+
+    def has_keys(self, schema: str) -> bool:
+
+        """
+        This method checks whether any key of a schema is registered.
+
+        Parameters:
+        schema (str): name of the game schema
+
+        Returned value:
+        bool: True if the schema has registered keys
+        """
+
+        with self._lock:
+            return self._conn.execute("SELECT 1 FROM surrogate_keys WHERE schema = ? LIMIT 1", (schema,)).fetchone() is not None
+
+    def seed(self, schema: str, dimension: str, keys: dict) -> None:
+
+        """
+        This method registers values with the ids they already have, e.g. in the database. Values
+        which are already registered keep their ids.
+
+        Parameters:
+        schema (str): name of the game schema
+        dimension (str): name of the dimension (CHARACTER_KEY for the characters)
+        keys (dict): id of each value
+
+        Returned value:
+        None
+        """
+
+        with self._lock, self._conn:
+            self._conn.executemany("INSERT OR IGNORE INTO surrogate_keys (schema, dimension, value, id) VALUES (?, ?, ?, ?)",
+                                   [(schema, dimension, value, id) for value, id in keys.items()])
+
+        logging.info(f"Key registry seeded with {len(keys)} keys for {schema}.{dimension}.")
+
+    def close(self) -> None:
+
+        """
+        This method closes the registry file.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        self._conn.close()
+
+_key_registry = None
+_key_registry_lock = threading.Lock()
+
+def get_key_registry() -> KeyRegistry:
+
+    """
+    This function returns the key registry of the process, opening it on the first call.
+
+    Parameters:
+    None
+
+    Returned value:
+    KeyRegistry: shared key registry
+    """
+
+    global _key_registry
+
+    with _key_registry_lock:
+        if _key_registry is None:
+            _key_registry = KeyRegistry()
+
+        return _key_registry
@@ -1,386 +1,382 @@
-import psycopg2
-import pandas as pd
-import os
-import logging
-from dotenv import load_dotenv
-
-load_dotenv()
-
-#  ======================================= Loading functions ======================================= #
-
-def load_wuwa_tables_to_db() -> None:
-
-    """
-    This function loads the CSV files to their respective tables in the PostgreSQL schema then deletes
-    the CSV files.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    # Connector settings
-    config = {
-        'host': 'localhost',
-        'database': 'kuro_games_characters',
-        'user': 'postgres',
-        'password': os.getenv("POSTGRES_MASTER_PASSW"),
-        'port': '5432'
-    }
-
-    # Loading operation
-    try:
-
-        logging.info("Accessing database: kuro_games_characters...")
-
-        conn = psycopg2.connect(**config)
-        cursor = conn.cursor()
-
-        logging.info("Creating tables for schema: wuthering_waves...")
-        
-        # Creating tables
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS wuthering_waves.gender_dim (
-                       gender_id INT PRIMARY KEY,
-                       gender TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS wuthering_waves.region_dim (
-                       region_id INT PRIMARY KEY,
-                       region TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS wuthering_waves.character_info (
-                       character_id INT NOT NULL,
-                       name TEXT NOT NULL,
-                       gender_id INT NOT NULL,
-                       region_id INT NOT NULL,
-                       release_date DATE NOT NULL,
-                       PRIMARY KEY(character_id),
-                       CONSTRAINT fk_gender FOREIGN KEY(gender_id) REFERENCES wuthering_waves.gender_dim(gender_id),
-                       CONSTRAINT fk_region FOREIGN KEY(region_id) REFERENCES wuthering_waves.region_dim(region_id)
-                    )
-        """)
-
-        logging.info("Uploading Wuthering Waves character data to schema: wuthering_waves...")
-
-        # Inserting data into created tables
-        df = pd.read_csv("temp/wuwa_gender_df.csv")
-        query = f"INSERT INTO wuthering_waves.gender_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        print(query)
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/wuwa_gender_df.csv")
-
-        df = pd.read_csv("temp/wuwa_region_df.csv")
-        query = f"INSERT INTO wuthering_waves.region_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/wuwa_region_df.csv")
-
-        df = pd.read_csv("temp/wuwa_facts_table.csv")
-        query = f"INSERT INTO wuthering_waves.character_info ({', '.join(df.columns[1:])}) VALUES (%s, %s, %s, %s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/wuwa_facts_table.csv")
-
-        logging.info("Finished uploading data to schema.")
-        
-    except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def load_hoyo_tables_to_db() -> None:
-
-    """
-    This function loads the CSV files to their respective tables in the PostgreSQL schema then deletes
-    the CSV files.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    # Connector settings
-    config = {
-        'host': 'localhost',
-        'database': 'hoyo_characters',
-        'user': 'postgres',
-        'password': os.getenv("POSTGRES_MASTER_PASSW"),
-        'port': '5432'
-    }
-
-    # Loading operation
-    try:
-
-        logging.info("Accessing database: hoyo_characters...")
-
-        conn = psycopg2.connect(**config)
-        cursor = conn.cursor()
-
-        ### ------------------- I. Genshin Impact characters ------------------- ###
-        
-        logging.info("Creating tables for schema: genshin_impact...")
-
-        # Creating tables
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS genshin_impact.gender_dim (
-                       gender_id INT PRIMARY KEY,
-                       gender TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS genshin_impact.region_dim (
-                       region_id INT PRIMARY KEY,
-                       region TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS genshin_impact.character_info (
-                       character_id INT NOT NULL,
-                       name TEXT NOT NULL,
-                       gender_id INT NOT NULL,
-                       region_id INT NOT NULL,
-                       release_date DATE NOT NULL,
-                       PRIMARY KEY(character_id),
-                       CONSTRAINT fk_gender FOREIGN KEY(gender_id) REFERENCES genshin_impact.gender_dim(gender_id),
-                       CONSTRAINT fk_region FOREIGN KEY(region_id) REFERENCES genshin_impact.region_dim(region_id)
-                    )
-        """)
-
-        logging.info("Uploading Genshin Impact character data to schema: genshin_impact...")
-
-        # Inserting data into created tables
-        df = pd.read_csv("temp/genshin_gender_df.csv")
-        query = f"INSERT INTO genshin_impact.gender_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        print(query)
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/genshin_gender_df.csv")
-
-        df = pd.read_csv("temp/genshin_region_df.csv")
-        query = f"INSERT INTO genshin_impact.region_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/genshin_region_df.csv")
-
-        df = pd.read_csv("temp/genshin_facts_table.csv")
-        query = f"INSERT INTO genshin_impact.character_info ({', '.join(df.columns[1:])}) VALUES (%s, %s, %s, %s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/genshin_facts_table.csv")
-
-        logging.info("Finished uploading data to schema.")
-
-        ### ----------------- II. Honkai: Star Rail characters ----------------- ###
-
-        logging.info("Creating tables for schema: honkai_star_rail...")
-        
-        # Creating tables
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS honkai_star_rail.gender_dim (
-                       gender_id INT PRIMARY KEY,
-                       gender TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS honkai_star_rail.faction_dim (
-                       faction_id INT PRIMARY KEY,
-                       faction TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS honkai_star_rail.character_info (
-                       character_id INT NOT NULL,
-                       name TEXT NOT NULL,
-                       gender_id INT NOT NULL,
-                       faction_id INT NOT NULL,
-                       release_date DATE NOT NULL,
-                       PRIMARY KEY(character_id),
-                       CONSTRAINT fk_gender FOREIGN KEY(gender_id) REFERENCES honkai_star_rail.gender_dim(gender_id),
-                       CONSTRAINT fk_faction FOREIGN KEY(faction_id) REFERENCES honkai_star_rail.faction_dim(faction_id)
-                    )
-        """)
-
-        logging.info("Uploading Honkai: Star Rail character data to schema: honkai_star_rail...")
-
-        # Inserting data into created tables
-        df = pd.read_csv("temp/hsr_gender_df.csv")
-        query = f"INSERT INTO honkai_star_rail.gender_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        print(query)
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/hsr_gender_df.csv")
-
-        df = pd.read_csv("temp/hsr_faction_df.csv")
-        query = f"INSERT INTO honkai_star_rail.faction_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/hsr_faction_df.csv")
-
-        df = pd.read_csv("temp/hsr_facts_table.csv")
-        query = f"INSERT INTO honkai_star_rail.character_info ({', '.join(df.columns[1:])}) VALUES (%s, %s, %s, %s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/hsr_facts_table.csv")
-
-        logging.info("Finished uploading data to schema.")
-
-        ### ---------------- III. Zenless Zone Zero characters ----------------- ###
-
-        logging.info("Creating tables for schema: zenless_zone_zero...")
-        
-        # Creating tables
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS zenless_zone_zero.gender_dim (
-                       gender_id INT PRIMARY KEY,
-                       gender TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS zenless_zone_zero.faction_dim (
-                       faction_id INT PRIMARY KEY,
-                       faction TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS zenless_zone_zero.character_info (
-                       character_id INT NOT NULL,
-                       name TEXT NOT NULL,
-                       gender_id INT NOT NULL,
-                       faction_id INT NOT NULL,
-                       release_date DATE NOT NULL,
-                       PRIMARY KEY(character_id),
-                       CONSTRAINT fk_gender FOREIGN KEY(gender_id) REFERENCES zenless_zone_zero.gender_dim(gender_id),
-                       CONSTRAINT fk_faction FOREIGN KEY(faction_id) REFERENCES zenless_zone_zero.faction_dim(faction_id)
-                    )
-        """)
-
-        logging.info("Uploading Zenless Zone Zero character data to schema: zenless_zone_zero...")
-
-        # Inserting data into created tables
-        df = pd.read_csv("temp/zzz_gender_df.csv")
-        query = f"INSERT INTO zenless_zone_zero.gender_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        print(query)
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/zzz_gender_df.csv")
-
-        df = pd.read_csv("temp/zzz_faction_df.csv")
-        query = f"INSERT INTO zenless_zone_zero.faction_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/zzz_faction_df.csv")
-
-        df = pd.read_csv("temp/zzz_facts_table.csv")
-        query = f"INSERT INTO zenless_zone_zero.character_info ({', '.join(df.columns[1:])}) VALUES (%s, %s, %s, %s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/zzz_facts_table.csv")
-
-        logging.info("Finished uploading data to schema.")
-        
-    except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
-
-def load_ow_tables_to_db() -> None:
-
-    """
-    This function loads the CSV files to their respective tables in the PostgreSQL schema then deletes
-    the CSV files.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    # Connector settings
-    config = {
-        'host': 'localhost',
-        'database': 'blizzard_characters',
-        'user': 'postgres',
-        'password': os.getenv("POSTGRES_MASTER_PASSW"),
-        'port': '5432'
-    }
-
-    # Loading operation
-    try:
-
-        logging.info("Accessing database: blizzard_characters...")
-
-        conn = psycopg2.connect(**config)
-        cursor = conn.cursor()
-
-        logging.info("Creating tables for schema: overwatch_2...")
-        
-        # Creating tables
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS overwatch_2.gender_dim (
-                       gender_id INT PRIMARY KEY,
-                       gender TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS overwatch_2.region_dim (
-                       region_id INT PRIMARY KEY,
-                       region TEXT
-                    )
-        """)
-        cursor.execute(""" 
-            CREATE TABLE IF NOT EXISTS overwatch_2.character_info (
-                       character_id INT NOT NULL,
-                       name TEXT NOT NULL,
-                       gender_id INT NOT NULL,
-                       region_id INT NOT NULL,
-                       release_date DATE NOT NULL,
-                       PRIMARY KEY(character_id),
-                       CONSTRAINT fk_gender FOREIGN KEY(gender_id) REFERENCES overwatch_2.gender_dim(gender_id),
-                       CONSTRAINT fk_region FOREIGN KEY(region_id) REFERENCES overwatch_2.region_dim(region_id)
-                    )
-        """)
-
-        logging.info("Uploading Overwatch 2 character data to schema: overwatch_2...")
-
-        # Inserting data into created tables
-        df = pd.read_csv("temp/ow_gender_df.csv")
-        query = f"INSERT INTO overwatch_2.gender_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        print(query)
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/ow_gender_df.csv")
-
-        df = pd.read_csv("temp/ow_region_df.csv")
-        query = f"INSERT INTO overwatch_2.region_dim ({', '.join(df.columns[1:])}) VALUES (%s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/ow_region_df.csv")
-
-        df = pd.read_csv("temp/ow_facts_table.csv")
-        query = f"INSERT INTO overwatch_2.character_info ({', '.join(df.columns[1:])}) VALUES (%s, %s, %s, %s, %s)"
-        cursor.executemany(query, [tuple(x)[1:] for x in df.values])
-        conn.commit()
-        os.remove("temp/ow_facts_table.csv")
-
-        logging.info("Finished uploading data to schema.")
-        
-    except Exception as e:
-        print(f"Error: {e}")
-    finally:
-        if conn:
-            cursor.close()
-            conn.close()
+import psycopg2
+import os
+import logging
+from dotenv import load_dotenv
+from etl_funcs.stage_store import get_stage_store
+from etl_funcs.transform import STAR_SCHEMA_SPECS
+from etl_funcs.key_registry import KeyRegistryError, get_key_registry, CHARACTER_KEY
+
+load_dotenv()
+
+#  ======================================= Loading functions ======================================= #
+
+# Game schemas of each database
+GAME_DATABASES = {
+    "kuro_games_characters": ["wuthering_waves"],
+    "hoyo_characters": ["genshin_impact", "honkai_star_rail", "zenless_zone_zero"],
+    "blizzard_characters": ["overwatch_2"]
+}
+
+def create_star_schema_tables(cursor, schema: str, dimensions: list) -> None:
+
+    """
+    This function creates the dimension tables and the character_info facts table of a game schema,
+    if they don't exist yet.
+
+    Parameters:
+    cursor (psycopg2.extensions.cursor): cursor of the database of the game
+    schema (str): name of the game schema
+    dimensions (list): dimension columns of the game
+
+    Returned value:
+    None
+    """
+
+    for dimension in dimensions:
+        cursor.execute(f"""
+            CREATE TABLE IF NOT EXISTS {schema}.{dimension}_dim (
+                       {dimension}_id INT PRIMARY KEY,
+                       {dimension} TEXT
+                    )
+        """)
+
+    dimension_columns = "".join(f"{dimension}_id INT NOT NULL,\n" for dimension in dimensions)
+    constraints = ",\n".join(f"CONSTRAINT fk_{dimension} FOREIGN KEY({dimension}_id) REFERENCES {schema}.{dimension}_dim({dimension}_id)"
+                             for dimension in dimensions)
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {schema}.character_info (
+                   character_id INT NOT NULL,
+                   name TEXT NOT NULL,
+                   {dimension_columns}
+                   release_date DATE NOT NULL,
+                   PRIMARY KEY(character_id),
+                   {constraints}
+                )
+    """)
+
+def get_upsert_query(schema: str, table: str, columns: list) -> str:
+
+    """
+    This function builds the query upserting rows into a table whose key is its first column: new
+    rows are inserted and existing rows are only updated if one of their values changed, so a load
+    doesn't touch the unchanged rows.
+
+    Parameters:
+    schema (str): name of the game schema
+    table (str): name of the table
+    columns (list): columns of the rows, starting with the key
+
+    Returned value:
+    str: upsert query, with one placeholder per column
+    """
+
+    key, *values = columns
+
+    return f"""
+        INSERT INTO {schema}.{table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))})
+        ON CONFLICT ({key}) DO UPDATE SET {', '.join(f"{column} = EXCLUDED.{column}" for column in values)}
+        WHERE ({', '.join(f"{table}.{column}" for column in values)}) IS DISTINCT FROM ({', '.join(f"EXCLUDED.{column}" for column in values)})
+    """
+
+def check_loaded_keys(cursor, schema: str, table: str, columns: list, rows: list) -> None:
+
+    """
+    This function checks that the rows about to be upserted into a table don't take the id of a
+    row loaded with another value (another character, or another dimension value), which the
+    upsert would silently overwrite. It happens when the key registry is out of sync with the
+    database, e.g. when it was lost and the database couldn't be read to seed it again.
+
+    Parameters:
+    cursor (psycopg2.extensions.cursor): cursor of the database of the game
+    schema (str): name of the game schema
+    table (str): name of the table
+    columns (list): columns of the rows, starting with the id and the value it stands for (dimension value or character name)
+    rows (list): rows to be upserted
+
+    Returned value:
+    None
+    """
+
+    if not rows:
+        return
+
+    key, value = columns[:2]
+    new_values = {row[0]: row[1] for row in rows}
+
+    cursor.execute(f"SELECT {key}, {value} FROM {schema}.{table} WHERE {key} = ANY(%s)", (list(new_values),))
+    conflicts = [(id, loaded_value) for id, loaded_value in cursor.fetchall() if new_values[id] != loaded_value]
+
+    if conflicts:
+        id, loaded_value = conflicts[0]
+        raise KeyRegistryError(f"{len(conflicts)} rows of {schema}.{table} take ids already loaded with other values "
+                               f"(e.g. {key} {id} is '{loaded_value}' in the database, not '{new_values[id]}'). The key registry is "
+                               f"out of sync with the database: delete it, so that it is seeded from the loaded tables on the next run.")
+
+def read_loaded_keys(cursor, schema: str, dimensions: list) -> dict:
+
+    """
+    This function reads the ids of the dimension values and characters already loaded into a
+    schema. Tables which haven't been created yet have no keys.
+
+    Parameters:
+    cursor (psycopg2.extensions.cursor): cursor of the database of the game
+    schema (str): name of the game schema
+    dimensions (list): dimension columns of the game
+
+    Returned value:
+    dict: id of each loaded value, by dimension (CHARACTER_KEY for the characters)
+    """
+
+    tables = [(dimension, f"{dimension}_dim", f"{dimension}_id", dimension) for dimension in dimensions]
+    tables.append((CHARACTER_KEY, "character_info", "character_id", "name"))
+    keys = {}
+
+    for kind, table, key, value in tables:
+        cursor.execute("SELECT to_regclass(%s)", (f"{schema}.{table}",))
+        if cursor.fetchone()[0] is None:
+            keys[kind] = {}
+            continue
+        cursor.execute(f"SELECT {value}, {key} FROM {schema}.{table}")
+        keys[kind] = dict(cursor.fetchall())
+
+    return keys
+
+def seed_key_registry(cursor, schema: str, dimensions: list) -> None:
+
+    """
+    This function seeds the key registry with the ids already loaded into a schema, when it has no
+    keys for it (e.g. the registry file was lost, or the ETL runs on another host), so the ids
+    given afterwards follow the loaded ones instead of starting again from 1.
+
+    Parameters:
+    cursor (psycopg2.extensions.cursor): cursor of the database of the game
+    schema (str): name of the game schema
+    dimensions (list): dimension columns of the game
+
+    Returned value:
+    None
+    """
+
+    registry = get_key_registry()
+
+    if registry.has_keys(schema):
+        return
+
+    for kind, keys in read_loaded_keys(cursor, schema, dimensions).items():
+        if keys:
+            registry.seed(schema, kind, keys)
+
+def seed_key_registries() -> None:
+
+    """
+    This function seeds the key registry with the ids already loaded into each game schema which
+    has no keys in it. It is meant to run before the transformation step gives the ids. If a
+    database can't be read, its games are left as they are: the load step still refuses the rows
+    whose ids clash with the loaded ones.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    for database, games in GAME_DATABASES.items():
+        conn = None
+        try:
+            conn = psycopg2.connect(**get_db_config(database))
+            cursor = conn.cursor()
+            for game in games:
+                seed_key_registry(cursor, game, STAR_SCHEMA_SPECS[game]["dimensions"])
+            cursor.close()
+        except Exception as e:
+            logging.warning(f"Could not read the loaded keys from {database}, the key registry isn't seeded: {e}")
+        finally:
+            if conn:
+                conn.close()
+
+def load_game_tables(conn, game: str) -> None:
+
+    """
+    This function loads the star schema tables of a game, handed by the transformation step, to
+    their respective tables in the PostgreSQL schema, then deletes them. The ids of every table are
+    checked against the loaded rows before anything is written; the tables are then upserted in
+    chunks and committed together, so a refused or failed load leaves the database and the staged
+    tables as they were, and can be retried. Since the ids come from the key registry, the rows
+    already loaded by a previous run are updated only if they changed.
+
+    Parameters:
+    conn (psycopg2.extensions.connection): connection to the database of the game
+    game (str): name of the game schema, key of STAR_SCHEMA_SPECS
+
+    Returned value:
+    None
+    """
+
+    spec = STAR_SCHEMA_SPECS[game]
+    store = get_stage_store()
+    cursor = conn.cursor()
+
+    logging.info(f"Creating tables for schema: {game}...")
+
+    create_star_schema_tables(cursor, game, spec["dimensions"])
+
+    # dimension tables first, as the facts table references them; only the loaded columns are read
+    tables = [(f"{spec['prefix']}_{dimension}_df", f"{dimension}_dim", [f"{dimension}_id", dimension]) for dimension in spec["dimensions"]]
+    tables.append((f"{spec['prefix']}_facts_table", "character_info",
+                   ["character_id", "name", *(f"{dimension}_id" for dimension in spec["dimensions"]), "release_date"]))
+
+    # 1. Checking that no id is already loaded with another value, reading only the ids and their values
+    for name, table, columns in tables:
+        for chunk in store.iter_chunks(name, columns = columns[:2]):
+            check_loaded_keys(cursor, game, table, columns, list(chunk[columns[:2]].itertuples(index = False, name = None)))
+
+    logging.info(f"Uploading {spec['title']} character data to schema: {game}...")
+
+    # 2. Upserting the tables in chunks, so the facts tables of large exports aren't held in memory at once
+    for name, table, columns in tables:
+        query = get_upsert_query(game, table, columns)
+        for chunk in store.iter_chunks(name, columns = columns):
+            cursor.executemany(query, list(chunk[columns].itertuples(index = False, name = None)))
+
+    conn.commit()
+    cursor.close()
+
+    # 3. The staged tables are only deleted once they are loaded
+    for name, _, _ in tables:
+        store.delete(name)
+
+def load_games_to_db(database: str, games: list) -> None:
+
+    """
+    This function loads the star schema tables of the given games, which share a database.
+
+    Parameters:
+    database (str): name of the database
+    games (list): names of the game schemas
+
+    Returned value:
+    None
+    """
+
+    conn = None
+
+    # Loading operation
+    try:
+
+        logging.info(f"Accessing database: {database}...")
+
+        conn = psycopg2.connect(**get_db_config(database))
+
+        for game in games:
+            load_game_tables(conn, game)
+
+        logging.info("Finished uploading data to schema.")
+
+    except KeyRegistryError as e: # the ids clash with the loaded rows, so the load is refused and nothing is written
+        logging.error(f"Load of {database} refused: {e}")
+        raise
+    except Exception as e:
+        print(f"Error: {e}")
+    finally:
+        if conn:
+            conn.close()
+
+def load_wuwa_tables_to_db() -> None:
+
+    """
+    This function loads the tables of Wuthering Waves characters to their respective tables in the
+    PostgreSQL schema.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    load_games_to_db("kuro_games_characters", GAME_DATABASES["kuro_games_characters"])
+
+def load_hoyo_tables_to_db() -> None:
+
+    """
+    This function loads the tables of miHoYo/HoYoverse characters to their respective tables in the
+    PostgreSQL schemas.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    load_games_to_db("hoyo_characters", GAME_DATABASES["hoyo_characters"])
+
+def load_ow_tables_to_db() -> None:
+
+    """
+    This function loads the tables of Overwatch 2 characters to their respective tables in the
+    PostgreSQL schema.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    load_games_to_db("blizzard_characters", GAME_DATABASES["blizzard_characters"])
+
+def get_db_config(database: str) -> dict:
+
+    """
+    This function returns the connector settings of a database of the PostgreSQL server. The host
+    is read from the POSTGRES_HOST environment variable (localhost by default).
+
+    Parameters:
+    database (str): name of the database
+
+    Returned value:
+    dict: psycopg2 connection arguments
+    """
+
+    return {
+        'host': os.getenv("POSTGRES_HOST", "localhost"),
+        'database': database,
+        'user': 'postgres',
+        'password': os.getenv("POSTGRES_MASTER_PASSW"),
+        'port': '5432'
+    }
+
+def get_loaded_character_names(database: str, schema: str) -> set | None:
+
+    """
+    This function gets the names of the characters already loaded into the character_info table
+    of a schema. It is used by the incremental extraction to know which characters are new.
+    If the database can't be reached or the table can't be read (e.g. it hasn't been created yet),
+    None is returned, so the caller can tell this apart from an empty table.
+
+    Parameters:
+    database (str): name of the database
+    schema (str): name of the game schema
+
+    Returned value:
+    set | None: names of the loaded characters, or None if they couldn't be read
+    """
+
+    conn = None
+
+    try:
+        conn = psycopg2.connect(**get_db_config(database))
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT name FROM {schema}.character_info")
+        names = {row[0] for row in cursor.fetchall()}
+        cursor.close()
+    except Exception as e:
+        logging.warning(f"Could not read loaded characters from {database}.{schema}: {e}")
+        names = None
+    finally:
+        if conn:
+            conn.close()
+
+    return names
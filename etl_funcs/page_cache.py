@@ -0,0 +1,255 @@
+import hashlib
+import json
+import logging
+import os
+import time
+
+#  ================================== Response cache - Wiki pages ================================== #
+
+# Cache settings
+PAGE_CACHE_DIR = "temp/page_cache"
+PAGE_CACHE_MAX_BYTES = 200 * 1024 * 1024 # total size of the cached pages
+PAGE_CACHE_MAX_AGE_DAYS = 30 # entries not validated by the server for this long are evicted
+
+class PageCache:
+
+    """
+    This class is an on-disk cache of fetched pages, keyed by URL. For each page, it stores the body
+    and the ETag and Last-Modified headers returned by the server, so later runs can send a
+    conditional request and reuse the stored body when the server answers 304 Not Modified. It can
+    also keep the record parsed from the page, so an unchanged page doesn't need to be parsed again.
+    """
+
+    def __init__(self, cache_dir: str = PAGE_CACHE_DIR, max_bytes: int = PAGE_CACHE_MAX_BYTES,
+                 max_age_days: float = PAGE_CACHE_MAX_AGE_DAYS) -> None:
+
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 24 * 60 * 60
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _paths(self, url: str) -> tuple:
+
+        """
+        This method returns the paths of the body and metadata files of the given URL.
+
+        Parameters:
+        url (str): URL of the page
+
+        Returned value:
+        tuple: path of the body file and path of the metadata file
+        """
+
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.html"), os.path.join(self.cache_dir, f"{key}.json")
+
+    def _write(self, path: str, content: str) -> None:
+
+        """
+        This method writes a cache file. The content is written to a temporary file first, so an
+        interrupted run never leaves a half-written entry behind.
+
+        Parameters:
+        path (str): path of the cache file
+        content (str): content to be written
+
+        Returned value:
+        None
+        """
+
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(temp_path, path)
+
+    def lookup(self, url: str) -> dict | None:
+
+        """
+        This method gets the metadata of the cached entry of the given URL.
+
+        Parameters:
+        url (str): URL of the page
+
+        Returned value:
+        dict | None: metadata of the entry (ETag, Last-Modified, timestamps and parsed record), or None if the page isn't cached
+        """
+
+        body_path, meta_path = self._paths(url)
+
+        if not (os.path.exists(body_path) and os.path.exists(meta_path)):
+            return None
+
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def conditional_headers(self, entry: dict | None) -> dict:
+
+        """
+        This method builds the conditional request headers for a cached entry.
+
+        Parameters:
+        entry (dict | None): metadata of the cached entry
+
+        Returned value:
+        dict: If-None-Match and/or If-Modified-Since headers (empty if nothing is cached)
+        """
+
+        headers = {}
+
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        return headers
+
+    def read_body(self, url: str) -> str | None:
+
+        """
+        This method reads the cached body of the given URL.
+
+        Parameters:
+        url (str): URL of the page
+
+        Returned value:
+        str | None: cached body, or None if the page isn't cached
+        """
+
+        body_path, _ = self._paths(url)
+
+        try:
+            with open(body_path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def store(self, url: str, text: str, headers: dict) -> None:
+
+        """
+        This method stores a fetched page and its validators. Pages returned without ETag or
+        Last-Modified headers are not stored, since they can't be validated later.
+
+        Parameters:
+        url (str): URL of the page
+        text (str): body of the page
+        headers (dict): response headers
+
+        Returned value:
+        None
+        """
+
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+
+        if not (etag or last_modified):
+            return
+
+        body_path, meta_path = self._paths(url)
+        now = time.time()
+        entry = {"url": url, "etag": etag, "last_modified": last_modified, "stored_at": now, "validated_at": now,
+                 "size": len(text.encode("utf-8"))}
+
+        self._write(body_path, text)
+        self._write(meta_path, json.dumps(entry))
+
+    def mark_validated(self, url: str) -> None:
+
+        """
+        This method records that the server confirmed the cached entry is still up to date (304).
+
+        Parameters:
+        url (str): URL of the page
+
+        Returned value:
+        None
+        """
+
+        entry = self.lookup(url)
+
+        if entry is not None:
+            entry["validated_at"] = time.time()
+            self._write(self._paths(url)[1], json.dumps(entry))
+
+    def get_record(self, url: str, context=None):
+
+        """
+        This method gets the record parsed from the cached page of the given URL.
+
+        Parameters:
+        url (str): URL of the page
+        context: extra input the record was parsed with; the record is only returned if it matches
+
+        Returned value:
+        the parsed record, or None if no record was stored for this page (and context)
+        """
+
+        entry = self.lookup(url)
+
+        if entry is None or "record" not in entry or entry.get("context") != context:
+            return None
+
+        return entry["record"]
+
+    def store_record(self, url: str, record, context=None) -> None:
+
+        """
+        This method stores the record parsed from the cached page of the given URL.
+
+        Parameters:
+        url (str): URL of the page
+        record: parsed record (any JSON-serialisable value)
+        context: extra input the record was parsed with (any JSON-serialisable value)
+
+        Returned value:
+        None
+        """
+
+        entry = self.lookup(url)
+
+        if entry is not None:
+            entry["record"] = record
+            entry["context"] = context
+            self._write(self._paths(url)[1], json.dumps(entry))
+
+    def prune(self) -> None:
+
+        """
+        This method evicts entries which haven't been validated by the server for longer than the
+        maximum age, then the least recently validated entries until the cache fits the size limit.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            if file_name.endswith(".json"):
+                try:
+                    with open(os.path.join(self.cache_dir, file_name), "r", encoding="utf-8") as f:
+                        entries.append(json.load(f))
+                except (OSError, ValueError):
+                    continue
+
+        entries.sort(key=lambda entry: entry["validated_at"])
+        now = time.time()
+        total_size = sum(entry["size"] for entry in entries)
+        evicted = 0
+
+        for entry in entries:
+            if now - entry["validated_at"] <= self.max_age and total_size <= self.max_bytes:
+                break
+            for path in self._paths(entry["url"]):
+                if os.path.exists(path):
+                    os.remove(path)
+            total_size -= entry["size"]
+            evicted += 1
+
+        if evicted:
+            logging.info(f"Page cache: {evicted} entries evicted.")
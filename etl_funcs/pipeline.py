@@ -0,0 +1,352 @@
+import logging
+import queue
+import threading
+import time
+
+import psycopg2
+
+from etl_funcs.scraper import (iter_wuwa_char_info_from_web, iter_genshin_char_info_from_web, iter_zzz_char_info_from_web,
+                               iter_hsr_char_info_from_web, iter_ow_char_info_from_web, shutdown_parse_pool)
+from etl_funcs.transform import clean_hsr_char_records, clean_ow_char_records, normalize_date, STAR_SCHEMA_SPECS
+from etl_funcs.loader import get_db_config, create_star_schema_tables, get_upsert_query, check_loaded_keys, seed_key_registry
+from etl_funcs.key_registry import get_key_registry, CHARACTER_KEY
+from etl_funcs.queue_utils import put_until_stopped
+
+#  ================================ Streaming pipeline - Game specs ================================ #
+
+STREAM_QUEUE_SIZE = 64 # records waiting between two stages; a full queue makes the previous stage wait
+LOAD_BATCH_SIZE = 25 # rows written to the database per transaction
+LOAD_FLUSH_SECONDS = 2.0 # a partial batch is written once its first row has waited this long
+
+# Stages of each game: extractor, cleaning rules (None if the records are loaded as extracted) and
+# database; the tables written are described by the star schema spec of the game
+STREAM_SPECS = {
+    "wuthering_waves": {"extract": iter_wuwa_char_info_from_web, "clean": None, "database": "kuro_games_characters"},
+    "genshin_impact": {"extract": iter_genshin_char_info_from_web, "clean": None, "database": "hoyo_characters"},
+    "zenless_zone_zero": {"extract": iter_zzz_char_info_from_web, "clean": None, "database": "hoyo_characters"},
+    "honkai_star_rail": {"extract": iter_hsr_char_info_from_web, "clean": clean_hsr_char_records, "database": "hoyo_characters"},
+    "overwatch_2": {"extract": iter_ow_char_info_from_web, "clean": clean_ow_char_records, "database": "blizzard_characters"}
+}
+
+#  =============================== Streaming pipeline - Star schema ================================ #
+
+class StarSchemaLoader:
+
+    """
+    This class writes the characters of a game to its star schema as they arrive. The ids of the
+    characters and dimension values come from the key registry, like in the batch transformation
+    (a new gender, region or faction gets the next id the first time it's seen), and the rows are
+    upserted, so the rows already loaded are only updated if they changed. The new dimension rows of
+    a batch are written in the same transaction as the characters referencing them, so the foreign
+    keys always hold.
+    """
+
+    def __init__(self, schema: str, database: str) -> None:
+
+        spec = STAR_SCHEMA_SPECS[schema]
+        self.schema = schema
+        self.dimensions = spec["dimensions"]
+        self.date_format = spec["date_format"]
+        self.exclude = spec["exclude"]
+        self.loaded_values = {dimension: set() for dimension in self.dimensions} # dimension values already written by this loader
+        self.count = 0
+
+        logging.info(f"Accessing database: {database}...")
+
+        self.conn = psycopg2.connect(**get_db_config(database))
+        self.cursor = self.conn.cursor()
+        self._create_tables()
+        seed_key_registry(self.cursor, schema, self.dimensions) # if the key registry is new, the ids already loaded are kept
+
+    def _create_tables(self) -> None:
+
+        """
+        This method creates the dimension and facts tables of the schema, if they don't exist yet.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        logging.info(f"Creating tables for schema: {self.schema}...")
+
+        create_star_schema_tables(self.cursor, self.schema, self.dimensions)
+        self.conn.commit()
+
+    def write(self, char_info: list) -> None:
+
+        """
+        This method writes a batch of cleaned characters, with any dimension value not written yet,
+        in a single transaction.
+
+        Parameters:
+        char_info (list): cleaned character dictionaries
+
+        Returned value:
+        None
+        """
+
+        # 1. Filtering the characters and normalizing their release dates; characters with a missing dimension value
+        # or an unparseable date are reported and left out
+        dated_chars = []
+        for char in char_info:
+            if any(char[column] in excluded_values for column, excluded_values in self.exclude.items()):
+                continue
+            if any(char[dimension] is None for dimension in self.dimensions):
+                logging.warning(f"{char['name']} has a missing {'/'.join(self.dimensions)} value, the character is left out.")
+                continue
+            release_date = normalize_date(char["release_date"], self.date_format)
+            if release_date is None:
+                logging.warning(f"Release date of {char['name']} couldn't be parsed, the character is left out: {char['release_date']}")
+            else:
+                dated_chars.append((char, release_date))
+
+        # 2. Getting the ids of the characters and dimension values, registering the new ones
+        registry = get_key_registry()
+        character_ids = registry.get_ids(self.schema, CHARACTER_KEY, [char["name"] for char, _ in dated_chars])
+        dimension_ids = {dimension: registry.get_ids(self.schema, dimension, [char[dimension] for char, _ in dated_chars])
+                         for dimension in self.dimensions}
+
+        # 3. Building the facts rows
+        facts_rows = [(character_ids[char["name"]], char["name"], *(dimension_ids[dimension][char[dimension]] for dimension in self.dimensions),
+                       release_date) for char, release_date in dated_chars]
+
+        # 4. Checking that no id is already loaded with another value, before anything is written
+        dimension_rows = {dimension: [(id, value) for value, id in ids.items() if value not in self.loaded_values[dimension]]
+                          for dimension, ids in dimension_ids.items()}
+        columns = ["character_id", "name", *(f"{dimension}_id" for dimension in self.dimensions), "release_date"]
+        for dimension, rows in dimension_rows.items():
+            check_loaded_keys(self.cursor, self.schema, f"{dimension}_dim", [f"{dimension}_id", dimension], rows)
+        check_loaded_keys(self.cursor, self.schema, "character_info", columns, facts_rows)
+
+        # 5. Writing the dimension rows before the characters referencing them
+        for dimension, rows in dimension_rows.items():
+            if rows:
+                self.cursor.executemany(get_upsert_query(self.schema, f"{dimension}_dim", [f"{dimension}_id", dimension]), rows)
+
+        self.cursor.executemany(get_upsert_query(self.schema, "character_info", columns), facts_rows)
+        self.conn.commit()
+        for dimension, rows in dimension_rows.items():
+            self.loaded_values[dimension].update(value for _, value in rows)
+        self.count += len(facts_rows)
+
+        logging.debug(f"Loaded {len(facts_rows)} characters into schema: {self.schema} ({self.count} so far).")
+
+    def close(self) -> None:
+
+        """
+        This method closes the database connection.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        self.cursor.close()
+        self.conn.close()
+
+#  ================================== Streaming pipeline - Stages ================================== #
+
+_END = object() # put on a queue once the stage writing to it is done
+
+def _iter_queue(records: queue.Queue, stop: threading.Event):
+
+    """
+    This generator reads the records put on a queue by the previous stage, until the stage is done
+    or the pipeline is stopped.
+
+    Parameters:
+    records (queue.Queue): queue written by the previous stage
+    stop (threading.Event): event set once a stage of the pipeline fails
+
+    Returned value:
+    generator: records
+    """
+
+    while True:
+        try:
+            record = records.get(timeout = 0.5)
+        except queue.Empty:
+            if stop.is_set():
+                return
+            continue
+        if record is _END:
+            return
+        yield record
+
+def _run_extract_stage(spec: dict, incremental: bool, output: queue.Queue, stop: threading.Event) -> None:
+
+    """
+    This function puts the records of a game on the queue of the cleaning stage as they are extracted.
+
+    Parameters:
+    spec (dict): stages of the game
+    incremental (bool): only fetch characters which are new or whose wiki page changed
+    output (queue.Queue): queue read by the cleaning stage
+    stop (threading.Event): event set once a stage of the pipeline fails
+
+    Returned value:
+    None
+    """
+
+    records = spec["extract"](incremental)
+
+    try:
+        for record in records:
+            if not put_until_stopped(output, record, stop):
+                break
+    finally:
+        records.close() # stops the page fetches if the pipeline was stopped
+        put_until_stopped(output, _END, stop)
+
+def _run_clean_stage(spec: dict, records: queue.Queue, output: queue.Queue, stop: threading.Event) -> None:
+
+    """
+    This function applies the cleaning rules of a game to the extracted records and puts them on the
+    queue of the loading stage.
+
+    Parameters:
+    spec (dict): stages of the game
+    records (queue.Queue): queue written by the extraction stage
+    output (queue.Queue): queue read by the loading stage
+    stop (threading.Event): event set once a stage of the pipeline fails
+
+    Returned value:
+    None
+    """
+
+    char_info = _iter_queue(records, stop)
+    if spec["clean"] is not None:
+        char_info = spec["clean"](char_info)
+
+    try:
+        for char in char_info:
+            if not put_until_stopped(output, char, stop):
+                break
+    finally:
+        put_until_stopped(output, _END, stop)
+
+def _run_load_stage(schema: str, spec: dict, records: queue.Queue, stop: threading.Event) -> None:
+
+    """
+    This function writes the cleaned records of a game to its star schema in batches. A batch is
+    written once it is full or once its first record has waited LOAD_FLUSH_SECONDS, so the rows land
+    in the database shortly after their page is fetched even when the extraction is slow.
+
+    Parameters:
+    schema (str): name of the game schema
+    spec (dict): stages of the game
+    records (queue.Queue): queue written by the cleaning stage
+    stop (threading.Event): event set once a stage of the pipeline fails
+
+    Returned value:
+    None
+    """
+
+    loader = StarSchemaLoader(schema, spec["database"])
+    batch = []
+    deadline = None
+
+    try:
+        while True:
+            timeout = 0.5 if deadline is None else min(0.5, max(0, deadline - time.monotonic()))
+            try:
+                record = records.get(timeout = timeout)
+            except queue.Empty:
+                if batch and (stop.is_set() or time.monotonic() >= deadline):
+                    loader.write(batch)
+                    batch, deadline = [], None
+                if stop.is_set():
+                    break
+                continue
+
+            if record is _END:
+                break
+
+            batch.append(record)
+            if deadline is None:
+                deadline = time.monotonic() + LOAD_FLUSH_SECONDS
+            if len(batch) >= LOAD_BATCH_SIZE:
+                loader.write(batch)
+                batch, deadline = [], None
+
+        if batch:
+            loader.write(batch)
+
+        logging.info(f"Finished streaming {loader.count} characters to schema: {schema}.")
+    finally:
+        loader.close()
+
+def _run_stage(name: str, stage, errors: list, stop: threading.Event, *args) -> None:
+
+    """
+    This function runs a stage of the pipeline, stopping the other stages of its game if it fails.
+
+    Parameters:
+    name (str): name of the stage, used in the logs
+    stage (function): stage function
+    errors (list): list where the error of the stage is saved, if it fails
+    stop (threading.Event): event set once a stage of the pipeline fails
+    *args: arguments of the stage function
+
+    Returned value:
+    None
+    """
+
+    try:
+        stage(*args, stop)
+    except Exception as e:
+        logging.error(f"Stage {name} failed: {e}")
+        errors.append(e)
+        stop.set()
+
+def run_streaming_pipeline(games: list = None, incremental: bool = False) -> None:
+
+    """
+    This function runs the ETL process as a stream: for each game, the records flow from the scraper
+    through the cleaning rules into batched database writes, with bounded queues between the stages,
+    so the three stages run at the same time and the whole process takes about as long as its
+    slowest stage. The games run in parallel, like the extractors of the batch process. If a stage
+    fails, the other stages of its game are stopped (the rows already written are kept), the other
+    games are allowed to finish and the first error is raised.
+
+    Parameters:
+    games (list): names of the game schemas to be processed (every game if None)
+    incremental (bool): only fetch characters which are new or whose wiki page changed
+
+    Returned value:
+    None
+    """
+
+    errors = []
+    threads = []
+
+    for schema in games or list(STREAM_SPECS):
+        spec = STREAM_SPECS[schema]
+        stop = threading.Event()
+        extracted = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        cleaned = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+
+        stages = [("extract", _run_extract_stage, (spec, incremental, extracted)),
+                  ("clean", _run_clean_stage, (spec, extracted, cleaned)),
+                  ("load", _run_load_stage, (schema, spec, cleaned))]
+
+        for name, stage, args in stages:
+            threads.append(threading.Thread(target=_run_stage, args=(f"{schema}-{name}", stage, errors, stop, *args),
+                                            name=f"{schema}-{name}", daemon=True))
+
+    logging.info(f"Streaming character data of {len(threads) // 3} games...")
+
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    shutdown_parse_pool() # the worker processes aren't needed once every extractor is done
+
+    if errors:
+        raise errors[0]
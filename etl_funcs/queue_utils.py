@@ -0,0 +1,30 @@
+import queue
+import threading
+
+#  =================================== Queues - Bounded handoff ==================================== #
+
+QUEUE_POLL_SECONDS = 0.5 # how often a producer waiting for a free slot checks whether the consumer stopped
+
+def put_until_stopped(results: queue.Queue, item, stop: threading.Event) -> bool:
+
+    """
+    This function puts an item on a bounded queue, waiting for a free slot unless the consumer of
+    the queue has stopped.
+
+    Parameters:
+    results (queue.Queue): bounded queue
+    item: item to be put on the queue
+    stop (threading.Event): event set once the consumer stops reading the queue
+
+    Returned value:
+    bool: True if the item was put on the queue
+    """
+
+    while not stop.is_set():
+        try:
+            results.put(item, timeout = QUEUE_POLL_SECONDS)
+            return True
+        except queue.Full:
+            continue
+
+    return False
@@ -1,403 +1,2003 @@
-from bs4 import BeautifulSoup
-import requests
-from fake_useragent import UserAgent
-import pandas as pd
-import logging
-import random
-import time
-import sys
-
-#  ============================== Extraction functions - Web Scraping ============================== #
-
-def extract_wuwa_char_info_from_web() -> None:
-
-    """
-    This function extracts info from playable characters belonging to the game Wuthering Waves
-    from the Fandom wiki. It gets a list of currently active characters and, for each character,
-    it enters their Fandom wiki entry, get their name, gender, location and release date, and add
-    the info to a list. Then, after collecting info from all characters, it converts the generated
-    list to a pandas DataFrame and save it as a CSV file.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Starting collection of character data from game: Wuthering Waves...")
-
-    # 1. Getting list of active characters
-
-    char_info = []
-    with open("data_input/character_list_wuwa.txt", "r") as cf:
-        char_names = cf.readlines()
-
-    # 2. Extracting info from each character
-
-    for character in char_names:
-
-        character = character.replace('\n', '') # removes next line character so that it can be used in the URL
-
-        logging.info(f"Extracting info for character: {character}")
-
-        url = f"https://wutheringwaves.fandom.com/wiki/{character.replace(' ', '_')}"
-        headers = {'User-Agent': UserAgent().random}
-        data_request = requests.get(url, headers=headers)
-
-        if data_request.status_code == 200:
-            webpage = BeautifulSoup(data_request.text, "html.parser")
-            character_name = webpage.find_all("h1")[0].get_text().strip()
-
-            try:
-                character_gender = webpage.find_all("div", attrs={"data-source" : "gender"})[0].find("div").get_text().strip()
-                character_region = webpage.find_all("div", attrs={"data-source" : "nation"})[0].find("div").get_text().strip()
-                character_release_date = webpage.find_all("div", attrs={"data-source" : "releaseDate"})[0].find("div").get_text(separator = "\n").split("\n")[0]
-            except IndexError as ie:
-                if character == "Rover": # Rover is the player's character; they can be a male or a female
-                    character_gender = "Any"
-                    character_region = webpage.find_all("div", attrs={"data-source" : "nation"})[0].find("div").get_text().strip()
-                    character_release_date = webpage.find_all("div", attrs={"data-source" : "releaseDate"})[0].find("div").get_text(separator = "\n").split("\n")[0]
-                else:
-                    # the block below adds birthplace as a regio info instead of nation
-                    character_gender = webpage.find_all("div", attrs={"data-source" : "gender"})[0].find("div").get_text().strip()
-                    character_region = webpage.find_all("div", attrs={"data-source" : "birthplace"})[0].find("div").get_text().strip()
-                    character_release_date = webpage.find_all("div", attrs={"data-source" : "releaseDate"})[0].find("div").get_text(separator = "\n").split("\n")[0]
-
-            # gathering character info and adding it to a dictionary, then appending it to a list
-            char_content = {
-                "name": character_name,
-                "gender": character_gender if character_gender else "Any",
-                "region": character_region if character_region else "Unknown",
-                "release_date": character_release_date if character_release_date else "Unknown"
-            }
-            char_info.append(char_content)
-
-            # random delay to minimise risk of being detected as scraper
-            delay = random.uniform(5, 15)
-            logging.info(f"Character info collected successfully. Waiting {delay} seconds before proceeding...")
-            time.sleep(delay)
-
-        elif data_request.status_code in [403, 429]: # If the program is detected as a scraper, it is immediately terminated
-            logging.fatal("System detected as a scraper! Terminating program...")
-            sys.exit()
-        else:
-            print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
-
-    # 3. Converting structured list into a DataFrame then saving into a CSV file
-    wuwa_char_df = pd.DataFrame(char_info)
-    wuwa_char_df.to_csv("temp/wuthering_waves_character_data.csv")
-
-    logging.info("Info of characters successfully extracted. Finishing program...")
-
-def extract_genshin_char_info_from_web() -> None:
-
-    """
-    This function extracts info from playable characters belonging to the game Genshin Impact
-    from the Fandom wiki. It accesses the character list from the site, then, for each character in
-    the general playable character list, get their name, gender, location and release date, and add
-    the info to a list. Finally, after collecting info from all characters, it converts the generated
-    list to a pandas DataFrame and save it as a CSV file.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Starting collection of character data from game: Genshin Impact...")
-
-    char_info = []
-
-    logging.info(f"Extracting character info table...")
-
-    # 1. Accessing character list from Fandom wiki
-
-    url = f"https://genshin-impact.fandom.com/wiki/Character/List"
-    headers = {'User-Agent': UserAgent().random}
-    data_request = requests.get(url, headers=headers)
-    
-    # 2. Extracting info from each character
-
-    if data_request.status_code == 200:
-        webpage = BeautifulSoup(data_request.text, "html.parser")
-        character_list = webpage.find_all("tbody")[0].find_all("tr")[1:]
-
-        for character in character_list:
-            # gathering character info and adding it to a dictionary, then appending it to a list
-            character_name = character.find_all("td")[1].get_text()
-            character_gender = character.find_all("td")[-3].get_text()
-            character_region = character.find_all("td")[-4].get_text().strip()
-            character_release_date = character.find_all("td")[-2].get_text()
-
-            char_content = {
-                "name": character_name.strip(),
-                "gender": "Any" if character_name.strip() == "Traveler" else character_gender.strip().split(" ")[1], # Traveler is the player's character, so they can be a male or a female
-                "region": "Unknown" if character_region == "None" else character_region, # Some characters are from unknown regions, like Traveler and Aloy
-                "release_date": character_release_date.strip() if character_release_date else "Unknown"
-            }
-            char_info.append(char_content)
-
-    elif data_request.status_code in [403, 429]: # If the program is detected as a scraper, it is immediately terminated
-        logging.fatal("System detected as a scraper! Terminating program...")
-        sys.exit()
-    else:
-        print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
-
-    # 3. Converting structured list into a DataFrame then saving into a CSV file
-    genshin_char_df = pd.DataFrame(char_info)
-    genshin_char_df.to_csv("temp/genshin_impact_character_data.csv")
-
-    logging.info("Info of characters successfully extracted. Finishing program...")
-
-def extract_zzz_char_info_from_web() -> None:
-
-    """
-    This function extracts info from playable characters belonging to the game Zenless Zone Zero
-    from the Fandom wiki. It gets a list of currently active characters and, for each character,
-    it enters their Fandom wiki entry, get their name, gender, location and release date, and add
-    the info to a list. Then, after collecting info from all characters, it converts the generated
-    list to a pandas DataFrame and save it as a CSV file.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Starting collection of character data from game: Zenless Zone Zero...")
-
-    # 1. Getting list of active characters
-
-    char_info = []
-    with open("data_input/character_list_zzz.txt", "r") as cf:
-        char_names = cf.readlines()
-
-    # 2. Extracting info from each character
-
-    for character in char_names:
-
-        character = character.replace('\n', '') # removes next line character so that it can be used in the URL
-
-        logging.info(f"Extracting info for character: {character}")
-
-        url = f"https://zenless-zone-zero.fandom.com/wiki/{character.replace(' ', '_')}"
-        headers = {'User-Agent': UserAgent().random}
-        data_request = requests.get(url, headers=headers)
-
-        if data_request.status_code == 200:
-            webpage = BeautifulSoup(data_request.text, "html.parser")
-            character_name = webpage.find_all("span", class_ = "mw-page-title-main")[0].get_text().strip()
-            
-            character_gender = webpage.find_all("div", attrs={"data-source" : "gender"})[0].find("div").get_text().strip()
-            character_faction = webpage.find_all("div", attrs={"data-source" : "faction"})[0].find("div").get_text().strip()
-            character_release_date = webpage.find_all("div", attrs={"data-source" : "releaseDate"})[0].find("div").get_text(separator = "\n").split("\n")[0]
-            
-            # gathering character info and adding it to a dictionary, then appending it to a list
-            char_content = {
-                "name": character_name,
-                "gender": character_gender if character_gender else "Any",
-                "faction": character_faction[:(len(character_faction) // 2 + 1)].strip() if character_faction else "Unknown",
-                "release_date": character_release_date if character_release_date else "Unknown"
-            }
-            char_info.append(char_content)
-
-            # random delay to minimise risk of being detected as scraper
-            delay = random.uniform(5, 15)
-            logging.info(f"Character info collected successfully. Waiting {delay} seconds before proceeding...")
-            time.sleep(delay)
-
-        elif data_request.status_code in [403, 429]: # If the program is detected as a scraper, it is immediately terminated
-            logging.fatal("System detected as a scraper! Terminating program...")
-            sys.exit()
-        else:
-            print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
-
-    # 3. Converting structured list into a DataFrame then saving into a CSV file
-    zzz_char_df = pd.DataFrame(char_info)
-    zzz_char_df.to_csv("temp/zenless_zone_zero_character_data.csv")
-
-    logging.info("Info of characters successfully extracted. Finishing program...")
-
-def extract_hsr_char_info_from_web() -> None:
-
-    """
-    This function extracts info from playable characters belonging to the game Honkai: Star Rail
-    from the Fandom wiki. First, it retrieves a list of currently active characters from another 
-    website, then, for each character, it enters their Fandom wiki entry, get their name, gender, 
-    location and release date, and add the info to a list. Then, after collecting info from all 
-    characters, it converts the generated list to a pandas DataFrame and save it as a CSV file.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Starting collection of character data from game: Honkai: Star Rail...")
-
-    char_info = []
-
-    logging.info(f"Extracting character info table...")
-
-    ##### A. Getting character list
-
-    # 1. Accessing character list from The Gamer
-
-    url = f"https://www.thegamer.com/honkai-star-rail-playable-character-age-height-path-element/"
-    headers = {'User-Agent': UserAgent().random}
-    data_request = requests.get(url, headers=headers)
-    
-    # 2. Extracting info from character table
-
-    if data_request.status_code == 200:
-        webpage = BeautifulSoup(data_request.text, "html.parser")
-        character_list = webpage.find_all("tbody")[0].find_all("tr")[1:]
-
-        for character in character_list:
-            # gathering character info and adding it to a dictionary, then appending it to a list
-            character_name = character.find_all("td")[0].get_text()
-            character_gender = character.find_all("td")[2].get_text()
-
-            char_content = {
-                "name": character_name.strip(),
-                "gender": "Any" if character_name.strip() == "Trailblazer" else character_gender.strip().split(" ")[1], # Trailblazer is the player's character, so they can be a male or a female
-            }
-            char_info.append(char_content)
-
-    elif data_request.status_code in [403, 429]: # If the program is detected as a scraper, it is immediately terminated
-        logging.fatal("System detected as a scraper! Terminating program...")
-        sys.exit()
-    else:
-        print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
-
-    ##### B. Getting info for each character
-
-    for character in char_info:
-
-        char_name = character["name"]
-
-        logging.info(f"Extracting info for character: {char_name}")
-
-        url = f"https://honkai-star-rail.fandom.com/wiki/{char_name.replace(' ', '_').replace('and', '%26')}"
-        headers = {'User-Agent': UserAgent().random}
-        data_request = requests.get(url, headers=headers)
-
-        if data_request.status_code == 200:
-            webpage = BeautifulSoup(data_request.text, "html.parser")
-
-            character_faction = webpage.find_all("div", attrs={"data-source" : "faction"})[0].find("div").get_text().strip()
-            character_release_date = webpage.find_all("div", attrs={"data-source" : "release_date"})[0].find("div").get_text().strip()
-
-            # gathering character info and adding it to a dictionary, then appending it to a list
-            character["faction"] = character_faction
-            character["release_date"] = character_release_date
-
-            # random delay to minimise risk of being detected as scraper
-            delay = random.uniform(5, 15)
-            logging.info(f"Character info collected successfully. Waiting {delay} seconds before proceeding...")
-            time.sleep(delay)
-
-        elif data_request.status_code in [403, 429]: # If the program is detected as a scraper, it is immediately terminated
-            logging.fatal("System detected as a scraper! Terminating program...")
-            sys.exit()
-        else:
-            print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
-
-    # 3. Converting structured list into a DataFrame then saving into a CSV file
-    hsr_char_df = pd.DataFrame(char_info)
-    hsr_char_df.to_csv("temp/honkai_star_rail_character_data.csv")
-
-    logging.info("Info of characters successfully extracted. Finishing program...")
-
-def extract_ow_char_info_from_web() -> None:
-
-    """
-    This function extracts info from playable characters belonging to the game Overwatch 2
-    from the Fandom wiki. First, it gets a list of currently active characters, where gender 
-    info is available, and converts it into a dictionary. Second, it accesses the character 
-    list from the site. Then, for each character in the general playable character list, gets 
-    their name, location and release date, and add the info to a list, using the dictionary
-    to add the gender. Finally, after collecting info from all characters, it converts the 
-    generated list to a pandas DataFrame and save it as a CSV file.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Starting collection of character data from game: Overwatch 2...")
-
-    char_info = []
-    char_gender_hash = {}
-    with open("data_input/character_list_ow.txt", "r") as cf:
-        char_names = cf.readlines()
-
-    for character in char_names:
-        character = character.replace('\n', '')
-        char_name, char_gender = character.split("-")
-        char_name = char_name.strip()
-        char_gender = char_gender.strip()
-        char_gender_hash[char_name] = char_gender
-
-    logging.info(f"Extracting character info table...")
-
-    # Accessing character list from Fandom wiki
-
-    url = "https://overwatch.fandom.com/wiki/Heroes"
-    headers = {'User-Agent': UserAgent().random}
-    data_request = requests.get(url, headers=headers)
-    
-    # 2. Extracting info from each character
-
-    if data_request.status_code == 200:
-        webpage = BeautifulSoup(data_request.text, "html.parser")
-        character_list = webpage.find_all("tbody")[1].find_all("tr")[1:]
-
-        for character in character_list:
-            # gathering character info and adding it to a dictionary, then appending it to a list
-
-            # source table wasn't a perfect grid, so it was necessary to create a region index variable
-            if len(character.find_all("td")) in [5, 6]:
-                region_index = -1
-            elif len(character.find_all("td")) == 7:
-                region_index = -2
-            else:
-                region_index = -3
-
-            try:
-                character_name = character.find_all("td")[2].get_text()
-                character_gender = "Male" if "Aqua" in character_name else char_gender_hash[character_name.replace("\n", "")]
-                character_region = character.find_all("td")[region_index].get_text().strip()
-                character_release_date = character.find_all("td")[-1].get_text()
-            except KeyError as ke:
-                # Why, Torbjörn?
-                character_name = character.find_all("td")[2].get_text()
-                character_gender = "Male"
-                character_region = character.find_all("td")[region_index].get_text().strip()
-                character_release_date = character.find_all("td")[-1].get_text()
-
-            char_content = {
-                "name": character_name.strip().replace("\n", ""),
-                "gender": character_gender.strip(),
-                "region": character_region.strip().replace("\n", ""),
-                "release_date": character_release_date.strip() if character_release_date else "Unknown"
-            }
-            char_info.append(char_content)
-
-    elif data_request.status_code in [403, 429]: # If the program is detected as a scraper, it is immediately terminated
-        logging.fatal("System detected as a scraper! Terminating program...")
-        sys.exit()
-    else:
-        print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
-
-    # 3. Converting structured list into a DataFrame then saving into a CSV file
-    ow_char_df = pd.DataFrame(char_info)
-    ow_char_df.to_csv("temp/overwatch_2_character_data.csv")
-
-    logging.info("Info of characters successfully extracted. Finishing program...")
\ No newline at end of file
+from bs4 import BeautifulSoup
+import requests
+from fake_useragent import UserAgent
+import logging
+import random
+import time
+import sys
+import asyncio
+import threading
+import queue
+import json
+import os
+import multiprocessing
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse, unquote, quote
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from etl_funcs.page_cache import PageCache
+from etl_funcs.archive import PageArchive
+from etl_funcs.loader import get_loaded_character_names
+from etl_funcs.journal import ExtractionJournal
+from etl_funcs.stage_store import get_stage_store
+from etl_funcs.queue_utils import put_until_stopped
+from etl_funcs.html_parser import parse_html, read_table_columns, columns_to_records
+from etl_funcs.wikitext import get_infobox_parameters, wikitext_to_text
+
+#  ============================= Fetching engine - Politeness controls ============================= #
+
+# Politeness settings, applied to each host (wiki) separately
+MAX_IN_FLIGHT_PER_HOST = 4 # maximum number of simultaneous requests against a single host
+REQUESTS_PER_SECOND_PER_HOST = 0.1 # initial request-rate budget for a single host: one page every 10-15 seconds, like the former 5-15 second sleep
+MIN_REQUESTS_PER_SECOND_PER_HOST = 0.02 # the budget is never lowered below this rate when the host throttles the scraper
+RATE_JITTER = 0.5 # extra random spacing between requests, as a fraction of the budget interval
+RATE_INCREASE_STEP = 0.01 # requests per second given back to a lowered budget after a run of successful requests
+SUCCESS_STREAK = 10 # number of successful requests in a row needed to give back part of a lowered budget
+
+# Retry settings
+REQUEST_TIMEOUT = 30 # seconds
+MAX_RETRIES = 5 # a page still throttled after this many retries means the scraper is persistently blocked
+BACKOFF_BASE = 5 # seconds; doubled after each failed attempt
+BACKOFF_MAX = 300 # seconds
+RETRY_STATUS_CODES = [403, 429, 500, 502, 503, 504]
+
+class FetchedPage:
+
+    """
+    This class holds the result of a page request: the requested URL, the HTTP status code,
+    the page content and the reason returned by the server. Pages which haven't changed since they
+    were cached are flagged as served from the cache.
+    """
+
+    def __init__(self, url: str, status_code: int, text: str, reason: str, from_cache: bool = False, headers: dict = None) -> None:
+
+        self.url = url
+        self.status_code = status_code
+        self.text = text
+        self.reason = reason
+        self.from_cache = from_cache
+        self.headers = CaseInsensitiveDict(headers or {}) # header names are case-insensitive, whatever case the server sends
+
+class ScraperBlockedError(Exception):
+
+    """
+    This exception is raised when a host keeps detecting the program as a scraper (403 or 429)
+    after all retries, so the run has to be aborted.
+    """
+
+class HostRateLimiter:
+
+    """
+    This class keeps the request-rate budget of a single host. Every request books the next free
+    slot, so requests against the same host are always spaced by at least 1 / requests_per_second
+    seconds (plus a random jitter), no matter how many of them are running at the same time.
+    The budget only backs off: it is halved (and the host paused) whenever the host throttles the
+    scraper, and raised a little after every run of successful requests, but never above the
+    initial rate. The speed-up of the scraper comes from fetching the hosts in parallel, not from a
+    higher rate per wiki.
+    It is thread-safe, so it can be shared by extractors running on different threads.
+    """
+
+    def __init__(self, requests_per_second: float, jitter: float = RATE_JITTER) -> None:
+
+        self.requests_per_second = requests_per_second
+        self.initial_requests_per_second = requests_per_second # the budget is never raised above it
+        self.jitter = jitter
+        self._next_slot = 0.0
+        self._success_streak = 0
+        self.throttle_count = 0 # number of times the host throttled the scraper, to detect the slots booked before a throttle
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+
+        """
+        This method books the next free request slot.
+
+        Parameters:
+        None
+
+        Returned value:
+        float: number of seconds the caller must wait before sending its request
+        """
+
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + random.uniform(1, 1 + self.jitter) / self.requests_per_second
+
+        return slot - now
+
+    def record_success(self) -> None:
+
+        """
+        This method records a successful request, raising a lowered budget after a run of
+        successes, back up to the initial rate.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        with self._lock:
+            self._success_streak += 1
+            if self._success_streak >= SUCCESS_STREAK:
+                self._success_streak = 0
+                self.requests_per_second = min(self.initial_requests_per_second, self.requests_per_second + RATE_INCREASE_STEP)
+
+    def record_throttle(self, pause: float) -> None:
+
+        """
+        This method records that the host throttled the scraper: the budget is halved and no slot is
+        booked before the given pause is over. The slots booked before the throttle are given up by
+        their callers (see _wait_for_slot), so no request is sent during the pause.
+
+        Parameters:
+        pause (float): number of seconds to wait before the next request to the host
+
+        Returned value:
+        None
+        """
+
+        with self._lock:
+            self._success_streak = 0
+            self.throttle_count += 1
+            self.requests_per_second = max(MIN_REQUESTS_PER_SECOND_PER_HOST, self.requests_per_second / 2)
+            self._next_slot = max(self._next_slot, time.monotonic() + pause)
+
+class HostState:
+
+    """
+    This class groups the politeness controls of a single host: its rate limiter and a semaphore
+    which bounds the number of requests in flight.
+    """
+
+    def __init__(self) -> None:
+
+        self.rate_limiter = HostRateLimiter(REQUESTS_PER_SECOND_PER_HOST)
+        self.in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT_PER_HOST)
+
+_host_states = {}
+_host_states_lock = threading.Lock()
+
+def get_host_state(url: str) -> HostState:
+
+    """
+    This function returns the politeness controls of the host of the given URL, creating them
+    on the first request against that host.
+
+    Parameters:
+    url (str): URL of the page to be requested
+
+    Returned value:
+    HostState: rate limiter and in-flight semaphore of the host
+    """
+
+    host = urlparse(url).netloc
+
+    with _host_states_lock:
+        if host not in _host_states:
+            _host_states[host] = HostState()
+
+        return _host_states[host]
+
+#  ============================= Fetching engine - Shared HTTP client ============================== #
+
+try:
+    import brotli # requests only decodes brotli responses when a brotli package is installed
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+ARCHIVE_FETCHED_PAGES = True # keep every fetched page in the page archive, so runs can be replayed offline
+
+_user_agent_pool = None
+_user_agent_pool_lock = threading.Lock()
+
+def get_user_agent_pool() -> UserAgent:
+
+    """
+    This function loads the fake-useragent dataset. It is only loaded once per process; every
+    later call returns the same pool, from which a random User-Agent is drawn for each request.
+
+    Parameters:
+    None
+
+    Returned value:
+    UserAgent: user agent pool
+    """
+
+    global _user_agent_pool
+
+    with _user_agent_pool_lock:
+        if _user_agent_pool is None:
+            start = time.perf_counter()
+            _user_agent_pool = UserAgent()
+            logging.info(f"User-Agent pool loaded in {time.perf_counter() - start:.3f} seconds.")
+
+        return _user_agent_pool
+
+class ScraperClient:
+
+    """
+    This class is the HTTP client shared by all extractors. It keeps one pooled requests.Session per
+    host, so connections (and their TCP/TLS handshakes) are reused through keep-alive instead of
+    being opened for every page. Pages are requested conditionally when they are in the response
+    cache, so unchanged pages are not downloaded again. Fetched pages are recorded in the page
+    archive, and in replay mode pages are read from an archived run instead of the network. It also
+    keeps some counters, so the cost of opening connections and the bandwidth saved by the cache
+    can be compared between runs.
+    """
+
+    def __init__(self, cache: PageCache | None = None, archive: PageArchive | None = None) -> None:
+
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self.cache = cache
+        self.archive = archive
+        self.replay = None # manifest of the archived run being replayed
+        self.stats = {"requests": 0, "sessions": 0, "request_seconds": 0.0, "not_modified": 0, "bytes_downloaded": 0}
+
+        if self.cache is not None:
+            self.cache.prune()
+
+    def _get_session(self, host: str) -> requests.Session:
+
+        """
+        This method returns the session of the given host, creating it on the first request
+        against that host.
+
+        Parameters:
+        host (str): host of the page to be requested
+
+        Returned value:
+        requests.Session: pooled session of the host
+        """
+
+        with self._lock:
+            if host not in self._sessions:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=MAX_IN_FLIGHT_PER_HOST)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive"})
+                self._sessions[host] = session
+                self.stats["sessions"] += 1
+
+            return self._sessions[host]
+
+    def get(self, url: str) -> FetchedPage:
+
+        """
+        This method gets a page: from the archived run in replay mode, or else from the network, in
+        which case successfully fetched pages are recorded in the archive.
+
+        Parameters:
+        url (str): URL of the page to be requested
+
+        Returned value:
+        FetchedPage: result of the request
+        """
+
+        if self.replay is not None:
+            return self._read_archived_page(url)
+
+        page = self._request(url)
+
+        if page.status_code == 200 and self.archive is not None:
+            self.archive.record(url, page.text, page.status_code)
+
+        return page
+
+    def _read_archived_page(self, url: str) -> FetchedPage:
+
+        """
+        This method reads a page from the archived run being replayed.
+
+        Parameters:
+        url (str): URL of the page
+
+        Returned value:
+        FetchedPage: archived page, or a 404 result if the run didn't fetch this URL
+        """
+
+        entry = self.replay.get(url)
+
+        if entry is None:
+            return FetchedPage(url, 404, "", "Not in the archived run")
+
+        return FetchedPage(url, entry["status_code"], self.archive.read(entry["sha256"]), "Archived")
+
+    def _request(self, url: str) -> FetchedPage:
+
+        """
+        This method sends a blocking request to the given URL through the session of its host,
+        using a random User-Agent from the shared pool. If the page is cached, the request is
+        conditional, and a 304 Not Modified answer is served with the cached content.
+
+        Parameters:
+        url (str): URL of the page to be requested
+
+        Returned value:
+        FetchedPage: result of the request
+        """
+
+        session = self._get_session(urlparse(url).netloc)
+        entry = self.cache.lookup(url) if self.cache is not None else None
+        headers = {'User-Agent': get_user_agent_pool().random}
+        if entry is not None:
+            headers.update(self.cache.conditional_headers(entry))
+
+        start = time.perf_counter()
+        data_request = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+        elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["request_seconds"] += elapsed
+            self.stats["bytes_downloaded"] += len(data_request.content)
+            if data_request.status_code == 304:
+                self.stats["not_modified"] += 1
+
+        if data_request.status_code == 304 and entry is not None:
+            cached_text = self.cache.read_body(url)
+            if cached_text is not None:
+                self.cache.mark_validated(url)
+                return FetchedPage(url, 200, cached_text, data_request.reason, from_cache=True)
+
+            # the cached body is gone, so the page is requested again without conditions
+            data_request = session.get(url, headers={'User-Agent': get_user_agent_pool().random}, timeout=REQUEST_TIMEOUT)
+
+        if data_request.status_code == 200 and self.cache is not None:
+            self.cache.store(url, data_request.text, data_request.headers)
+
+        return FetchedPage(url, data_request.status_code, data_request.text, data_request.reason, headers=data_request.headers)
+
+    def connection_count(self) -> int:
+
+        """
+        This method counts the connections opened so far by all sessions, which shows how many
+        handshakes were needed for the requests sent.
+
+        Parameters:
+        None
+
+        Returned value:
+        int: number of connections opened
+        """
+
+        with self._lock:
+            sessions = list(self._sessions.values())
+
+        return sum(pool.num_connections for session in sessions for adapter in set(session.adapters.values()) for pool in adapter.poolmanager.pools._container.values())
+
+    def log_stats(self) -> None:
+
+        """
+        This method logs the request counters of the client.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        requests_sent = self.stats["requests"]
+        average = self.stats["request_seconds"] / requests_sent if requests_sent else 0
+        logging.info(f"Scraper client: {requests_sent} requests over {self.connection_count()} connections "
+                     f"({self.stats['sessions']} host sessions), {average:.3f} seconds per request on average, "
+                     f"{self.stats['not_modified']} pages unchanged since cached, {self.stats['bytes_downloaded'] / 1024:.1f} KiB downloaded.")
+
+_scraper_client = None
+_scraper_client_lock = threading.Lock()
+
+def get_scraper_client() -> ScraperClient:
+
+    """
+    This function returns the scraper client of the process, creating it on the first call.
+
+    Parameters:
+    None
+
+    Returned value:
+    ScraperClient: shared scraper client
+    """
+
+    global _scraper_client
+
+    with _scraper_client_lock:
+        if _scraper_client is None:
+            _scraper_client = ScraperClient(PageCache(), PageArchive() if ARCHIVE_FETCHED_PAGES else None)
+
+        return _scraper_client
+
+def replay_archived_run(run_id: str = "latest") -> None:
+
+    """
+    This function switches the scraper to replay mode: from then on, every page is read from the
+    given archived run instead of being requested, with no request-rate limits, so a whole run can
+    be reprocessed with the current parsing rules in seconds.
+
+    Parameters:
+    run_id (str): id of the archived run, or "latest" for the most recent one
+
+    Returned value:
+    None
+    """
+
+    client = get_scraper_client()
+
+    if client.archive is None:
+        client.archive = PageArchive()
+
+    client.replay = client.archive.load_manifest(run_id)
+
+#  ============================= Fetching engine - Concurrent requests ============================= #
+
+def _get_page(url: str) -> FetchedPage:
+
+    """
+    This function sends a blocking request to the given URL through the shared client, holding one
+    of the in-flight slots of its host while the request is running. It is run on a worker thread
+    by the fetching engine.
+
+    Parameters:
+    url (str): URL of the page to be requested
+
+    Returned value:
+    FetchedPage: result of the request
+    """
+
+    with get_host_state(url).in_flight:
+        return get_scraper_client().get(url)
+
+def get_retry_delay(page: FetchedPage | None, attempt: int) -> float:
+
+    """
+    This function computes how long to wait before retrying a failed request: the Retry-After
+    header sent by the server, when there is one, or else an exponential backoff with jitter.
+
+    Parameters:
+    page (FetchedPage | None): result of the failed request (None if the request raised an error)
+    attempt (int): number of the failed attempt, starting at 0
+
+    Returned value:
+    float: number of seconds to wait
+    """
+
+    retry_after = page.headers.get("Retry-After") if page is not None else None
+
+    if retry_after:
+        try:
+            return max(float(retry_after), 0)
+        except ValueError:
+            try:
+                return max((parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds(), 0)
+            except (TypeError, ValueError):
+                pass
+
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt) * random.uniform(0.5, 1.5)
+
+async def _wait_for_slot(rate_limiter: HostRateLimiter, stop: threading.Event = None) -> bool:
+
+    """
+    This coroutine waits for a free request slot of a host. If the host throttled the scraper while
+    waiting, the slot was booked at the old rate and possibly during the pause, so a new slot is
+    booked, until the wait ends without a throttle. The wait is given up if the consumer of the
+    pages stops while it lasts.
+
+    Parameters:
+    rate_limiter (HostRateLimiter): rate limiter of the host
+    stop (threading.Event): event set once the consumer of the pages stops (optional)
+
+    Returned value:
+    bool: True if a slot is free, False if the consumer stopped
+    """
+
+    while True:
+        throttle_count = rate_limiter.throttle_count
+        await asyncio.sleep(rate_limiter.reserve())
+        if stop is not None and stop.is_set():
+            return False
+        if rate_limiter.throttle_count == throttle_count:
+            return True
+
+async def _fetch_page(url: str, blocked: asyncio.Event, stop: threading.Event = None) -> FetchedPage | None:
+
+    """
+    This coroutine waits for a free slot in the request-rate budget of the URL's host, then
+    requests the page on a worker thread. Throttled (403/429) and failed requests are retried
+    after the delay given by get_retry_delay, and throttling also slows down the whole host.
+    If the page is still throttled after all retries, the scraper is considered blocked and no
+    further pages are requested. No request (or retry) is sent once the consumer of the pages stops.
+
+    Parameters:
+    url (str): URL of the page to be requested
+    blocked (asyncio.Event): event set once a host persistently answers with 403 or 429
+    stop (threading.Event): event set once the consumer of the pages stops (optional)
+
+    Returned value:
+    FetchedPage | None: result of the request, or None if the page was skipped
+    """
+
+    if get_scraper_client().replay is not None: # archived pages are read from disk, so no request-rate limits apply
+        return get_scraper_client().get(url)
+
+    rate_limiter = get_host_state(url).rate_limiter
+
+    for attempt in range(MAX_RETRIES + 1):
+
+        if not await _wait_for_slot(rate_limiter, stop) or blocked.is_set():
+            return None
+
+        try:
+            page = await asyncio.to_thread(_get_page, url)
+        except requests.RequestException as e:
+            page, error = None, str(e)
+
+        if page is not None and page.status_code not in RETRY_STATUS_CODES:
+            rate_limiter.record_success()
+            return page
+
+        if attempt == MAX_RETRIES:
+            break
+
+        delay = get_retry_delay(page, attempt)
+
+        if page is not None and page.status_code in [403, 429]:
+            rate_limiter.record_throttle(delay) # the next slot of the host is booked after the pause
+            logging.warning(f"Request to {url} throttled ({page.status_code}). Pausing the host for {delay:.1f} seconds; "
+                            f"request rate lowered to {rate_limiter.requests_per_second:.3f} per second.")
+        else:
+            logging.warning(f"Request to {url} failed ({page.reason if page is not None else error}). Retrying in {delay:.1f} seconds...")
+            await asyncio.sleep(delay)
+
+        if stop is not None and stop.is_set():
+            return None
+
+    if page is None: # the request kept raising errors
+        return FetchedPage(url, 0, "", error)
+
+    if page.status_code in [403, 429]:
+        blocked.set()
+
+    return page
+
+async def _fetch_all_pages(urls: list) -> list:
+
+    """
+    This coroutine schedules the requests of all the given pages and waits for them to finish.
+
+    Parameters:
+    urls (list): list of URLs to be requested
+
+    Returned value:
+    list: list of FetchedPage objects (or None, for the skipped pages), in the same order as the URLs
+    """
+
+    blocked = asyncio.Event()
+    return await asyncio.gather(*(_fetch_page(url, blocked) for url in urls))
+
+def fetch_pages(urls: list) -> list:
+
+    """
+    This function requests all the given pages concurrently. The number of requests in flight and
+    the request rate are bounded for each host, so the politeness settings above hold no matter
+    how many pages are requested. Failed requests are retried; once a host persistently detects
+    the program as a scraper (403 or 429), no further requests are sent.
+
+    Parameters:
+    urls (list): list of URLs to be requested
+
+    Returned value:
+    list: list of FetchedPage objects (or None, for the skipped pages), in the same order as the URLs
+    """
+
+    logging.info(f"Fetching {len(urls)} pages...")
+
+    pages = asyncio.run(_fetch_all_pages(urls))
+    get_scraper_client().log_stats()
+
+    return pages
+
+def fetch_page(url: str) -> FetchedPage:
+
+    """
+    This function requests a single page through the fetching engine, so it follows the same
+    politeness settings as the other requests against its host.
+
+    Parameters:
+    url (str): URL of the page to be requested
+
+    Returned value:
+    FetchedPage: result of the request
+    """
+
+    return fetch_pages([url])[0]
+
+#  ============================== Parsing functions - Character pages ============================== #
+
+PARSER_VERSION = 1 # bump to drop the records cached by previous runs when parsing changes outside the parsing modules (e.g. after a dependency upgrade)
+
+_parser_fingerprint = None
+
+def get_parser_fingerprint() -> str:
+
+    """
+    This function returns the fingerprint of the parsing rules: a hash of PARSER_VERSION and of the
+    source of the modules holding the parsing functions, infobox specs and HTML/wikitext readers.
+    It is stored along with every cached record, so a record is only reused if it was parsed with
+    the current rules, and a parser fix reaches the pages which haven't changed since.
+
+    Parameters:
+    None
+
+    Returned value:
+    str: fingerprint of the parsing rules
+    """
+
+    global _parser_fingerprint
+
+    if _parser_fingerprint is None:
+        digest = hashlib.sha256(str(PARSER_VERSION).encode())
+        for module_path in [__file__, sys.modules[parse_html.__module__].__file__, sys.modules[get_infobox_parameters.__module__].__file__]:
+            with open(module_path, "rb") as f:
+                digest.update(f.read())
+        _parser_fingerprint = digest.hexdigest()[:16]
+
+    return _parser_fingerprint
+
+def get_record_context(args: list) -> dict:
+
+    """
+    This function returns the context a parsed record is cached with: the extra parsing arguments
+    of the page and the fingerprint of the parsing rules.
+
+    Parameters:
+    args (list): extra parsing arguments of the page
+
+    Returned value:
+    dict: context of the record
+    """
+
+    return {"parser": get_parser_fingerprint(), "args": args}
+
+def parse_page(page: FetchedPage, parse_func, *args):
+
+    """
+    This function extracts the character info of a fetched page with the given parsing function.
+    When the page was served from the response cache (i.e. it hasn't changed since the last run),
+    the record parsed back then is reused instead of parsing the page again, unless the parsing
+    rules changed since. Newly parsed records are stored in the cache along with their page.
+
+    Parameters:
+    page (FetchedPage): fetched page
+    parse_func (function): parsing function, which receives the page content and the extra arguments
+    *args: extra arguments of the parsing function, which are also stored along with the cached record
+
+    Returned value:
+    the character info returned by the parsing function
+    """
+
+    record = get_cached_record(page, list(args))
+
+    if record is None:
+        record = parse_func(page.text, *args)
+        store_parsed_record(page, record, list(args))
+
+    return record
+
+def get_cached_record(page: FetchedPage, context: list):
+
+    """
+    This function gets the record parsed from a page served from the response cache.
+
+    Parameters:
+    page (FetchedPage): fetched page
+    context (list): extra parsing arguments of the page
+
+    Returned value:
+    the record parsed by a previous run, or None if the page has to be parsed
+    """
+
+    cache = get_scraper_client().cache
+
+    if page.from_cache and cache is not None:
+        return cache.get_record(page.url, get_record_context(context))
+
+    return None
+
+def store_parsed_record(page: FetchedPage, record, context: list) -> None:
+
+    """
+    This function stores the record parsed from a page along with the cached page. Records parsed
+    from replayed pages aren't stored, since the archived page may be older than the cached one.
+
+    Parameters:
+    page (FetchedPage): fetched page
+    record: parsed record
+    context (list): extra parsing arguments of the page
+
+    Returned value:
+    None
+    """
+
+    client = get_scraper_client()
+
+    if client.cache is not None and client.replay is None:
+        client.cache.store_record(page.url, record, get_record_context(context))
+
+# Parsing target of the character pages: the only part of the page (besides the title) which is built into a tree
+INFOBOX_TARGET = ("aside", "portable-infobox")
+
+# Infobox specs: for each field, the data-source entries of the infobox it can be read from (in
+# order of preference), how its text is read ("text" or "first_line") and the value used when the
+# entry is missing or empty. Fields without a default are required. The transform fixes the text of
+# the rendered page, so it isn't applied to values read from wikitext.
+WUWA_INFOBOX_SPEC = {
+    "gender": {"sources": ["gender"], "read": "text", "default": "Any"}, # Rover is the player's character; they can be a male or a female
+    "region": {"sources": ["nation", "birthplace"], "read": "text", "default": "Unknown"}, # birthplace is used as region info when nation is missing
+    "release_date": {"sources": ["releaseDate"], "read": "first_line", "default": "Unknown"}
+}
+
+ZZZ_INFOBOX_SPEC = {
+    "gender": {"sources": ["gender"], "read": "text", "default": "Any"},
+    "faction": {"sources": ["faction"], "read": "text", "default": "Unknown",
+                "transform": lambda x: x[:(len(x) // 2 + 1)].strip()}, # the faction name is repeated in the infobox
+    "release_date": {"sources": ["releaseDate"], "read": "first_line", "default": "Unknown"}
+}
+
+HSR_INFOBOX_SPEC = {
+    "faction": {"sources": ["faction"], "read": "text"},
+    "release_date": {"sources": ["release_date"], "read": "text"}
+}
+
+def extract_infobox_fields(webpage: BeautifulSoup, spec: dict) -> dict:
+
+    """
+    This function reads the fields of a Fandom portable infobox, as described by a spec. The infobox
+    is walked a single time, collecting every data-source entry into a dictionary, and each field
+    is then resolved from that dictionary (trying its fallback sources in order), instead of
+    searching the whole page once per field.
+
+    Parameters:
+    webpage (BeautifulSoup): parsed character page
+    spec (dict): fields to be read, with their sources, reading mode, default value and optional transform
+
+    Returned value:
+    dict: value of each field
+    """
+
+    # 1. Walking the infobox once
+
+    infobox = webpage.find("aside", class_ = "portable-infobox") or webpage
+    entries = {}
+    for element in infobox.find_all("div", attrs={"data-source" : True}):
+        if element.find("div") is not None:
+            entries.setdefault(element["data-source"], element.find("div"))
+
+    # 2. Resolving each field
+
+    def read_entry(source: str, read: str) -> str:
+        if read == "first_line":
+            return entries[source].get_text(separator = "\n").split("\n")[0]
+        return entries[source].get_text().strip()
+
+    return resolve_infobox_fields(spec, entries, read_entry, rendered = True)
+
+def extract_wikitext_infobox_fields(wikitext: str, spec: dict) -> dict:
+
+    """
+    This function reads the fields of the infobox of a page from its wikitext, as described by the
+    same specs used for the rendered pages: the data-source entries of a portable infobox are the
+    parameters of its template.
+
+    Parameters:
+    wikitext (str): wikitext of the character page
+    spec (dict): fields to be read, with their sources, reading mode, default value and optional transform
+
+    Returned value:
+    dict: value of each field
+    """
+
+    sources = [source for field_spec in spec.values() for source in field_spec["sources"]]
+    entries = {source: wikitext_to_text(value) for source, value in get_infobox_parameters(wikitext, sources).items()}
+
+    def read_entry(source: str, read: str) -> str:
+        if read == "first_line":
+            return entries[source].split("\n")[0]
+        return entries[source].replace("\n", "").strip()
+
+    return resolve_infobox_fields(spec, entries, read_entry, rendered = False)
+
+def resolve_infobox_fields(spec: dict, entries: dict, read_entry, rendered: bool) -> dict:
+
+    """
+    This function resolves the fields of an infobox spec from the entries found in the infobox,
+    trying the fallback sources of each field in order.
+
+    Parameters:
+    spec (dict): fields to be read, with their sources, reading mode, default value and optional transform
+    entries (dict): infobox entries, by data-source
+    read_entry (function): reads the text of an entry, given its data-source and reading mode
+    rendered (bool): if True, the entries come from a rendered page and the transforms are applied
+
+    Returned value:
+    dict: value of each field
+    """
+
+    fields = {}
+    for field, field_spec in spec.items():
+        value = None
+
+        for source in field_spec["sources"]:
+            if source in entries:
+                value = read_entry(source, field_spec["read"])
+                break
+
+        if value and rendered and "transform" in field_spec:
+            value = field_spec["transform"](value)
+
+        if not value and "default" in field_spec:
+            value = field_spec["default"]
+        elif value is None:
+            raise IndexError(f"Infobox field not found: {field}")
+
+        fields[field] = value
+
+    return fields
+
+def parse_wuwa_character_page(page_text: str) -> dict:
+
+    """
+    This function gets the name, gender, region and release date of a Wuthering Waves character
+    from their Fandom wiki entry.
+
+    Parameters:
+    page_text (str): HTML content of the character's page
+
+    Returned value:
+    dict: character info
+    """
+
+    webpage = parse_html(page_text, [("h1", None), INFOBOX_TARGET])
+
+    char_content = {"name": webpage.find_all("h1")[0].get_text().strip()}
+    char_content.update(extract_infobox_fields(webpage, WUWA_INFOBOX_SPEC))
+
+    return char_content
+
+def parse_genshin_character_list(page_text: str) -> list:
+
+    """
+    This function gets the name, gender, region and release date of every Genshin Impact character
+    from the character list of the Fandom wiki.
+
+    Parameters:
+    page_text (str): HTML content of the character list page
+
+    Returned value:
+    list: list of dictionaries containing character info
+    """
+
+    # reading the needed columns of the character table, in a single pass over its rows
+    table = read_table_columns(page_text, 0, {"name": 1, "gender": -3, "region": -4, "release_date": -2},
+                               expand_rowspans = True)
+    names = [name.strip() for name in table["name"]]
+
+    char_info = {
+        "name": names,
+        "gender": ["Any" if name == "Traveler" else gender.strip().split(" ")[1] for name, gender in zip(names, table["gender"])], # Traveler is the player's character, so they can be a male or a female
+        "region": ["Unknown" if region.strip() == "None" else region.strip() for region in table["region"]], # Some characters are from unknown regions, like Traveler and Aloy
+        "release_date": [release_date.strip() if release_date else "Unknown" for release_date in table["release_date"]]
+    }
+
+    return columns_to_records(char_info)
+
+def parse_zzz_character_page(page_text: str) -> dict:
+
+    """
+    This function gets the name, gender, faction and release date of a Zenless Zone Zero character
+    from their Fandom wiki entry.
+
+    Parameters:
+    page_text (str): HTML content of the character's page
+
+    Returned value:
+    dict: character info
+    """
+
+    webpage = parse_html(page_text, [("span", "mw-page-title-main"), INFOBOX_TARGET])
+
+    char_content = {"name": webpage.find_all("span", class_ = "mw-page-title-main")[0].get_text().strip()}
+    char_content.update(extract_infobox_fields(webpage, ZZZ_INFOBOX_SPEC))
+
+    return char_content
+
+def parse_hsr_character_list(page_text: str) -> list:
+
+    """
+    This function gets the name and gender of every Honkai: Star Rail character from the character
+    table of The Gamer.
+
+    Parameters:
+    page_text (str): HTML content of the character table page
+
+    Returned value:
+    list: list of dictionaries containing character info
+    """
+
+    # reading the needed columns of the character table, in a single pass over its rows
+    table = read_table_columns(page_text, 0, {"name": 0, "gender": 2})
+    names = [name.strip() for name in table["name"]]
+
+    char_info = {
+        "name": names,
+        "gender": ["Any" if name == "Trailblazer" else gender.strip().split(" ")[1] for name, gender in zip(names, table["gender"])] # Trailblazer is the player's character, so they can be a male or a female
+    }
+
+    return columns_to_records(char_info)
+
+def parse_hsr_character_page(page_text: str) -> dict:
+
+    """
+    This function gets the faction and release date of a Honkai: Star Rail character from their
+    Fandom wiki entry.
+
+    Parameters:
+    page_text (str): HTML content of the character's page
+
+    Returned value:
+    dict: character info
+    """
+
+    webpage = parse_html(page_text, [INFOBOX_TARGET])
+
+    return extract_infobox_fields(webpage, HSR_INFOBOX_SPEC)
+
+OW_REGION_INDEX = {5: -1, 6: -1, 7: -2} # position of the region cell, by number of cells in the row; longer rows have it at -3
+
+def parse_ow_character_list(page_text: str, char_gender_hash: dict) -> list:
+
+    """
+    This function gets the name, gender, region and release date of every Overwatch 2 character
+    from the hero list of the Fandom wiki.
+
+    Parameters:
+    page_text (str): HTML content of the hero list page
+    char_gender_hash (dict): gender of each character, as listed in the input file
+
+    Returned value:
+    list: list of dictionaries containing character info
+    """
+
+    # reading the needed columns of the hero table, in a single pass over its rows; the source
+    # table isn't a perfect grid, so the position of the region depends on the length of the row
+    table = read_table_columns(page_text, 1, {"name": 2, "region": lambda row: row[OW_REGION_INDEX.get(len(row), -3)], "release_date": -1})
+
+    char_info = {
+        "name": [name.strip().replace("\n", "") for name in table["name"]],
+        "gender": ["Male" if "Aqua" in name else char_gender_hash.get(name.replace("\n", ""), "Male").strip() for name in table["name"]], # Why, Torbjörn?
+        "region": [region.strip().replace("\n", "") for region in table["region"]],
+        "release_date": [release_date.strip() if release_date else "Unknown" for release_date in table["release_date"]]
+    }
+
+    return columns_to_records(char_info)
+
+#  ================================= Parsing engine - Process pool ================================= #
+
+# Parsing settings
+PARSE_WORKERS = os.cpu_count() or 1 # processes parsing pages; 0 parses the pages on the fetching thread
+MAX_PENDING_PAGES = 2 * PARSE_WORKERS + MAX_IN_FLIGHT_PER_HOST # pages being downloaded, parsed or waiting for the consumer; further downloads wait for a free slot
+
+_parse_pool = None
+_parse_pool_lock = threading.Lock()
+
+def get_parse_pool() -> ProcessPoolExecutor | None:
+
+    """
+    This function gets the process pool which parses the fetched pages, creating it on first use.
+    The pool is shared by all extractors. Worker processes are spawned rather than forked, since
+    the extractors run on several threads and forking a multi-threaded process isn't safe.
+
+    Parameters:
+    None
+
+    Returned value:
+    ProcessPoolExecutor | None: process pool, or None if the pages are parsed on the fetching thread
+    """
+
+    global _parse_pool
+
+    if PARSE_WORKERS == 0:
+        return None
+
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers = PARSE_WORKERS, mp_context = multiprocessing.get_context("spawn"))
+            logging.info(f"Parsing pages on {PARSE_WORKERS} processes.")
+
+        return _parse_pool
+
+def shutdown_parse_pool() -> None:
+
+    """
+    This function stops the worker processes of the parse pool, once the extraction is over.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    global _parse_pool
+
+    with _parse_pool_lock:
+        if _parse_pool is not None:
+            _parse_pool.shutdown()
+            _parse_pool = None
+
+async def _fetch_and_parse_page(url: str, parse_func, args: list, blocked: asyncio.Event, on_parsed, stop: threading.Event = None) -> tuple:
+
+    """
+    This coroutine requests a page, then parses it on the process pool while the event loop goes
+    on downloading other pages. The body of the page is dropped once it is parsed, so the results
+    don't keep whole pages in memory.
+
+    Parameters:
+    url (str): URL of the page to be requested
+    parse_func (function): parsing function (must be defined at module level, so it can be sent to another process)
+    args (list): extra arguments of the parsing function
+    blocked (asyncio.Event): event set once a host persistently answers with 403 or 429
+    on_parsed (function): called with the URL and the record as soon as a page is parsed (optional)
+    stop (threading.Event): event set once the consumer of the pages stops (optional)
+
+    Returned value:
+    tuple: FetchedPage (or None, if the page was skipped) and parsed record (or None, if the page wasn't parsed)
+    """
+
+    page = await _fetch_page(url, blocked, stop)
+
+    if page is None or page.status_code != 200:
+        return page, None
+
+    record = get_cached_record(page, args)
+
+    if record is None:
+        pool = get_parse_pool()
+        if pool is None:
+            record = parse_func(page.text, *args)
+        else:
+            record = await asyncio.get_running_loop().run_in_executor(pool, parse_func, page.text, *args)
+        store_parsed_record(page, record, args)
+
+    if on_parsed is not None:
+        on_parsed(url, record)
+
+    return FetchedPage(page.url, page.status_code, "", page.reason, page.from_cache, page.headers), record
+
+async def _fetch_and_parse_all_pages(urls: list, parse_func, args: list, on_parsed, results: queue.Queue, stop: threading.Event) -> None:
+
+    """
+    This coroutine schedules the requests and parsing of all the given pages, and puts each result
+    on the results queue as soon as it is ready. A pending slot is held from the request of a page
+    until its result is taken by the queue, so pages can't pile up in memory when parsing is
+    slower than downloading, or when the consumer of the results is slower than both.
+
+    Parameters:
+    urls (list): list of URLs to be requested
+    parse_func (function): parsing function
+    args (list): extra arguments of the parsing function
+    on_parsed (function): called with the URL and the record as soon as a page is parsed (optional)
+    results (queue.Queue): bounded queue receiving (index, FetchedPage, record) tuples
+    stop (threading.Event): event set once the consumer stops reading the results
+
+    Returned value:
+    None
+    """
+
+    blocked = asyncio.Event()
+    pending = asyncio.Semaphore(MAX_PENDING_PAGES)
+
+    async def fetch_parse_and_queue(index: int, url: str) -> None:
+        async with pending:
+            if stop.is_set():
+                return
+            page, record = await _fetch_and_parse_page(url, parse_func, args, blocked, on_parsed, stop)
+            await asyncio.to_thread(put_until_stopped, results, (index, page, record), stop)
+
+    await asyncio.gather(*(fetch_parse_and_queue(index, url) for index, url in enumerate(urls)))
+
+def iter_fetch_and_parse_pages(urls: list, parse_func, *args, on_parsed = None):
+
+    """
+    This generator requests all the given pages, like fetch_pages, and parses each page as soon as
+    it is downloaded. Parsing is CPU-bound, so it runs on a pool of worker processes: downloads
+    and parsing overlap, and the pages are parsed on every core instead of a single one. The
+    results are yielded in the order of the URLs as soon as they are available, while the next
+    pages are still being fetched on a background thread; results arriving ahead of an earlier,
+    slower page are held (without their page body) until that page is done.
+
+    Parameters:
+    urls (list): list of URLs to be requested
+    parse_func (function): parsing function, which receives the page content and the extra arguments
+    *args: extra arguments of the parsing function
+    on_parsed (function): called with the URL and the record as soon as a page is parsed, e.g. to journal it (optional)
+
+    Returned value:
+    generator: (URL, FetchedPage, record) tuples, in the same order as the URLs; the page is None if it was skipped, and the record is None if the page wasn't parsed
+    """
+
+    logging.info(f"Fetching and parsing {len(urls)} pages...")
+
+    results = queue.Queue(maxsize = MAX_PENDING_PAGES)
+    stop = threading.Event()
+    # the event loop runs on the fetcher thread, and is reached from this one to cancel the fetches; it is created here
+    # by a loop factory, so it doesn't become the event loop of this thread
+    runner = asyncio.Runner(loop_factory = asyncio.new_event_loop)
+    loop = runner.get_loop()
+
+    fetch_tasks = [] # task fetching the pages, cancelled (with every fetch it started) if the consumer stops early
+
+    async def fetch_and_parse_all_pages() -> None:
+        fetch_tasks.append(asyncio.current_task())
+        await _fetch_and_parse_all_pages(urls, parse_func, list(args), on_parsed, results, stop)
+
+    def run_event_loop() -> None:
+        try:
+            with runner:
+                runner.run(fetch_and_parse_all_pages())
+        except asyncio.CancelledError: # the consumer stopped before every page was fetched
+            pass
+        except Exception as e: # forwarded to the consumer
+            put_until_stopped(results, (None, e, None), stop)
+
+    def cancel_fetches() -> None:
+        for task in fetch_tasks:
+            task.cancel()
+
+    fetcher = threading.Thread(target = run_event_loop, name = "fetcher", daemon = True)
+    fetcher.start()
+
+    ready = {}
+    next_index = 0
+
+    try:
+        while next_index < len(urls):
+            index, page, record = results.get()
+            if index is None:
+                raise page
+
+            ready[index] = (page, record)
+            while next_index in ready:
+                page, record = ready.pop(next_index)
+                yield urls[next_index], page, record
+                next_index += 1
+    finally:
+        # the fetches still waiting for a slot or a retry are cancelled, so no further request is sent and the
+        # fetcher only waits for the requests already sent
+        stop.set()
+        if next_index < len(urls):
+            try:
+                loop.call_soon_threadsafe(cancel_fetches)
+            except RuntimeError: # the fetcher already finished and closed its event loop
+                pass
+        fetcher.join()
+        get_scraper_client().log_stats()
+
+#  =========================== Incremental extraction - Change detection =========================== #
+
+API_BATCH_SIZE = 50 # maximum number of titles per MediaWiki API query
+
+def get_page_touched_times(api_url: str, titles: list) -> dict:
+
+    """
+    This function asks the MediaWiki API of a wiki when each of the given pages was last changed.
+    Up to 50 titles are checked with a single request, so checking a whole character list costs
+    a handful of requests instead of one request per character.
+
+    Parameters:
+    api_url (str): URL of the wiki's api.php endpoint
+    titles (list): list of page titles
+
+    Returned value:
+    dict: last change of each page (as a UNIX timestamp), by title; pages which couldn't be checked are left out
+    """
+
+    touched_times = {}
+    batches = [titles[i:i + API_BATCH_SIZE] for i in range(0, len(titles), API_BATCH_SIZE)]
+    urls = [f"{api_url}?action=query&prop=info&format=json&formatversion=2&titles={quote('|'.join(batch))}" for batch in batches]
+
+    for data_request in fetch_pages(urls):
+
+        if data_request is None or data_request.status_code != 200:
+            logging.warning(f"Could not check page changes on {api_url}; the pages will be fetched again.")
+            continue
+
+        query = json.loads(data_request.text).get("query", {})
+        normalized = {item["to"]: item["from"] for item in query.get("normalized", [])}
+
+        for api_page in query.get("pages", []):
+            if "touched" in api_page:
+                title = normalized.get(api_page["title"], api_page["title"])
+                touched = datetime.strptime(api_page["touched"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+                touched_times[title] = touched.timestamp()
+
+    return touched_times
+
+def get_reusable_records(urls: list, names: list, api_url: str, database: str, schema: str) -> dict:
+
+    """
+    This function finds the characters which don't need to be fetched again in incremental mode:
+    characters which are already loaded into the database and whose wiki page hasn't changed since
+    it was cached. Their records are taken from the response cache, so only new characters and
+    characters whose page changed are requested.
+
+    Parameters:
+    urls (list): list of character page URLs
+    names (list): list of character names, in the same order as the URLs
+    api_url (str): URL of the wiki's api.php endpoint
+    database (str): name of the database the game is loaded into
+    schema (str): name of the game schema
+
+    Returned value:
+    dict: cached record of each reusable character, by URL
+    """
+
+    cache = get_scraper_client().cache
+    loaded_names = get_loaded_character_names(database, schema)
+
+    if loaded_names is None:
+        logging.warning(f"Incremental extraction: the characters loaded into {database}.{schema} couldn't be read, every character is fetched again.")
+        return {}
+
+    if cache is None or not loaded_names:
+        return {}
+
+    # 1. Characters already loaded into the database, whose parsed record is cached (and was parsed with the current rules)
+
+    candidates = {}
+    for url, name in zip(urls, names):
+        entry = cache.lookup(url)
+        record = cache.get_record(url, get_record_context([]))
+        if entry is not None and record is not None and record.get("name", name) in loaded_names:
+            title = unquote(url.split("/wiki/")[-1]).replace("_", " ")
+            candidates[title] = (url, record, entry["stored_at"])
+
+    # 2. Keeping only the characters whose page hasn't changed since it was cached
+
+    touched_times = get_page_touched_times(api_url, list(candidates)) if candidates else {}
+    reusable = {url: record for title, (url, record, stored_at) in candidates.items()
+                if title in touched_times and touched_times[title] <= stored_at}
+
+    logging.info(f"Incremental extraction: {len(reusable)} of {len(urls)} characters are unchanged since the last load.")
+
+    return reusable
+
+def log_new_characters(char_info: list, database: str, schema: str) -> None:
+
+    """
+    This function logs which characters of a list page are not loaded into the database yet.
+
+    Parameters:
+    char_info (list): list of dictionaries containing character info
+    database (str): name of the database the game is loaded into
+    schema (str): name of the game schema
+
+    Returned value:
+    None
+    """
+
+    loaded_names = get_loaded_character_names(database, schema)
+
+    if loaded_names is None:
+        logging.warning(f"Incremental extraction: the characters loaded into {database}.{schema} couldn't be read, so the new ones can't be listed.")
+        return
+
+    new_names = [character["name"] for character in char_info if character["name"] not in loaded_names]
+
+    logging.info(f"Incremental extraction: {len(new_names)} new characters since the last load: {', '.join(new_names)}")
+
+#  ================================ Extraction mode - MediaWiki API ================================ #
+
+USE_MEDIAWIKI_API = False # fetch the Fandom character pages as wikitext through api.php, many titles per request, instead of one rendered page at a time
+
+# api.php endpoint of each Fandom wiki fetched one character at a time
+WIKI_API_URLS = {
+    "wuthering_waves": "https://wutheringwaves.fandom.com/api.php",
+    "zenless_zone_zero": "https://zenless-zone-zero.fandom.com/api.php",
+    "honkai_star_rail": "https://honkai-star-rail.fandom.com/api.php"
+}
+
+def get_page_title(url: str) -> str:
+
+    """
+    This function gets the title of a wiki page from its URL.
+
+    Parameters:
+    url (str): URL of the page (https://<wiki>/wiki/<title>)
+
+    Returned value:
+    str: title of the page
+    """
+
+    return unquote(urlparse(url).path.split("/wiki/", 1)[1]).replace("_", " ")
+
+def parse_wuwa_wikitext(title: str, wikitext: str) -> dict:
+
+    """
+    This function gets the name, gender, region and release date of a Wuthering Waves character
+    from the wikitext of their Fandom wiki entry.
+
+    Parameters:
+    title (str): title of the character's page
+    wikitext (str): wikitext of the character's page
+
+    Returned value:
+    dict: character info
+    """
+
+    char_content = {"name": title}
+    char_content.update(extract_wikitext_infobox_fields(wikitext, WUWA_INFOBOX_SPEC))
+
+    return char_content
+
+def parse_zzz_wikitext(title: str, wikitext: str) -> dict:
+
+    """
+    This function gets the name, gender, faction and release date of a Zenless Zone Zero character
+    from the wikitext of their Fandom wiki entry.
+
+    Parameters:
+    title (str): title of the character's page
+    wikitext (str): wikitext of the character's page
+
+    Returned value:
+    dict: character info
+    """
+
+    char_content = {"name": title}
+    char_content.update(extract_wikitext_infobox_fields(wikitext, ZZZ_INFOBOX_SPEC))
+
+    return char_content
+
+def parse_hsr_wikitext(title: str, wikitext: str) -> dict:
+
+    """
+    This function gets the faction and release date of a Honkai: Star Rail character from the
+    wikitext of their Fandom wiki entry.
+
+    Parameters:
+    title (str): title of the character's page
+    wikitext (str): wikitext of the character's page
+
+    Returned value:
+    dict: character info
+    """
+
+    return extract_wikitext_infobox_fields(wikitext, HSR_INFOBOX_SPEC)
+
+def iter_fetch_and_parse_api_pages(api_url: str, urls: list, parse_func, on_parsed = None):
+
+    """
+    This generator gets the given wiki pages through the MediaWiki API of the wiki, as wikitext, and
+    parses them. Up to 50 pages are fetched with a single request, and the wikitext holds none of
+    the navigation, ads and scripts of the rendered pages, so far fewer requests and bytes are
+    needed per character. The results have the same shape as those of iter_fetch_and_parse_pages,
+    so the extractors handle both modes the same way.
+
+    Parameters:
+    api_url (str): URL of the wiki's api.php endpoint
+    urls (list): list of page URLs
+    parse_func (function): parsing function, which receives the title and the wikitext of the page
+    on_parsed (function): called with the URL and the record as soon as a page is parsed, e.g. to journal it (optional)
+
+    Returned value:
+    generator: (URL, FetchedPage, record) tuples, in the same order as the URLs; the page is None if it was skipped, and the record is None if the page wasn't parsed
+    """
+
+    logging.info(f"Fetching {len(urls)} pages through {api_url}...")
+
+    titles = [get_page_title(url) for url in urls]
+    batches = [list(zip(urls, titles))[i:i + API_BATCH_SIZE] for i in range(0, len(urls), API_BATCH_SIZE)]
+    batch_urls = [f"{api_url}?action=query&prop=revisions&rvprop=content&rvslots=main&redirects=1&format=json&formatversion=2"
+                  f"&titles={quote('|'.join(title for _, title in batch))}" for batch in batches]
+
+    for batch, data_request in zip(batches, fetch_pages(batch_urls)):
+
+        if data_request is None or data_request.status_code != 200: # the whole batch failed
+            for url, _ in batch:
+                yield url, data_request, None
+            continue
+
+        # 1. Matching each requested title with the page it resolves to (after normalization and redirects)
+
+        query = json.loads(data_request.text).get("query", {})
+        resolved = {item["from"]: item["to"] for item in query.get("normalized", []) + query.get("redirects", [])}
+        contents = {api_page["title"]: api_page["revisions"][0]["slots"]["main"]["content"]
+                    for api_page in query.get("pages", []) if api_page.get("revisions")}
+
+        # 2. Parsing each page
+
+        for url, title in batch:
+            for _ in range(len(resolved)):
+                if title not in resolved:
+                    break
+                title = resolved[title]
+
+            if title not in contents:
+                yield url, FetchedPage(url, 404, "", "Page not found through the MediaWiki API"), None
+                continue
+
+            record = parse_func(title, contents[title])
+
+            if on_parsed is not None:
+                on_parsed(url, record)
+
+            yield url, FetchedPage(url, 200, "", data_request.reason), record
+
+#  =========================== Extraction records - Compact record type ============================ #
+
+class CharacterRecord:
+
+    """
+    This class holds the info of a character as handed over by the extraction functions. Its fixed
+    set of fields is stored in slots instead of a per-instance dictionary, so a record takes several
+    times less memory than a dict holding the same values. Fields are read and written as dictionary
+    keys (record["name"], record.get("faction")), so records can be used wherever character
+    dictionaries were; the fields a game doesn't have are None.
+    """
+
+    __slots__ = ("name", "gender", "region", "faction", "release_date")
+
+    def __init__(self, **fields) -> None:
+
+        for field in self.__slots__:
+            setattr(self, field, fields.get(field))
+
+    def __getitem__(self, field: str):
+
+        if field not in self.__slots__:
+            raise KeyError(field)
+
+        return getattr(self, field)
+
+    def __setitem__(self, field: str, value) -> None:
+
+        if field not in self.__slots__:
+            raise KeyError(field)
+
+        setattr(self, field, value)
+
+    def get(self, field: str, default = None):
+
+        """
+        This method returns the value of a field, or the default value if the field is empty.
+
+        Parameters:
+        field (str): name of the field
+        default: value returned if the field is empty
+
+        Returned value:
+        value of the field
+        """
+
+        value = getattr(self, field, None) if field in self.__slots__ else None
+
+        return default if value is None else value
+
+    def update(self, fields: dict) -> None:
+
+        """
+        This method sets the given fields, like dict.update.
+
+        Parameters:
+        fields (dict): values of the fields to be set
+
+        Returned value:
+        None
+        """
+
+        for field, value in fields.items():
+            self[field] = value
+
+    def to_dict(self) -> dict:
+
+        """
+        This method returns the non-empty fields of the record as a dictionary.
+
+        Parameters:
+        None
+
+        Returned value:
+        dict: fields of the record
+        """
+
+        return {field: getattr(self, field) for field in self.__slots__ if getattr(self, field) is not None}
+
+    def __repr__(self) -> str:
+        return f"CharacterRecord({self.to_dict()})"
+
+#  ============================== Extraction functions - Web Scraping ============================== #
+
+def iter_wuwa_char_info_from_web(incremental: bool = False):
+
+    """
+    This generator extracts info from playable characters belonging to the game Wuthering Waves
+    from the Fandom wiki. It gets a list of currently active characters and, for each character,
+    it enters their Fandom wiki entry, get their name, gender, location and release date, and
+    yields the info as soon as it is collected, in the order of the character list.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    generator: info of each character (CharacterRecord)
+    """
+
+    logging.info("Starting collection of character data from game: Wuthering Waves...")
+
+    # 1. Getting list of active characters
+
+    with open("data_input/character_list_wuwa.txt", "r") as cf:
+        char_names = [character.replace('\n', '') for character in cf.readlines()] # removes next line character so that it can be used in the URL
+
+    journal = ExtractionJournal("wuthering_waves")
+    completed = journal.completed()
+
+    # 2. Fetching all character pages, which are parsed as soon as they are downloaded; the fetching engine takes care of the request rate
+
+    urls = [f"https://wutheringwaves.fandom.com/wiki/{character.replace(' ', '_')}" for character in char_names]
+    reusable = get_reusable_records(urls, char_names, WIKI_API_URLS["wuthering_waves"], "kuro_games_characters", "wuthering_waves") if incremental else {}
+    urls_to_fetch = [url for url in urls if url not in reusable and url not in completed]
+    if USE_MEDIAWIKI_API:
+        fetched = iter_fetch_and_parse_api_pages(WIKI_API_URLS["wuthering_waves"], urls_to_fetch, parse_wuwa_wikitext, on_parsed = journal.append)
+    else:
+        fetched = iter_fetch_and_parse_pages(urls_to_fetch, parse_wuwa_character_page, on_parsed = journal.append)
+
+    # 3. Collecting info from each character
+
+    blocked = False
+
+    for character, url in zip(char_names, urls):
+
+        logging.info(f"Extracting info for character: {character}")
+
+        if url in completed: # character collected by a previous, interrupted run
+            yield CharacterRecord(**completed[url])
+            continue
+
+        if url in reusable: # character unchanged since the last load
+            yield CharacterRecord(**reusable[url])
+            continue
+
+        _, data_request, char_content = next(fetched) # results come in the order of the URLs
+
+        if data_request is None: # page skipped after the scraper was detected
+            continue
+
+        if data_request.status_code == 200: # the record was journaled as soon as it was parsed
+            logging.info("Character info collected successfully.")
+
+            yield CharacterRecord(**char_content)
+
+        elif data_request.status_code in [403, 429]: # pages fetched before the detection are still collected
+            blocked = True
+        else:
+            print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
+
+    if blocked: # If the program is persistently blocked, the run is aborted; the journal keeps the collected characters for the next run
+        logging.fatal("System detected as a scraper! Terminating program...")
+        raise ScraperBlockedError("Scraper persistently blocked by the Wuthering Waves wiki.")
+
+    journal.clear() # every record was handed over
+
+def iter_genshin_char_info_from_web(incremental: bool = False):
+
+    """
+    This generator extracts info from playable characters belonging to the game Genshin Impact
+    from the Fandom wiki. It accesses the character list from the site, then, for each character in
+    the general playable character list, get their name, gender, location and release date, and
+    yields the info of each character.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    generator: info of each character (CharacterRecord)
+    """
+
+    logging.info("Starting collection of character data from game: Genshin Impact...")
+
+    char_info = []
+
+    logging.info(f"Extracting character info table...")
+
+    # 1. Accessing character list from Fandom wiki
+
+    url = f"https://genshin-impact.fandom.com/wiki/Character/List"
+    data_request = fetch_page(url)
+    
+    # 2. Extracting info from each character
+
+    if data_request.status_code == 200:
+        char_info = [CharacterRecord(**char) for char in parse_page(data_request, parse_genshin_character_list)]
+        if incremental:
+            log_new_characters(char_info, "hoyo_characters", "genshin_impact")
+    elif data_request.status_code in [403, 429]: # If the program is persistently blocked, the run is aborted
+        logging.fatal("System detected as a scraper! Terminating program...")
+        raise ScraperBlockedError("Scraper persistently blocked by the Genshin Impact wiki.")
+    else:
+        print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
+
+    yield from char_info
+
+def iter_zzz_char_info_from_web(incremental: bool = False):
+
+    """
+    This generator extracts info from playable characters belonging to the game Zenless Zone Zero
+    from the Fandom wiki. It gets a list of currently active characters and, for each character,
+    it enters their Fandom wiki entry, get their name, gender, location and release date, and
+    yields the info as soon as it is collected, in the order of the character list.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    generator: info of each character (CharacterRecord)
+    """
+
+    logging.info("Starting collection of character data from game: Zenless Zone Zero...")
+
+    # 1. Getting list of active characters
+
+    with open("data_input/character_list_zzz.txt", "r") as cf:
+        char_names = [character.replace('\n', '') for character in cf.readlines()] # removes next line character so that it can be used in the URL
+
+    journal = ExtractionJournal("zenless_zone_zero")
+    completed = journal.completed()
+
+    # 2. Fetching all character pages, which are parsed as soon as they are downloaded; the fetching engine takes care of the request rate
+
+    urls = [f"https://zenless-zone-zero.fandom.com/wiki/{character.replace(' ', '_')}" for character in char_names]
+    reusable = get_reusable_records(urls, char_names, WIKI_API_URLS["zenless_zone_zero"], "hoyo_characters", "zenless_zone_zero") if incremental else {}
+    urls_to_fetch = [url for url in urls if url not in reusable and url not in completed]
+    if USE_MEDIAWIKI_API:
+        fetched = iter_fetch_and_parse_api_pages(WIKI_API_URLS["zenless_zone_zero"], urls_to_fetch, parse_zzz_wikitext, on_parsed = journal.append)
+    else:
+        fetched = iter_fetch_and_parse_pages(urls_to_fetch, parse_zzz_character_page, on_parsed = journal.append)
+
+    # 3. Collecting info from each character
+
+    blocked = False
+
+    for character, url in zip(char_names, urls):
+
+        logging.info(f"Extracting info for character: {character}")
+
+        if url in completed: # character collected by a previous, interrupted run
+            yield CharacterRecord(**completed[url])
+            continue
+
+        if url in reusable: # character unchanged since the last load
+            yield CharacterRecord(**reusable[url])
+            continue
+
+        _, data_request, char_content = next(fetched) # results come in the order of the URLs
+
+        if data_request is None: # page skipped after the scraper was detected
+            continue
+
+        if data_request.status_code == 200: # the record was journaled as soon as it was parsed
+            logging.info("Character info collected successfully.")
+
+            yield CharacterRecord(**char_content)
+
+        elif data_request.status_code in [403, 429]: # pages fetched before the detection are still collected
+            blocked = True
+        else:
+            print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
+
+    if blocked: # If the program is persistently blocked, the run is aborted; the journal keeps the collected characters for the next run
+        logging.fatal("System detected as a scraper! Terminating program...")
+        raise ScraperBlockedError("Scraper persistently blocked by the Zenless Zone Zero wiki.")
+
+    journal.clear() # every record was handed over
+
+def iter_hsr_char_info_from_web(incremental: bool = False):
+
+    """
+    This generator extracts info from playable characters belonging to the game Honkai: Star Rail
+    from the Fandom wiki. First, it retrieves a list of currently active characters from another 
+    website, then, for each character, it enters their Fandom wiki entry, get their name, gender, 
+    location and release date, and yields the info as soon as it is collected, in the order of the
+    character list.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    generator: info of each character (CharacterRecord)
+    """
+
+    logging.info("Starting collection of character data from game: Honkai: Star Rail...")
+
+    char_info = []
+
+    logging.info(f"Extracting character info table...")
+
+    ##### A. Getting character list
+
+    # 1. Accessing character list from The Gamer
+
+    journal = ExtractionJournal("honkai_star_rail")
+    completed = journal.completed()
+
+    url = f"https://www.thegamer.com/honkai-star-rail-playable-character-age-height-path-element/"
+    data_request = None if url in completed else fetch_page(url)
+    
+    # 2. Extracting info from character table
+
+    if url in completed: # character list collected by a previous, interrupted run
+        char_info = completed[url]
+    elif data_request.status_code == 200:
+        char_info = parse_page(data_request, parse_hsr_character_list)
+        journal.append(url, char_info)
+    elif data_request.status_code in [403, 429]: # If the program is persistently blocked, the run is aborted
+        logging.fatal("System detected as a scraper! Terminating program...")
+        raise ScraperBlockedError("Scraper persistently blocked by The Gamer.")
+    else:
+        print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
+
+    char_info = [CharacterRecord(**character) for character in char_info]
+
+    ##### B. Getting info for each character
+
+    urls = [f"https://honkai-star-rail.fandom.com/wiki/{character['name'].replace(' ', '_').replace('and', '%26')}" for character in char_info]
+    reusable = get_reusable_records(urls, [character["name"] for character in char_info], WIKI_API_URLS["honkai_star_rail"], "hoyo_characters", "honkai_star_rail") if incremental else {}
+    urls_to_fetch = [url for url in urls if url not in reusable and url not in completed]
+    if USE_MEDIAWIKI_API:
+        fetched = iter_fetch_and_parse_api_pages(WIKI_API_URLS["honkai_star_rail"], urls_to_fetch, parse_hsr_wikitext, on_parsed = journal.append)
+    else:
+        fetched = iter_fetch_and_parse_pages(urls_to_fetch, parse_hsr_character_page, on_parsed = journal.append)
+
+    blocked = False
+
+    for character, url in zip(char_info, urls):
+
+        char_name = character["name"]
+
+        logging.info(f"Extracting info for character: {char_name}")
+
+        if url in completed: # character collected by a previous, interrupted run
+            character.update(completed[url])
+            yield character
+            continue
+
+        if url in reusable: # character unchanged since the last load
+            character.update(reusable[url])
+            yield character
+            continue
+
+        _, data_request, char_content = next(fetched) # results come in the order of the URLs
+
+        if data_request is None: # page skipped after the scraper was detected; the character is kept without faction and release date
+            yield character
+            continue
+
+        if data_request.status_code == 200: # the record was journaled as soon as it was parsed
+            # adding faction and release date to the character's dictionary
+            character.update(char_content)
+
+            logging.info("Character info collected successfully.")
+
+        elif data_request.status_code in [403, 429]: # pages fetched before the detection are still collected
+            blocked = True
+        else:
+            print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
+
+        yield character
+
+    if blocked: # If the program is persistently blocked, the run is aborted; the journal keeps the collected characters for the next run
+        logging.fatal("System detected as a scraper! Terminating program...")
+        raise ScraperBlockedError("Scraper persistently blocked by the Honkai: Star Rail wiki.")
+
+    journal.clear() # every record was handed over
+
+def iter_ow_char_info_from_web(incremental: bool = False):
+
+    """
+    This generator extracts info from playable characters belonging to the game Overwatch 2
+    from the Fandom wiki. First, it gets a list of currently active characters, where gender 
+    info is available, and converts it into a dictionary. Second, it accesses the character 
+    list from the site. Then, for each character in the general playable character list, gets 
+    their name, location and release date, and add the info to a list, using the dictionary
+    to add the gender. Finally, it yields the info of each character.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    generator: info of each character (CharacterRecord)
+    """
+
+    logging.info("Starting collection of character data from game: Overwatch 2...")
+
+    char_info = []
+    char_gender_hash = {}
+    with open("data_input/character_list_ow.txt", "r") as cf:
+        char_names = cf.readlines()
+
+    for character in char_names:
+        character = character.replace('\n', '')
+        char_name, char_gender = character.split("-")
+        char_name = char_name.strip()
+        char_gender = char_gender.strip()
+        char_gender_hash[char_name] = char_gender
+
+    logging.info(f"Extracting character info table...")
+
+    # Accessing character list from Fandom wiki
+
+    url = "https://overwatch.fandom.com/wiki/Heroes"
+    data_request = fetch_page(url)
+    
+    # 2. Extracting info from each character
+
+    if data_request.status_code == 200:
+        char_info = [CharacterRecord(**char) for char in parse_page(data_request, parse_ow_character_list, char_gender_hash)]
+        if incremental:
+            log_new_characters(char_info, "blizzard_characters", "overwatch_2")
+    elif data_request.status_code in [403, 429]: # If the program is persistently blocked, the run is aborted
+        logging.fatal("System detected as a scraper! Terminating program...")
+        raise ScraperBlockedError("Scraper persistently blocked by the Overwatch wiki.")
+    else:
+        print(f"Could not retrieve page content. The following error was returned: {data_request.reason}")
+
+    yield from char_info
+
+#  =============================== Extraction output - Stage handoff =============================== #
+
+# Columns of the character data file of each game
+CHARACTER_DATA_COLUMNS = {
+    "wuthering_waves": ["name", "gender", "region", "release_date"],
+    "genshin_impact": ["name", "gender", "region", "release_date"],
+    "zenless_zone_zero": ["name", "gender", "faction", "release_date"],
+    "honkai_star_rail": ["name", "gender", "faction", "release_date"],
+    "overwatch_2": ["name", "gender", "region", "release_date"]
+}
+
+CHARACTER_DATA_CATEGORICAL = ["gender", "region", "faction", "release_date"] # columns with few distinct values (many characters share a release date)
+
+def extract_wuwa_char_info_from_web(incremental: bool = False) -> None:
+
+    """
+    This function extracts the info of every Wuthering Waves character and hands it to the next step,
+    writing each character as soon as it is collected when the steps run in separate processes.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    None
+    """
+
+    get_stage_store().put_records("wuthering_waves_character_data", iter_wuwa_char_info_from_web(incremental), CHARACTER_DATA_COLUMNS["wuthering_waves"],
+                                   CHARACTER_DATA_CATEGORICAL)
+
+    logging.info("Info of characters successfully extracted. Finishing program...")
+
+def extract_genshin_char_info_from_web(incremental: bool = False) -> None:
+
+    """
+    This function extracts the info of every Genshin Impact character and hands it to the next step,
+    writing each character as soon as it is collected when the steps run in separate processes.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    None
+    """
+
+    get_stage_store().put_records("genshin_impact_character_data", iter_genshin_char_info_from_web(incremental), CHARACTER_DATA_COLUMNS["genshin_impact"],
+                                   CHARACTER_DATA_CATEGORICAL)
+
+    logging.info("Info of characters successfully extracted. Finishing program...")
+
+def extract_zzz_char_info_from_web(incremental: bool = False) -> None:
+
+    """
+    This function extracts the info of every Zenless Zone Zero character and hands it to the next step,
+    writing each character as soon as it is collected when the steps run in separate processes.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    None
+    """
+
+    get_stage_store().put_records("zenless_zone_zero_character_data", iter_zzz_char_info_from_web(incremental), CHARACTER_DATA_COLUMNS["zenless_zone_zero"],
+                                   CHARACTER_DATA_CATEGORICAL)
+
+    logging.info("Info of characters successfully extracted. Finishing program...")
+
+def extract_hsr_char_info_from_web(incremental: bool = False) -> None:
+
+    """
+    This function extracts the info of every Honkai: Star Rail character and hands it to the next step,
+    writing each character as soon as it is collected when the steps run in separate processes.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    None
+    """
+
+    get_stage_store().put_records("honkai_star_rail_character_data", iter_hsr_char_info_from_web(incremental), CHARACTER_DATA_COLUMNS["honkai_star_rail"],
+                                   CHARACTER_DATA_CATEGORICAL)
+
+    logging.info("Info of characters successfully extracted. Finishing program...")
+
+def extract_ow_char_info_from_web(incremental: bool = False) -> None:
+
+    """
+    This function extracts the info of every Overwatch 2 character and hands it to the next step,
+    writing each character as soon as it is collected when the steps run in separate processes.
+
+    Parameters:
+    incremental (bool): if True, characters already loaded into the database are only fetched again when their page changed
+
+    Returned value:
+    None
+    """
+
+    get_stage_store().put_records("overwatch_2_character_data", iter_ow_char_info_from_web(incremental), CHARACTER_DATA_COLUMNS["overwatch_2"],
+                                   CHARACTER_DATA_CATEGORICAL)
+
+    logging.info("Info of characters successfully extracted. Finishing program...")
+
+#  ============================= Extraction scheduler - Parallel games ============================= #
+
+def run_extractors_concurrently(extractors: list, *args) -> None:
+
+    """
+    This function runs the given extractors at the same time, each one on its own thread. Since the
+    games are scraped from different hosts and the politeness controls (rate budget and in-flight
+    requests) are kept per host and shared by all threads, running them together doesn't raise the
+    request rate against any single wiki; the extraction takes about as long as the slowest game.
+    If any extractor fails, the others are still allowed to finish (and save their output) before
+    the first error is raised.
+
+    Parameters:
+    extractors (list): list of extraction functions
+    *args: arguments passed to every extraction function
+
+    Returned value:
+    None
+    """
+
+    errors = []
+
+    with ThreadPoolExecutor(max_workers=len(extractors), thread_name_prefix="extractor") as executor:
+        futures = {executor.submit(extractor, *args): extractor.__name__ for extractor in extractors}
+
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Extractor {futures[future]} failed: {e}")
+                errors.append(e)
+
+    shutdown_parse_pool() # the worker processes aren't needed once every extractor is done
+
+    if errors:
+        raise errors[0]
\ No newline at end of file
@@ -0,0 +1,454 @@
+import csv
+import logging
+import os
+import threading
+import pandas as pd
+
+#  ================================ Stage handoff - Stage file format ============================== #
+
+# Optional dependency: pyarrow writes the stage files as Parquet, a compressed columnar format with an
+# explicit schema, read back memory-mapped and only for the needed columns; without it, CSV is used
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+STAGE_DIR = "temp"
+STAGE_FORMAT = "parquet" if PYARROW_AVAILABLE else "csv" # format of the files handed between steps
+STAGE_COMPRESSION = "zstd" # compression codec of the Parquet files
+STAGE_ROW_GROUP_SIZE = 256 # records buffered by the extraction before they are written as a Parquet row group
+STAGE_CHUNK_SIZE = 100000 # rows held in memory at a time by the steps reading or writing a table in chunks
+IN_MEMORY_STAGES = False # keep the tables handed between the ETL steps in memory; set when every step runs in the same process
+
+def get_stage_schema(name: str, columns: list):
+
+    """
+    This function returns the schema a stage table is written with, so its types never depend on
+    what is inferred from the data: dimension ids are 32-bit integers, the normalized release dates
+    of the facts tables are dates and every other column (including the release dates as shown on
+    the wikis) is a string.
+
+    Parameters:
+    name (str): name of the table
+    columns (list): columns of the table
+
+    Returned value:
+    pa.Schema: schema of the table
+    """
+
+    fields = []
+
+    for column in columns:
+        if column.endswith("_id"):
+            fields.append(pa.field(column, pa.int32()))
+        elif column == "release_date" and name.endswith("_facts_table"):
+            fields.append(pa.field(column, pa.date32()))
+        else:
+            fields.append(pa.field(column, pa.string()))
+
+    return pa.schema(fields)
+
+def to_arrow_table(df: pd.DataFrame, schema):
+
+    """
+    This function converts a DataFrame to an Arrow table with the given schema. Date columns may
+    hold either datetimes or "%Y-%m-%d" strings.
+
+    Parameters:
+    df (pd.DataFrame): table
+    schema (pa.Schema): schema of the table
+
+    Returned value:
+    pa.Table: Arrow table
+    """
+
+    arrays = []
+
+    for field in schema:
+        values = df[field.name]
+        if pa.types.is_date32(field.type) and not pd.api.types.is_datetime64_any_dtype(values):
+            arrays.append(pa.array(values, type = pa.string(), from_pandas = True).cast(pa.date32()))
+        else:
+            arrays.append(pa.array(values, from_pandas = True).cast(field.type))
+
+    return pa.Table.from_arrays(arrays, schema = schema)
+
+class RecordWriter:
+
+    """
+    This class appends records to a CSV stage output as they arrive, instead of building a DataFrame
+    of all of them at the end. Each row is flushed as soon as it is written, so the file can be read
+    while the extraction is still running, and memory use doesn't depend on the number of records.
+    The file has the same layout as the other stage outputs (header, no index column).
+    """
+
+    def __init__(self, path: str, columns: list) -> None:
+
+        self.path = path
+        self.columns = columns
+        self.count = 0
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file, lineterminator=os.linesep)
+        self._writer.writerow(columns)
+
+    def write(self, record: dict) -> None:
+
+        """
+        This method appends a record to the file. Missing fields are left empty.
+
+        Parameters:
+        record (dict): record to be written
+
+        Returned value:
+        None
+        """
+
+        self._writer.writerow([record.get(column) for column in self.columns])
+        self._file.flush()
+        self.count += 1
+
+    def close(self) -> None:
+
+        """
+        This method closes the file.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+class ParquetRecordWriter:
+
+    """
+    This class appends records to a Parquet stage output as they arrive. Records are buffered and
+    written as a row group every STAGE_ROW_GROUP_SIZE records, so memory use doesn't depend on the
+    number of records. It has the same interface as RecordWriter.
+    """
+
+    def __init__(self, path: str, schema) -> None:
+
+        self.path = path
+        self.schema = schema
+        self.count = 0
+        self._buffer = []
+        self._writer = pq.ParquetWriter(path, schema, compression = STAGE_COMPRESSION)
+
+    def write(self, record: dict) -> None:
+
+        """
+        This method appends a record to the file. Missing fields are left empty.
+
+        Parameters:
+        record (dict): record to be written
+
+        Returned value:
+        None
+        """
+
+        self._buffer.append(record)
+        self.count += 1
+
+        if len(self._buffer) >= STAGE_ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+
+        """
+        This method writes the buffered records as a row group.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        if self._buffer:
+            columns = {column: [record.get(column) for record in self._buffer] for column in self.schema.names}
+            self._writer.write_table(pa.Table.from_pydict(columns, schema = self.schema))
+            self._buffer = []
+
+    def close(self) -> None:
+
+        """
+        This method writes the remaining records and closes the file.
+
+        Parameters:
+        None
+
+        Returned value:
+        None
+        """
+
+        self._flush()
+        self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+#  ================================= Stage handoff - Tables store ================================== #
+
+class StageStore:
+
+    """
+    This class hands the tables of each game from one ETL step to the next. When the steps run in
+    the same process (etl_main.py), the DataFrames are kept in memory and passed as they are, so no
+    time is spent writing and parsing files and the dtypes of the columns are kept. When each step
+    runs in its own process (the Airflow tasks), the tables are written to the temp folder as Parquet
+    files with a pinned schema (CSV files without index column if pyarrow isn't installed). A table
+    which isn't held in memory is read from the temp folder, so a step can always pick up the files
+    left by a previous run.
+    """
+
+    def __init__(self, in_memory: bool = False, stage_dir: str = STAGE_DIR) -> None:
+
+        self.in_memory = in_memory
+        self.stage_dir = stage_dir
+        self._tables = {}
+
+    def path(self, name: str, file_format: str = None) -> str:
+
+        """
+        This method returns the path of the file holding a table.
+
+        Parameters:
+        name (str): name of the table
+        file_format (str): "parquet" or "csv" (STAGE_FORMAT if None)
+
+        Returned value:
+        str: path of the file
+        """
+
+        return os.path.join(self.stage_dir, f"{name}.{file_format or STAGE_FORMAT}")
+
+    def put(self, name: str, df: pd.DataFrame) -> None:
+
+        """
+        This method saves a table for the next step.
+
+        Parameters:
+        name (str): name of the table
+        df (pd.DataFrame): table
+
+        Returned value:
+        None
+        """
+
+        if self.in_memory:
+            self._tables[name] = df
+        elif STAGE_FORMAT == "parquet":
+            pq.write_table(to_arrow_table(df, get_stage_schema(name, list(df.columns))), self.path(name), compression = STAGE_COMPRESSION)
+        else:
+            df.to_csv(self.path(name), index = False)
+
+    def put_records(self, name: str, records, columns: list, categorical: list = None) -> int:
+
+        """
+        This method saves the records of a generator as a table for the next step. When the table is
+        written to a file, each record is written as soon as it is produced.
+
+        Parameters:
+        name (str): name of the table
+        records (iterable): records to be saved, e.g. an extraction generator
+        columns (list): columns of the table
+        categorical (list): columns with few distinct values, held as categoricals in memory
+
+        Returned value:
+        int: number of records saved
+        """
+
+        if self.in_memory:
+            df = pd.DataFrame([[record.get(column) for column in columns] for record in records], columns = columns)
+            self._tables[name] = df.astype({column: "category" for column in categorical or [] if column in columns})
+            return len(df)
+
+        if STAGE_FORMAT == "parquet":
+            writer = ParquetRecordWriter(self.path(name), get_stage_schema(name, columns))
+        else:
+            writer = RecordWriter(self.path(name), columns)
+
+        with writer:
+            for record in records:
+                writer.write(record)
+
+        return writer.count
+
+    def put_chunks(self, name: str, chunks) -> int:
+
+        """
+        This method saves a table produced in chunks for the next step. When the table is written to
+        a file, each chunk is written as soon as it is produced (as a Parquet row group or appended
+        CSV rows), so only one chunk is held in memory at a time.
+
+        Parameters:
+        name (str): name of the table
+        chunks (iterable): DataFrames with the same columns, e.g. a generator
+
+        Returned value:
+        int: number of rows saved
+        """
+
+        if self.in_memory:
+            df = pd.concat(list(chunks))
+            self._tables[name] = df
+            return len(df)
+
+        writer = None
+        first_chunk = True
+        count = 0
+
+        try:
+            for chunk in chunks:
+                if STAGE_FORMAT == "parquet":
+                    if writer is None:
+                        schema = get_stage_schema(name, list(chunk.columns))
+                        writer = pq.ParquetWriter(self.path(name), schema, compression = STAGE_COMPRESSION)
+                    writer.write_table(to_arrow_table(chunk, schema))
+                else:
+                    chunk.to_csv(self.path(name), index = False, mode = "w" if first_chunk else "a", header = first_chunk)
+                first_chunk = False
+                count += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return count
+
+    def get(self, name: str, columns: list = None) -> pd.DataFrame:
+
+        """
+        This method gets a table saved by the previous step. Parquet files are memory-mapped and
+        only the requested columns are read.
+
+        Parameters:
+        name (str): name of the table
+        columns (list): columns to be read (every column if None)
+
+        Returned value:
+        pd.DataFrame: table
+        """
+
+        if name in self._tables:
+            df = self._tables[name]
+            return df if columns is None else df[columns]
+
+        if PYARROW_AVAILABLE and os.path.exists(self.path(name, "parquet")):
+            return pq.read_table(self.path(name, "parquet"), columns = columns, memory_map = True).to_pandas(date_as_object = False)
+
+        df = pd.read_csv(self.path(name, "csv"), usecols = columns)
+
+        # files written by earlier versions have one index column per round-trip
+        return df.drop(columns = [column for column in df.columns if column.startswith("Unnamed")])
+
+    def iter_chunks(self, name: str, chunk_size: int = STAGE_CHUNK_SIZE, columns: list = None):
+
+        """
+        This generator reads a table saved by the previous step in chunks, so only one chunk is held
+        in memory at a time. The chunks are indexed by their row numbers in the whole table, and an
+        empty table is read as one empty chunk.
+
+        Parameters:
+        name (str): name of the table
+        chunk_size (int): maximum number of rows of each chunk
+        columns (list): columns to be read (every column if None)
+
+        Returned value:
+        generator: DataFrame of each chunk
+        """
+
+        if name in self._tables:
+            df = self.get(name, columns)
+            chunks = (df.iloc[start:start + chunk_size] for start in range(0, len(df), chunk_size))
+        elif PYARROW_AVAILABLE and os.path.exists(self.path(name, "parquet")):
+            batches = pq.ParquetFile(self.path(name, "parquet"), memory_map = True).iter_batches(batch_size = chunk_size, columns = columns)
+            chunks = (batch.to_pandas(date_as_object = False) for batch in batches)
+        else:
+            chunks = pd.read_csv(self.path(name, "csv"), usecols = columns, chunksize = chunk_size)
+
+        offset = 0
+        empty = True
+
+        for chunk in chunks:
+            # files written by earlier versions have one index column per round-trip
+            chunk = chunk.drop(columns = [column for column in chunk.columns if column.startswith("Unnamed")])
+            chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+            offset += len(chunk)
+            empty = False
+            yield chunk
+
+        if empty:
+            yield self.get(name, columns).iloc[:0]
+
+    def delete(self, name: str) -> None:
+
+        """
+        This method deletes a table once it isn't needed anymore.
+
+        Parameters:
+        name (str): name of the table
+
+        Returned value:
+        None
+        """
+
+        if self._tables.pop(name, None) is not None:
+            return
+
+        for file_format in ["parquet", "csv"]:
+            if os.path.exists(self.path(name, file_format)):
+                os.remove(self.path(name, file_format))
+
+_stage_store = None
+_stage_store_lock = threading.Lock()
+
+def get_stage_store() -> StageStore:
+
+    """
+    This function returns the stage store of the process, creating it on the first call.
+
+    Parameters:
+    None
+
+    Returned value:
+    StageStore: shared stage store
+    """
+
+    global _stage_store
+
+    with _stage_store_lock:
+        if _stage_store is None:
+            _stage_store = StageStore(IN_MEMORY_STAGES)
+
+        return _stage_store
+
+def keep_stages_in_memory() -> None:
+
+    """
+    This function makes the ETL steps hand their tables in memory from then on. It is meant for
+    runs where every step is done by the same process.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    get_stage_store().in_memory = True
+
+    logging.info("Handing tables between ETL steps in memory.")
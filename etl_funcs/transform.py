@@ -1,382 +1,680 @@
-import pandas as pd
-from datetime import datetime
-import logging
-
-#  ==================================== Transformation functions =================================== #
-
-def transform_hsr_char_info() -> None:
-
-    """
-    This function gets the generated CSV containing info of Honkai: Star Rail characters and processes
-    the faction and release_date fields for each character, removing unnecessary information. After filtering,
-    it updates the transformed CSV.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Cleaning character data from game: Honkai: Star Rail...")
-
-    # Load file
-    hsr_char_df = pd.read_csv("temp/honkai_star_rail_character_data.csv")
-
-    # Formatting and cleaning faction data
-    top_faction_getter = lambda x: x.split("(")[0]
-    hsr_char_df["faction"] = hsr_char_df["faction"].apply(top_faction_getter)
-
-    # Formatting and cleaning release date
-    release_date_getter = lambda x: x[:x.index(",") + 6]
-    hsr_char_df["release_date"] = hsr_char_df["release_date"].apply(release_date_getter)
-
-    # Saving transformed DataFrame
-    hsr_char_df.to_csv("temp/honkai_star_rail_character_data.csv")
-
-    logging.info("Cleaning done.")
-
-def transform_ow_char_info() -> None:
-
-    """
-    This function gets the generated CSV containing info of Overwatch characters and processes
-    the region and release_date fields for each character. After filtering,
-    it updates the transformed CSV.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Cleaning character data from game: Overwatch 2...")
-
-    # Load file
-    ow_char_df = pd.read_csv("temp/overwatch_2_character_data.csv")
-
-    # 1. Convert dataframe to a list of dictionaries
-    char_info = []
-    for row in ow_char_df.itertuples():
-        char_info.append({"name" : row.name, 
-                          "gender" : row.gender, 
-                          "region" : row.region, 
-                          "release_date" : row.release_date})
-
-    # 2. The starting characters share the same release date, so it'll be saved in a varaible to reassign the value to the required fields
-    release_date = None
-    for char in char_info:
-        if char["name"] == "Tracer": # Tracer is the first character in the list
-            release_date = char["release_date"]
-        if char["name"] != "Ana": # Ana is the first character to be released after game release, so she's not a starting character
-            char["release_date"] = release_date
-        else:
-            break
-
-    # 3. Specific characters require specific corrections
-    for char in char_info:
-        # fixing names
-        if "2016" in char["release_date"] and char["region"] == "Brazil": # Lúcio
-            char["name"] = "Lucio"
-        if "2016" in char["release_date"] and char["region"] == "Sweden": # Torbjörn
-            char["name"] = "Torbjorn"
-        # fixing locations
-        if char["name"] == "Wrecking Ball":
-            char["region"] = "The Moon" # hamster is from the Moon
-        if char["name"] == "Juno":
-            char["region"] = "Mars" # Juno is from Mars
-        # fixing genders
-        if char["name"] == "Bastion":
-            char["gender"] = "Genderless" # Bastion has no gender
-
-    # 4. Convert list of dictionaries back to a dataframe
-    ow_char_df = pd.DataFrame(char_info)
-
-    # 5. Fixing date
-    date_fixer = lambda x: x.split("(")[0].strip()
-    ow_char_df["release_date"] = ow_char_df["release_date"].apply(date_fixer)
-
-    # Saving transformed DataFrame
-    ow_char_df.to_csv("temp/overwatch_2_character_data.csv")
-
-    logging.info("Cleaning done.")
-
-def transform_wuwa_csv_into_tables() -> None:
-
-    """
-    This function gets the CSV file containing the extracted data of Wuthering Waves characters
-    and converts it to a list of CSV files which follow the star schema. In this case, both gender 
-    and region are dimensions.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Generating star schema for character data from game: Wuthering Waves...")
-
-    logging.info("Creating dimension tables...")
-
-    # A. Getting dimension tables
-
-    wuwa_char_df = pd.read_csv("temp/wuthering_waves_character_data.csv")
-
-    wuwa_gender_df = wuwa_char_df.groupby(["gender"]).count().reset_index()
-    wuwa_gender_df["gender_id"] = wuwa_gender_df.index
-    wuwa_gender_df["gender_id"] = wuwa_gender_df["gender_id"].apply(lambda x: x + 1)
-    wuwa_gender_df = wuwa_gender_df[["gender_id", "gender"]]
-
-    wuwa_region_df = wuwa_char_df.groupby(["region"]).count().reset_index()
-    wuwa_region_df["region_id"] = wuwa_region_df.index
-    wuwa_region_df["region_id"] = wuwa_region_df["region_id"].apply(lambda x: x + 1)
-    wuwa_region_df = wuwa_region_df[["region_id", "region"]]
-
-    # B. Getting facts table
-
-    logging.info("Creating facts table...")
-
-    wuwa_facts_table = wuwa_char_df
-    wuwa_facts_table.insert(0, "character_id", wuwa_facts_table.index + 1)
-    #wuwa_facts_table["character_id"] = wuwa_facts_table["character_id"].apply(lambda x: x + 1)
-
-    gender_assign_func = lambda x : wuwa_gender_df[wuwa_gender_df["gender"] == x]["gender_id"].values[0]
-    wuwa_facts_table["gender"] = wuwa_facts_table["gender"].apply(gender_assign_func)
-
-    region_assign_func = lambda x : wuwa_region_df[wuwa_region_df["region"] == x]["region_id"].values[0]
-    wuwa_facts_table["region"] = wuwa_facts_table["region"].apply(region_assign_func)
-
-    wuwa_facts_table["release_date"] = wuwa_facts_table["release_date"].apply(lambda x: datetime.strptime(x, "%B %d, %Y").strftime("%Y-%m-%d"))
-
-    wuwa_facts_table = wuwa_facts_table.drop("Unnamed: 0", axis = 1)
-    wuwa_facts_table.rename(columns={'gender': 'gender_id', 'region': 'region_id'}, inplace=True)
-
-    # saving transformed data tables
-
-    logging.info("Star schema tables generated. Saving tables...")
-
-    wuwa_gender_df.to_csv("temp/wuwa_gender_df.csv")
-    wuwa_region_df.to_csv("temp/wuwa_region_df.csv")
-    wuwa_facts_table.to_csv("temp/wuwa_facts_table.csv")
-
-    logging.info("Tables saved.")
-
-def transform_hoyo_csv_into_tables() -> None:
-
-    """
-    This function gets the CSV file containing the extracted data of miHoYo/HoYoverse characters 
-    and converts it to a list of CSV files which follow the star schema. In this case, both gender 
-    and region/faction are dimensions.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    ### ------------------- I. Genshin Impact characters ------------------- ###
-
-    logging.info("Generating star schema for character data from game: Genshin Impact...")
-
-    logging.info("Creating dimension tables...")
-
-    # A. Getting dimension tables
-
-    genshin_char_df = pd.read_csv("temp/genshin_impact_character_data.csv")
-
-    genshin_gender_df = genshin_char_df.groupby(["gender"]).count().reset_index()
-    genshin_gender_df["gender_id"] = genshin_gender_df.index
-    genshin_gender_df["gender_id"] = genshin_gender_df["gender_id"].apply(lambda x: x + 1)
-    genshin_gender_df = genshin_gender_df[["gender_id", "gender"]]
-
-    genshin_region_df = genshin_char_df.groupby(["region"]).count().reset_index()
-    genshin_region_df["region_id"] = genshin_region_df.index
-    genshin_region_df["region_id"] = genshin_region_df["region_id"].apply(lambda x: x + 1)
-    genshin_region_df = genshin_region_df[["region_id", "region"]]
-
-    # B. Getting facts table
-
-    logging.info("Creating facts table...")
-
-    genshin_facts_table = genshin_char_df
-    genshin_facts_table.insert(0, "character_id", genshin_facts_table.index + 1)
-
-    gender_assign_func = lambda x : genshin_gender_df[genshin_gender_df["gender"] == x]["gender_id"].values[0]
-    genshin_facts_table["gender"] = genshin_facts_table["gender"].apply(gender_assign_func)
-
-    region_assign_func = lambda x : genshin_region_df[genshin_region_df["region"] == x]["region_id"].values[0]
-    genshin_facts_table["region"] = genshin_facts_table["region"].apply(region_assign_func)
-
-    genshin_facts_table["release_date"] = genshin_facts_table["release_date"].apply(lambda x: datetime.strptime(x, "%B %d, %Y").strftime("%Y-%m-%d"))
-
-    genshin_facts_table = genshin_facts_table.drop("Unnamed: 0", axis = 1)
-    genshin_facts_table.rename(columns={'gender': 'gender_id', 'region': 'region_id'}, inplace=True)
-
-    # saving transformed data tables
-
-    logging.info("Star schema tables generated. Saving tables...")
-
-    genshin_gender_df.to_csv("temp/genshin_gender_df.csv")
-    genshin_region_df.to_csv("temp/genshin_region_df.csv")
-    genshin_facts_table.to_csv("temp/genshin_facts_table.csv")
-
-    logging.info("Tables saved.")
-
-    ### ----------------- II. Honkai: Star Rail characters ----------------- ###
-
-    logging.info("Generating star schema for character data from game: Honkai: Star Rail...")
-
-    logging.info("Creating dimension tables...")
-
-    # A. Getting dimension tables
-
-    hsr_char_df = pd.read_csv("temp/honkai_star_rail_character_data.csv")
-
-    hsr_gender_df = hsr_char_df.groupby(["gender"]).count().reset_index()
-    hsr_gender_df["gender_id"] = hsr_gender_df.index
-    hsr_gender_df["gender_id"] = hsr_gender_df["gender_id"].apply(lambda x: x + 1)
-    hsr_gender_df = hsr_gender_df[["gender_id", "gender"]]
-
-    hsr_faction_df = hsr_char_df.groupby(["faction"]).count().reset_index()
-    hsr_faction_df["faction_id"] = hsr_faction_df.index
-    hsr_faction_df["faction_id"] = hsr_faction_df["faction_id"].apply(lambda x: x + 1)
-    hsr_faction_df = hsr_faction_df[["faction_id", "faction"]]
-
-    # B. Getting facts table
-
-    logging.info("Creating facts table...")
-
-    hsr_facts_table = hsr_char_df
-    hsr_facts_table.insert(0, "character_id", hsr_facts_table.index + 1)
-
-    gender_assign_func = lambda x : hsr_gender_df[hsr_gender_df["gender"] == x]["gender_id"].values[0]
-    hsr_facts_table["gender"] = hsr_facts_table["gender"].apply(gender_assign_func)
-
-    faction_assign_func = lambda x : hsr_faction_df[hsr_faction_df["faction"] == x]["faction_id"].values[0]
-    hsr_facts_table["faction"] = hsr_facts_table["faction"].apply(faction_assign_func)
-
-    hsr_facts_table["release_date"] = hsr_facts_table["release_date"].apply(lambda x: datetime.strptime(x, "%B %d, %Y").strftime("%Y-%m-%d"))
-
-    hsr_facts_table = hsr_facts_table.drop(["Unnamed: 0", "Unnamed: 0.1"], axis = 1)
-    hsr_facts_table.rename(columns={'gender': 'gender_id', 'faction': 'faction_id'}, inplace=True)
-
-    # saving transformed data tables
-
-    logging.info("Star schema tables generated. Saving tables...")
-
-    hsr_gender_df.to_csv("temp/hsr_gender_df.csv")
-    hsr_faction_df.to_csv("temp/hsr_faction_df.csv")
-    hsr_facts_table.to_csv("temp/hsr_facts_table.csv")
-
-    logging.info("Tables saved.")
-
-    ### ---------------- III. Zenless Zone Zero characters ----------------- ###
-
-    logging.info("Generating star schema for character data from game: Zenless Zone Zero...")
-
-    logging.info("Creating dimension tables...")
-
-    # A. Getting dimension tables
-
-    zzz_char_df = pd.read_csv("temp/zenless_zone_zero_character_data.csv")
-
-    zzz_gender_df = zzz_char_df.groupby(["gender"]).count().reset_index()
-    zzz_gender_df["gender_id"] = zzz_gender_df.index
-    zzz_gender_df["gender_id"] = zzz_gender_df["gender_id"].apply(lambda x: x + 1)
-    zzz_gender_df = zzz_gender_df[["gender_id", "gender"]]
-
-    zzz_faction_df = zzz_char_df.groupby(["faction"]).count().reset_index()
-    zzz_faction_df["faction_id"] = zzz_faction_df.index
-    zzz_faction_df["faction_id"] = zzz_faction_df["faction_id"].apply(lambda x: x + 1)
-    zzz_faction_df = zzz_faction_df[["faction_id", "faction"]]
-
-    # B. Getting facts table
-
-    logging.info("Creating facts table...")
-
-    zzz_facts_table = zzz_char_df
-    zzz_facts_table.insert(0, "character_id", zzz_facts_table.index + 1)
-
-    gender_assign_func = lambda x : zzz_gender_df[zzz_gender_df["gender"] == x]["gender_id"].values[0]
-    zzz_facts_table["gender"] = zzz_facts_table["gender"].apply(gender_assign_func)
-
-    faction_assign_func = lambda x : zzz_faction_df[zzz_faction_df["faction"] == x]["faction_id"].values[0]
-    zzz_facts_table["faction"] = zzz_facts_table["faction"].apply(faction_assign_func)
-
-    zzz_facts_table["release_date"] = zzz_facts_table["release_date"].apply(lambda x: datetime.strptime(x, "%B %d, %Y").strftime("%Y-%m-%d"))
-
-    zzz_facts_table = zzz_facts_table.drop("Unnamed: 0", axis = 1)
-    zzz_facts_table.rename(columns={'gender': 'gender_id', 'faction': 'faction_id'}, inplace=True)
-
-    # saving transformed data tables
-
-    logging.info("Star schema tables generated. Saving tables...")
-
-    zzz_gender_df.to_csv("temp/zzz_gender_df.csv")
-    zzz_faction_df.to_csv("temp/zzz_faction_df.csv")
-    zzz_facts_table.to_csv("temp/zzz_facts_table.csv")
-
-    logging.info("Tables saved.")
-
-def transform_ow_csv_into_tables() -> None:
-
-    """
-    This function gets the CSV file containing the extracted data of Overwatch 2 characters
-    and converts it to a list of CSV files which follow the star schema. In this case, both gender 
-    and region are dimensions.
-
-    Parameters:
-    None
-
-    Returned value:
-    None
-    """
-
-    logging.info("Generating star schema for character data from game: Overwatch 2...")
-
-    logging.info("Creating dimension tables...")
-
-    # A. Getting dimension tables
-
-    ow_char_df = pd.read_csv("temp/overwatch_2_character_data.csv")
-    ow_char_df = ow_char_df[ow_char_df["release_date"] != "TBA"] # Only active characters are valid
-
-    ow_gender_df = ow_char_df.groupby(["gender"]).count().reset_index()
-    ow_gender_df["gender_id"] = ow_gender_df.index
-    ow_gender_df["gender_id"] = ow_gender_df["gender_id"].apply(lambda x: x + 1)
-    ow_gender_df = ow_gender_df[["gender_id", "gender"]]
-
-    ow_region_df = ow_char_df.groupby(["region"]).count().reset_index()
-    ow_region_df["region_id"] = ow_region_df.index
-    ow_region_df["region_id"] = ow_region_df["region_id"].apply(lambda x: x + 1)
-    ow_region_df = ow_region_df[["region_id", "region"]]
-
-    # B. Getting facts table
-
-    logging.info("Creating facts table...")
-
-    ow_facts_table = ow_char_df
-    ow_facts_table.insert(0, "character_id", ow_facts_table.index + 1)
-
-    gender_assign_func = lambda x : ow_gender_df[ow_gender_df["gender"] == x]["gender_id"].values[0]
-    ow_facts_table["gender"] = ow_facts_table["gender"].apply(gender_assign_func)
-
-    region_assign_func = lambda x : ow_region_df[ow_region_df["region"] == x]["region_id"].values[0]
-    ow_facts_table["region"] = ow_facts_table["region"].apply(region_assign_func)
-
-    ow_facts_table["release_date"] = ow_facts_table["release_date"].apply(lambda x: datetime.strptime(x, "%d-%b-%y").strftime("%Y-%m-%d"))
-
-    ow_facts_table = ow_facts_table.drop("Unnamed: 0", axis = 1)
-    ow_facts_table.rename(columns={'gender': 'gender_id', 'region': 'region_id'}, inplace=True)
-
-    # saving transformed data tables
-
-    logging.info("Star schema tables generated. Saving tables...")
-
-    ow_gender_df.to_csv("temp/ow_gender_df.csv")
-    ow_region_df.to_csv("temp/ow_region_df.csv")
-    ow_facts_table.to_csv("temp/ow_facts_table.csv")
-
-    logging.info("Tables saved.")
+import pandas as pd
+from datetime import datetime
+import logging
+import os
+import re
+import threading
+from etl_funcs.stage_store import get_stage_store, STAGE_CHUNK_SIZE
+from etl_funcs.key_registry import KeyRegistry, get_key_registry, CHARACTER_KEY
+
+#  =============================== Cleaning rules - Correction table =============================== #
+
+CORRECTION_RULES_FILE = "data_input/correction_rules.csv" # field overrides of specific characters, applied by the cleaning step of their game
+CORRECTION_MATCH_FIELDS = ["name", "gender", "region", "faction", "release_year"] # fields a rule can be matched on (match_<field> columns)
+CORRECTION_SET_FIELDS = ["name", "gender", "region", "faction"] # fields a rule can override (set_<field> columns)
+RELEASE_YEAR_PATTERN = r"(\d{4})" # year of a release date as shown on the wiki (before it is cleaned), as matched by the match_release_year column
+
+_correction_rules = None # rule groups of each game, loaded on first use
+_correction_rules_lock = threading.Lock()
+
+def load_correction_rules(path: str = CORRECTION_RULES_FILE) -> dict:
+
+    """
+    This function reads the correction rules. Each rule matches the characters of a game on the
+    fields of its non-empty match_<field> columns and sets the fields of its non-empty set_<field>
+    columns. Rules matching on the same fields are grouped in a table indexed by the matched values,
+    so each group is applied with a single lookup, whatever the number of rules in it. Groups are
+    applied in the order of their first rule in the file, each one seeing the fields set by the
+    previous ones.
+
+    Parameters:
+    path (str): path of the rules file
+
+    Returned value:
+    dict: list of (match fields, overrides table, overrides of each matched value) groups of each game
+    """
+
+    if not os.path.exists(path):
+        logging.warning(f"Correction rules file not found, no corrections are applied: {path}")
+        return {}
+
+    rules = pd.read_csv(path, dtype = str)
+    match_columns = [f"match_{field}" for field in CORRECTION_MATCH_FIELDS]
+    set_columns = [f"set_{field}" for field in CORRECTION_SET_FIELDS]
+    correction_rules = {}
+
+    for game, game_rules in rules.groupby("game", sort = False):
+        matched_fields = game_rules[match_columns].notna().apply(
+            lambda row: tuple(field for field, matched in zip(CORRECTION_MATCH_FIELDS, row) if matched), axis = 1)
+        groups = []
+
+        for fields, group in game_rules.groupby(matched_fields, sort = False):
+            if not fields:
+                logging.warning(f"{len(group)} correction rules of {game} don't match on any field and are ignored.")
+                continue
+
+            # one row per matched value (the last rule wins), one column per overridden field
+            overrides = group.drop_duplicates(subset = [f"match_{field}" for field in fields], keep = "last")
+            overrides = overrides.set_index([f"match_{field}" for field in fields])[set_columns].dropna(axis = 1, how = "all")
+            overrides.index.names = list(fields)
+            overrides.columns = [column.removeprefix("set_") for column in overrides.columns]
+
+            record_overrides = {value: {field: new_value for field, new_value in row.items() if pd.notna(new_value)}
+                                for value, row in overrides.to_dict("index").items()}
+            groups.append((list(fields), overrides, record_overrides))
+
+        correction_rules[game] = groups
+
+    return correction_rules
+
+def get_correction_rules(game: str) -> list:
+
+    """
+    This function returns the correction rule groups of a game, reading the rules file on the first call.
+
+    Parameters:
+    game (str): name of the game schema
+
+    Returned value:
+    list: (match fields, overrides table, overrides of each matched value) groups of the game
+    """
+
+    global _correction_rules
+
+    with _correction_rules_lock:
+        if _correction_rules is None:
+            _correction_rules = load_correction_rules()
+
+        return _correction_rules.get(game, [])
+
+def apply_correction_rules(char_df: pd.DataFrame, game: str) -> pd.DataFrame:
+
+    """
+    This function applies the correction rules of a game to its character table, with one indexed
+    lookup of the whole table per group of rules.
+
+    Parameters:
+    char_df (pd.DataFrame): character table
+    game (str): name of the game schema
+
+    Returned value:
+    pd.DataFrame: corrected character table
+    """
+
+    groups = get_correction_rules(game)
+    if not groups:
+        return char_df
+
+    # categorical columns are corrected as strings, since the new values aren't among their categories
+    categorical = [column for column in char_df.columns if isinstance(char_df[column].dtype, pd.CategoricalDtype)]
+    char_df = char_df.astype({column: object for column in categorical})
+
+    for fields, overrides, _ in groups:
+        keys = [char_df["release_date"].astype(str).str.extract(RELEASE_YEAR_PATTERN)[0] if field == "release_year"
+                else char_df[field] for field in fields]
+        matched = overrides.reindex(pd.MultiIndex.from_arrays(keys) if len(keys) > 1 else pd.Index(keys[0]))
+        matched.index = char_df.index
+
+        for field in overrides.columns:
+            char_df[field] = matched[field].where(matched[field].notna(), char_df[field])
+
+    return char_df.astype({column: "category" for column in categorical})
+
+def apply_record_correction_rules(char: dict, game: str) -> dict:
+
+    """
+    This function applies the correction rules of a game to a single character, with one lookup per
+    group of rules.
+
+    Parameters:
+    char (dict): character dictionary
+    game (str): name of the game schema
+
+    Returned value:
+    dict: corrected character dictionary
+    """
+
+    for fields, _, record_overrides in get_correction_rules(game):
+        keys = []
+        for field in fields:
+            if field == "release_year":
+                year = re.search(RELEASE_YEAR_PATTERN, str(char["release_date"]))
+                keys.append(year.group(1) if year else None)
+            else:
+                keys.append(char[field])
+
+        char.update(record_overrides.get(tuple(keys) if len(keys) > 1 else keys[0], {}))
+
+    return char
+
+#  ================================== Cleaning rules - Per record ================================== #
+
+def get_top_faction(faction: str) -> str:
+
+    """
+    This function removes the sub-faction shown between parentheses after the faction of a
+    Honkai: Star Rail character.
+
+    Parameters:
+    faction (str): faction as shown on the wiki
+
+    Returned value:
+    str: top faction
+    """
+
+    return faction.split("(")[0]
+
+def trim_hsr_release_date(release_date: str) -> str:
+
+    """
+    This function removes the text following the year of a Honkai: Star Rail release date
+    (e.g. the version in which the character was released).
+
+    Parameters:
+    release_date (str): release date as shown on the wiki
+
+    Returned value:
+    str: release date in "%B %d, %Y" format
+    """
+
+    return release_date[:release_date.index(",") + 6]
+
+def clean_hsr_char_records(char_info):
+
+    """
+    This generator cleans the faction and release_date fields of each Honkai: Star Rail character
+    and applies its correction rules, one record at a time.
+
+    Parameters:
+    char_info (iterable): character dictionaries, in list order
+
+    Returned value:
+    generator: cleaned character dictionaries
+    """
+
+    for char in char_info:
+        char["faction"] = get_top_faction(char["faction"])
+        char["release_date"] = trim_hsr_release_date(char["release_date"])
+        yield apply_record_correction_rules(char, "honkai_star_rail")
+
+def clean_ow_char_records(char_info):
+
+    """
+    This generator applies the Overwatch 2 corrections to each character, one record at a time.
+    Since the starting characters are read from the list before Ana, only the characters already
+    seen are needed to clean each one, so the records can be cleaned as they are extracted.
+
+    Parameters:
+    char_info (iterable): character dictionaries, in list order
+
+    Returned value:
+    generator: cleaned character dictionaries
+    """
+
+    release_date = None
+    starting_characters = True
+
+    for char in char_info:
+
+        # 1. The starting characters share the same release date, so it'll be saved in a varaible to reassign the value to the required fields
+        if starting_characters:
+            if char["name"] == "Tracer": # Tracer is the first character in the list
+                release_date = char["release_date"]
+            if char["name"] != "Ana": # Ana is the first character to be released after game release, so she's not a starting character
+                char["release_date"] = release_date
+            else:
+                starting_characters = False
+
+        # 2. Specific characters require specific corrections (names, regions and genders), listed in the correction rules;
+        # they are applied before the date is fixed, since the release year is matched on the date as shown on the wiki
+        apply_record_correction_rules(char, "overwatch_2")
+
+        # 3. Fixing date
+        char["release_date"] = char["release_date"].split("(")[0].strip()
+
+        yield char
+
+#  ================================== Date normalization - Cached ================================== #
+
+DATE_FALLBACK_FORMATS = ["%B %d, %Y", "%d-%b-%y", "%d %B %Y"] # formats tried for the dates which don't match the format of their wiki
+
+_normalized_dates = {} # normalized date of each (date, format) pair already parsed
+
+def normalize_date(value: str, date_format: str) -> str | None:
+
+    """
+    This function converts a release date to the "%Y-%m-%d" format, trying the fallback formats
+    when it doesn't match the expected one. Results are cached, since many characters share the
+    date of a game update.
+
+    Parameters:
+    value (str): release date as shown on the wiki
+    date_format (str): expected format of the date
+
+    Returned value:
+    str | None: normalized date, or None if the date can't be parsed with any format
+    """
+
+    key = (value, date_format)
+
+    if key not in _normalized_dates:
+        normalized = None
+        for candidate_format in [date_format] + [f for f in DATE_FALLBACK_FORMATS if f != date_format]:
+            try:
+                normalized = datetime.strptime(value.strip(), candidate_format).strftime("%Y-%m-%d")
+                break
+            except (ValueError, AttributeError): # AttributeError: missing value (NaN)
+                continue
+        _normalized_dates[key] = normalized
+
+    return _normalized_dates[key]
+
+def normalize_dates(dates: pd.Series, date_format: str) -> pd.Series:
+
+    """
+    This function converts a column of release dates to the "%Y-%m-%d" format. Each distinct date is
+    parsed once, the whole column at a time with the expected format, and only the dates it doesn't
+    match go through the fallback formats. Dates which can't be parsed are reported and left empty
+    instead of stopping the transformation.
+
+    Parameters:
+    dates (pd.Series): release dates as shown on the wiki
+    date_format (str): expected format of the dates
+
+    Returned value:
+    pd.Series: normalized dates (NaN where the date couldn't be parsed)
+    """
+
+    # 1. Parsing the distinct dates with the expected format
+    values = pd.Series(dates.unique(), dtype = object)
+    normalized = pd.to_datetime(values, format = date_format, errors = "coerce").dt.strftime("%Y-%m-%d")
+
+    # 2. Trying the fallback formats on the remaining ones
+    for i in normalized.index[normalized.isna()]:
+        normalized[i] = normalize_date(values[i], date_format)
+
+    # 3. Reporting the dates which couldn't be parsed
+    unparseable = values[normalized.isna()].tolist()
+    if unparseable:
+        logging.warning(f"{len(unparseable)} release dates couldn't be parsed and were left empty: {unparseable}")
+
+    return dates.map(dict(zip(values, normalized)))
+
+#  ==================================== Transformation functions =================================== #
+
+def transform_hsr_char_info() -> None:
+
+    """
+    This function gets the extracted info of Honkai: Star Rail characters and processes
+    the faction and release_date fields for each character, removing unnecessary information. After filtering,
+    it hands the transformed table to the next step.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    logging.info("Cleaning character data from game: Honkai: Star Rail...")
+
+    # Load table
+    hsr_char_df = get_stage_store().get("honkai_star_rail_character_data")
+
+    # Formatting and cleaning faction data (see get_top_faction)
+    hsr_char_df["faction"] = hsr_char_df["faction"].str.split("(").str[0]
+
+    # Formatting and cleaning release date (see trim_hsr_release_date)
+    release_date_parts = hsr_char_df["release_date"].str.split(",", n = 1)
+    hsr_char_df["release_date"] = release_date_parts.str[0] + "," + release_date_parts.str[1].str[:5]
+
+    # Applying the correction rules
+    hsr_char_df = apply_correction_rules(hsr_char_df, "honkai_star_rail")
+
+    # Saving transformed DataFrame
+    get_stage_store().put("honkai_star_rail_character_data", hsr_char_df)
+
+    logging.info("Cleaning done.")
+
+def transform_ow_char_info() -> None:
+
+    """
+    This function gets the extracted info of Overwatch characters and processes
+    the region and release_date fields for each character. After filtering,
+    it hands the transformed table to the next step.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    logging.info("Cleaning character data from game: Overwatch 2...")
+
+    # Load table
+    ow_char_df = get_stage_store().get("overwatch_2_character_data")
+
+    # 1. The starting characters (listed before Ana, the first character released after the game) share the release date of Tracer
+    starting_characters = ~(ow_char_df["name"] == "Ana").cumsum().astype(bool)
+    ow_char_df.loc[starting_characters, "release_date"] = ow_char_df.loc[ow_char_df["name"] == "Tracer", "release_date"].iloc[0]
+
+    # 2. Applying the correction rules (names, regions and genders of specific characters), before the date is fixed,
+    # since the release year is matched on the date as shown on the wiki
+    ow_char_df = apply_correction_rules(ow_char_df, "overwatch_2")
+
+    # 3. Fixing date
+    ow_char_df["release_date"] = ow_char_df["release_date"].str.split("(").str[0].str.strip()
+
+    # Saving transformed DataFrame
+    get_stage_store().put("overwatch_2_character_data", ow_char_df)
+
+    logging.info("Cleaning done.")
+
+#  ============================== Star schema - Config-driven engine =============================== #
+
+# Star schema of each game: title (for the logs), prefix of the output files, dimension columns,
+# format of the release date on the wiki and values which leave a character out of the schema
+STAR_SCHEMA_SPECS = {
+    "wuthering_waves": {"title": "Wuthering Waves", "prefix": "wuwa", "dimensions": ["gender", "region"],
+                        "date_format": "%B %d, %Y", "exclude": {}},
+    "genshin_impact": {"title": "Genshin Impact", "prefix": "genshin", "dimensions": ["gender", "region"],
+                       "date_format": "%B %d, %Y", "exclude": {}},
+    "honkai_star_rail": {"title": "Honkai: Star Rail", "prefix": "hsr", "dimensions": ["gender", "faction"],
+                         "date_format": "%B %d, %Y", "exclude": {}},
+    "zenless_zone_zero": {"title": "Zenless Zone Zero", "prefix": "zzz", "dimensions": ["gender", "faction"],
+                          "date_format": "%B %d, %Y", "exclude": {}},
+    "overwatch_2": {"title": "Overwatch 2", "prefix": "ow", "dimensions": ["gender", "region"],
+                    "date_format": "%d-%b-%y", "exclude": {"release_date": ["TBA"]}} # Only active characters are valid
+}
+
+CHUNKED_TRANSFORM = False # build the star schemas chunk by chunk, with bounded memory, for exports too large to be held in memory
+
+def build_dimension(values: pd.Series, dimension: str) -> tuple:
+
+    """
+    This function builds the dimension table of a column and the dimension id of each of its rows
+    in a single pass over the column. Ids are given to the distinct values in alphabetical order,
+    starting at 1.
+
+    Parameters:
+    values (pd.Series): dimension values of the facts table
+    dimension (str): name of the dimension
+
+    Returned value:
+    tuple: dimension table ({dimension}_id and {dimension} columns) and the id of each row (int32, 0 for missing values)
+    """
+
+    codes, distinct_values = pd.factorize(values, sort = True)
+    dimension_df = pd.DataFrame({f"{dimension}_id": pd.Series(range(1, len(distinct_values) + 1), dtype = "int32"),
+                                 dimension: distinct_values})
+
+    return dimension_df, pd.Series(codes + 1, index = values.index, dtype = "int32")
+
+def register_dimension_ids(game: str, dimension: str, dimension_df: pd.DataFrame, registry: KeyRegistry = None):
+
+    """
+    This function replaces the ids of a dimension table, given in alphabetical order by
+    build_dimension, with the ids of its values in the key registry, registering the new values.
+
+    Parameters:
+    game (str): name of the game schema
+    dimension (str): name of the dimension
+    dimension_df (pd.DataFrame): dimension table built by build_dimension
+    registry (KeyRegistry): key registry (the shared one if None)
+
+    Returned value:
+    np.ndarray: registered id of each alphabetical id (0 for missing values), to be indexed with the ids of build_dimension
+    """
+
+    keys = (registry or get_key_registry()).get_ids(game, dimension, dimension_df[dimension].tolist())
+    registered_ids = pd.Series([0, *(keys[value] for value in dimension_df[dimension])], dtype = "int32").to_numpy()
+    dimension_df[f"{dimension}_id"] = registered_ids[1:]
+
+    return registered_ids
+
+def register_character_ids(game: str, names: pd.Series, registry: KeyRegistry = None) -> pd.Series:
+
+    """
+    This function gets the character_id of each character from the key registry, registering the
+    new characters in list order. Characters are identified by name.
+
+    Parameters:
+    game (str): name of the game schema
+    names (pd.Series): names of the characters
+    registry (KeyRegistry): key registry (the shared one if None)
+
+    Returned value:
+    pd.Series: character_id of each character (int32)
+    """
+
+    return names.map((registry or get_key_registry()).get_ids(game, CHARACTER_KEY, names.tolist())).astype("int32")
+
+def build_star_schema(char_df: pd.DataFrame, spec: dict, game: str) -> dict:
+
+    """
+    This function converts the extracted data of a game into the tables of its star schema: one
+    dimension table per dimension column of the spec and the facts table, where each dimension
+    value is replaced with its id and the release date is normalized. The ids of the characters and
+    dimension values come from the key registry, so they don't change from one run to the next (new
+    values get the next ids, in alphabetical order for the dimensions). Dimension values are handled
+    as categoricals (each distinct value is stored once), ids as 32-bit integers and release dates
+    as datetimes. Characters with a missing dimension value or an unparseable release date are
+    reported and left out of the facts table.
+
+    Parameters:
+    char_df (pd.DataFrame): extracted character data
+    spec (dict): star schema spec of the game (see STAR_SCHEMA_SPECS)
+    game (str): name of the game schema, key of STAR_SCHEMA_SPECS
+
+    Returned value:
+    dict: DataFrame of each table, by name ("{dimension}_df" and "facts_table")
+    """
+
+    # 1. Filtering the characters
+    facts_table = filter_star_schema_rows(char_df, spec).astype({dimension: "category" for dimension in spec["dimensions"]})
+    facts_table.insert(0, "character_id", register_character_ids(game, facts_table["name"]))
+
+    # 2. Building the dimension tables and replacing the values of the facts table with their ids
+    tables = {}
+    for dimension in spec["dimensions"]:
+        tables[f"{dimension}_df"], ids = build_dimension(facts_table[dimension], dimension)
+        facts_table[dimension] = register_dimension_ids(game, dimension, tables[f"{dimension}_df"])[ids.to_numpy()]
+
+    # 3. Normalizing the release dates
+    tables["facts_table"] = finish_facts_table(facts_table, spec)
+
+    return tables
+
+def filter_star_schema_rows(char_df: pd.DataFrame, spec: dict) -> pd.DataFrame:
+
+    """
+    This function leaves out the characters with an excluded value (see STAR_SCHEMA_SPECS).
+
+    Parameters:
+    char_df (pd.DataFrame): extracted character data
+    spec (dict): star schema spec of the game
+
+    Returned value:
+    pd.DataFrame: characters of the star schema
+    """
+
+    for column, excluded_values in spec["exclude"].items():
+        char_df = char_df[~char_df[column].isin(excluded_values)]
+
+    return char_df
+
+def finish_facts_table(facts_table: pd.DataFrame, spec: dict) -> pd.DataFrame:
+
+    """
+    This function normalizes the release dates of a facts table whose dimension values were
+    replaced with their ids, and leaves out the characters with a missing dimension value or an
+    unparseable release date, which are reported.
+
+    Parameters:
+    facts_table (pd.DataFrame): facts table (or chunk of it), with the dimension ids under the dimension names
+    spec (dict): star schema spec of the game
+
+    Returned value:
+    pd.DataFrame: facts table, with {dimension}_id columns
+    """
+
+    missing = (facts_table[spec["dimensions"]] == 0).any(axis = 1)
+    if missing.any():
+        logging.warning(f"Characters left out because of a missing {'/'.join(spec['dimensions'])} value: {facts_table.loc[missing, 'name'].tolist()}")
+
+    facts_table["release_date"] = pd.to_datetime(normalize_dates(facts_table["release_date"], spec["date_format"]), format = "%Y-%m-%d")
+    facts_table = facts_table[~missing & facts_table["release_date"].notna()] # characters with an unparseable release date are left out
+
+    return facts_table.rename(columns = {dimension: f"{dimension}_id" for dimension in spec["dimensions"]})
+
+def build_star_schema_in_chunks(game: str, spec: dict, chunk_size: int = STAGE_CHUNK_SIZE) -> None:
+
+    """
+    This function builds the star schema of a game like build_star_schema, reading the extracted
+    data in chunks, so memory use doesn't depend on its size. A first pass over the chunks collects
+    the distinct values of each dimension (the only data held for the whole table), which are
+    registered in alphabetical order like in build_star_schema; the second pass replaces the values
+    of each chunk with their ids and writes the facts table chunk by chunk. The tables are the same
+    as the ones built in memory.
+
+    Parameters:
+    game (str): name of the game schema, key of STAR_SCHEMA_SPECS
+    spec (dict): star schema spec of the game
+    chunk_size (int): maximum number of characters held in memory at a time
+
+    Returned value:
+    None
+    """
+
+    store = get_stage_store()
+    name = f"{game}_character_data"
+
+    # 1. First pass: collecting the distinct values of each dimension, reading only the needed columns
+    distinct_values = {dimension: set() for dimension in spec["dimensions"]}
+    for chunk in store.iter_chunks(name, chunk_size, list(dict.fromkeys([*spec["dimensions"], *spec["exclude"]]))):
+        chunk = filter_star_schema_rows(chunk, spec)
+        for dimension, values in distinct_values.items():
+            values.update(chunk[dimension].dropna().unique())
+
+    dimension_ids = {}
+    for dimension, values in distinct_values.items():
+        dimension_df, _ = build_dimension(pd.Series(list(values), dtype = object), dimension)
+        dimension_ids[dimension] = (dimension_df[dimension], register_dimension_ids(game, dimension, dimension_df))
+        store.put(f"{spec['prefix']}_{dimension}_df", dimension_df)
+
+    # 2. Second pass: building the facts table, one chunk at a time
+    def iter_facts_chunks():
+        for chunk in store.iter_chunks(name, chunk_size):
+            facts_chunk = filter_star_schema_rows(chunk, spec).copy()
+            facts_chunk.insert(0, "character_id", register_character_ids(game, facts_chunk["name"]))
+            for dimension, (values, registered_ids) in dimension_ids.items():
+                facts_chunk[dimension] = registered_ids[pd.Categorical(facts_chunk[dimension], categories = values).codes + 1]
+            yield finish_facts_table(facts_chunk, spec)
+
+    count = store.put_chunks(f"{spec['prefix']}_facts_table", iter_facts_chunks())
+
+    logging.info(f"Built facts table of {count} characters in chunks of {chunk_size} rows.")
+
+def transform_game_into_tables(game: str) -> None:
+
+    """
+    This function gets the extracted data of a game and converts it to the tables of its star
+    schema, which are handed to the loading step. With CHUNKED_TRANSFORM, the tables are built
+    chunk by chunk (see build_star_schema_in_chunks).
+
+    Parameters:
+    game (str): name of the game schema, key of STAR_SCHEMA_SPECS
+
+    Returned value:
+    None
+    """
+
+    spec = STAR_SCHEMA_SPECS[game]
+
+    logging.info(f"Generating star schema for character data from game: {spec['title']}...")
+
+    if CHUNKED_TRANSFORM:
+        build_star_schema_in_chunks(game, spec)
+        logging.info("Star schema tables generated and saved.")
+        return
+
+    store = get_stage_store()
+    tables = build_star_schema(store.get(f"{game}_character_data"), spec, game)
+
+    logging.info("Star schema tables generated. Saving tables...")
+
+    for name, table in tables.items():
+        store.put(f"{spec['prefix']}_{name}", table)
+
+    logging.info("Tables saved.")
+
+def build_star_schemas_in_chunks() -> None:
+
+    """
+    This function makes the transformation step build the star schemas chunk by chunk from then on.
+    It is meant for exports too large to be held in memory, with the tables handed through files.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    global CHUNKED_TRANSFORM
+
+    CHUNKED_TRANSFORM = True
+
+    logging.info(f"Building star schemas in chunks of {STAGE_CHUNK_SIZE} rows.")
+
+#  =================================== Star schema - Game tables =================================== #
+
+def transform_wuwa_csv_into_tables() -> None:
+
+    """
+    This function gets the extracted data of Wuthering Waves characters
+    and converts it to the tables of the star schema. In this case, both gender 
+    and region are dimensions.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    transform_game_into_tables("wuthering_waves")
+
+def transform_hoyo_csv_into_tables() -> None:
+
+    """
+    This function gets the extracted data of miHoYo/HoYoverse characters 
+    and converts it to the tables of the star schema. In this case, both gender 
+    and region/faction are dimensions.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    for game in ["genshin_impact", "honkai_star_rail", "zenless_zone_zero"]:
+        transform_game_into_tables(game)
+
+def transform_ow_csv_into_tables() -> None:
+
+    """
+    This function gets the extracted data of Overwatch 2 characters
+    and converts it to the tables of the star schema. In this case, both gender 
+    and region are dimensions.
+
+    Parameters:
+    None
+
+    Returned value:
+    None
+    """
+
+    transform_game_into_tables("overwatch_2")
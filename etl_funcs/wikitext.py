@@ -0,0 +1,157 @@
+import html
+import re
+
+#  ============================= Wikitext parsing - Infobox templates ============================== #
+
+# Markup removed or replaced when a template value is converted to plain text
+REF_PATTERN = re.compile(r"<ref[^>/]*/>|<ref[^>]*>.*?</ref>", re.DOTALL | re.IGNORECASE)
+COMMENT_PATTERN = re.compile(r"<!--.*?-->", re.DOTALL)
+BR_PATTERN = re.compile(r"<br\s*/?>", re.IGNORECASE)
+FILE_LINK_PATTERN = re.compile(r"\[\[(?:File|Image):[^\[\]]*\]\]", re.IGNORECASE)
+LINK_PATTERN = re.compile(r"\[\[(?:[^\[\]|]*\|)?([^\[\]|]*)\]\]")
+EXTERNAL_LINK_PATTERN = re.compile(r"\[https?://\S+\s+([^\]]*)\]")
+TAG_PATTERN = re.compile(r"<[^>]+>")
+
+def _split_top_level(text: str, separator: str = "|") -> list:
+
+    """
+    This function splits wikitext on a separator, ignoring the separators found inside nested
+    templates ({{ }}) and links ([[ ]]).
+
+    Parameters:
+    text (str): wikitext to be split
+    separator (str): separator character
+
+    Returned value:
+    list: split parts
+    """
+
+    parts = []
+    depth = 0
+    start = 0
+    i = 0
+
+    while i < len(text):
+        pair = text[i:i + 2]
+        if pair in ["{{", "[["]:
+            depth += 1
+            i += 2
+            continue
+        if pair in ["}}", "]]"] and depth > 0:
+            depth -= 1
+            i += 2
+            continue
+        if text[i] == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+        i += 1
+
+    parts.append(text[start:])
+
+    return parts
+
+def find_templates(wikitext: str) -> list:
+
+    """
+    This function lists the top-level templates of a page, with their parameters.
+
+    Parameters:
+    wikitext (str): wikitext of the page
+
+    Returned value:
+    list: (template name, parameters) tuples; named parameters are stored by name and positional ones by position, starting at 1
+    """
+
+    templates = []
+    depth = 0
+    start = 0
+    i = 0
+
+    while i < len(wikitext) - 1:
+        pair = wikitext[i:i + 2]
+        if pair == "{{":
+            if depth == 0:
+                start = i + 2
+            depth += 1
+            i += 2
+        elif pair == "}}" and depth > 0:
+            depth -= 1
+            if depth == 0:
+                name, *arguments = _split_top_level(wikitext[start:i])
+                parameters = {}
+                position = 1
+                for argument in arguments:
+                    key, equals, value = argument.partition("=")
+                    if equals and "{{" not in key and "[[" not in key:
+                        parameters[key.strip()] = value.strip()
+                    else:
+                        parameters[str(position)] = argument.strip()
+                        position += 1
+                templates.append((name.strip(), parameters))
+            i += 2
+        else:
+            i += 1
+
+    return templates
+
+def wikitext_to_text(value: str) -> str:
+
+    """
+    This function converts a template value into the text shown on the page: references, comments
+    and files are removed, links are replaced with their label, line breaks (<br>) become new
+    lines and bold/italic quotes and HTML tags are removed. A nested template is replaced with its
+    last positional parameter (e.g. {{Color|Pyro|Mondstadt}} becomes "Mondstadt"), which is how the
+    formatting templates of the wikis render; templates without one are removed.
+
+    Parameters:
+    value (str): wikitext value of a template parameter
+
+    Returned value:
+    str: plain text
+    """
+
+    text = COMMENT_PATTERN.sub("", REF_PATTERN.sub("", value))
+    text = BR_PATTERN.sub("\n", text)
+
+    # replacing nested templates, innermost first
+    while "{{" in text:
+        nested = re.search(r"\{\{([^{}]*)\}\}", text)
+        if nested is None:
+            break
+        arguments = [argument for argument in _split_top_level(nested.group(1))[1:] if "=" not in argument]
+        text = text[:nested.start()] + (arguments[-1].strip() if arguments else "") + text[nested.end():]
+
+    text = FILE_LINK_PATTERN.sub("", text)
+    text = LINK_PATTERN.sub(r"\1", text)
+    text = EXTERNAL_LINK_PATTERN.sub(r"\1", text)
+    text = TAG_PATTERN.sub("", text.replace("'''", "").replace("''", ""))
+
+    return html.unescape(text)
+
+def get_infobox_parameters(wikitext: str, sources: list) -> dict:
+
+    """
+    This function gets the parameters of the infobox template of a page: the first template
+    whose name contains "Infobox", or else the first template using any of the given parameters.
+    Portable infoboxes read each data-source from the template parameter of the same name, so the
+    infobox specs of the scraper apply to these parameters as they are.
+
+    Parameters:
+    wikitext (str): wikitext of the page
+    sources (list): parameter names read by the caller
+
+    Returned value:
+    dict: parameters of the infobox (empty if the page has none)
+    """
+
+    templates = find_templates(wikitext)
+
+    for name, parameters in templates:
+        if "infobox" in name.lower():
+            return parameters
+
+    for name, parameters in templates:
+        if any(source in parameters for source in sources):
+            return parameters
+
+    return {}
@@ -1,71 +1,98 @@
-import sys
-import logging
-from datetime import datetime, timedelta
-
-# importing etl functions
-from etl_funcs.scraper import *
-from etl_funcs.transform import *
-from etl_funcs.loader import *
-
-# Configuring logging
-
-root = logging.getLogger()
-root.setLevel(logging.DEBUG)
-
-handler = logging.StreamHandler(sys.stdout)
-handler.setLevel(logging.DEBUG)
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
-root.addHandler(handler)
-
-#  ========================================= Main functions ======================================== #
-
-def extract_main_scraper() -> None:
-
-    extract_wuwa_char_info_from_web()
-    extract_genshin_char_info_from_web()
-    extract_zzz_char_info_from_web()
-    extract_hsr_char_info_from_web()
-    extract_ow_char_info_from_web()
-
-def transform_fix_scraped_data() -> None:
-
-    transform_hsr_char_info()
-    transform_ow_char_info()
-
-def transform_main_convert_to_star_schema() -> None:
-
-    transform_wuwa_csv_into_tables()
-    transform_hoyo_csv_into_tables()
-    transform_ow_csv_into_tables()
-
-def load_main_tables_to_db() -> None:
-
-    load_wuwa_tables_to_db()
-    load_hoyo_tables_to_db()
-    load_ow_tables_to_db()
-
-
-if __name__ == "__main__":
-
-    scraping = False
-
-    from dotenv import load_dotenv
-
-    load_dotenv()
-
-    try:
-
-        logging.info("Game Character Database Creation - Starting ETL process...")
-
-        if scraping:
-            extract_main_scraper()
-            transform_fix_scraped_data()
-        transform_main_convert_to_star_schema()
-        load_main_tables_to_db()
-
-        logging.info("Game Character Database Creation - ETL process finished successfully.")
-    
-    except Exception as e:
-        logging.error(f"An error has occurred during ETL sequence: {e}")
-
+import sys
+import logging
+from datetime import datetime, timedelta
+
+# importing etl functions
+from etl_funcs.scraper import *
+from etl_funcs.transform import *
+from etl_funcs.loader import *
+from etl_funcs.stage_store import keep_stages_in_memory
+from etl_funcs.pipeline import run_streaming_pipeline
+
+# Configuring logging
+
+root = logging.getLogger()
+root.setLevel(logging.DEBUG)
+
+handler = logging.StreamHandler(sys.stdout)
+handler.setLevel(logging.DEBUG)
+formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+handler.setFormatter(formatter)
+root.addHandler(handler)
+
+#  ========================================= Main functions ======================================== #
+
+def extract_main_scraper(incremental: bool = False, replay_run: str = None) -> None:
+
+    if replay_run is not None: # pages are read from an archived run instead of the wikis
+        replay_archived_run(replay_run)
+
+    # the games are scraped from different hosts, so their extractors run in parallel
+    run_extractors_concurrently([extract_wuwa_char_info_from_web,
+                                 extract_genshin_char_info_from_web,
+                                 extract_zzz_char_info_from_web,
+                                 extract_hsr_char_info_from_web,
+                                 extract_ow_char_info_from_web], incremental)
+
+def transform_fix_scraped_data() -> None:
+
+    transform_hsr_char_info()
+    transform_ow_char_info()
+
+def transform_main_convert_to_star_schema() -> None:
+
+    seed_key_registries() # if the key registry is new, the ids already loaded are read from the databases first
+
+    transform_wuwa_csv_into_tables()
+    transform_hoyo_csv_into_tables()
+    transform_ow_csv_into_tables()
+
+def load_main_tables_to_db() -> None:
+
+    load_wuwa_tables_to_db()
+    load_hoyo_tables_to_db()
+    load_ow_tables_to_db()
+
+def stream_main_pipeline(incremental: bool = False, replay_run: str = None) -> None:
+
+    if replay_run is not None: # pages are read from an archived run instead of the wikis
+        replay_archived_run(replay_run)
+
+    # records flow from the scrapers through the cleaning rules into the database, without intermediate CSV files
+    run_streaming_pipeline(incremental=incremental)
+
+
+if __name__ == "__main__":
+
+    scraping = False
+    streaming = False # extract, clean and load the records as a stream instead of one step after the other
+    incremental = False # only fetch characters which are new or whose wiki page changed since the last load
+    replay_run = None # id of an archived run (or "latest") to extract from instead of the wikis
+    chunked = False # build the star schemas chunk by chunk, for exports too large to be held in memory
+
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    try:
+
+        logging.info("Game Character Database Creation - Starting ETL process...")
+
+        if streaming:
+            stream_main_pipeline(incremental, replay_run)
+        else:
+            if chunked:
+                build_star_schemas_in_chunks() # the tables are handed through temp/ and read a chunk at a time
+            else:
+                keep_stages_in_memory() # every step runs in this process, so the tables aren't written to temp/
+            if scraping:
+                extract_main_scraper(incremental, replay_run)
+                transform_fix_scraped_data()
+            transform_main_convert_to_star_schema()
+            load_main_tables_to_db()
+
+        logging.info("Game Character Database Creation - ETL process finished successfully.")
+    
+    except Exception as e:
+        logging.error(f"An error has occurred during ETL sequence: {e}")
+
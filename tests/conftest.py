@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the ETL modules are imported as etl_funcs.<module>, like in etl_main.py, so the tests run from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
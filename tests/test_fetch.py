@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from etl_funcs import scraper
+
+#  ============================== Fetching engine - Stub wiki server =============================== #
+
+CHARACTER_PAGE = ("<html><body><aside class='portable-infobox pi-background pi-theme-wikia'>"
+                  "<div data-source='faction'><h3>Faction</h3><div>Stellaron Hunters</div></div>"
+                  "<div data-source='release_date'><h3>Released</h3><div>April 26, 2023</div></div>"
+                  "</aside></body></html>")
+
+class StubWikiHandler(BaseHTTPRequestHandler):
+
+    """
+    This handler answers each path with the scripted responses of the server, in order, and then
+    with the character page. Every request is logged by path.
+    """
+
+    def do_GET(self) -> None:
+
+        with self.server.lock:
+            self.server.requests.append((self.path, time.monotonic()))
+            script = self.server.responses.get(self.path, [])
+            status, headers = script.pop(0) if script else (200, {})
+
+        body = CHARACTER_PAGE.encode() if status == 200 else b"Slow down"
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+@pytest.fixture
+def wiki(tmp_path, monkeypatch):
+    # fresh client and host states, with the page cache under a temporary directory and fast retries
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(scraper, "_scraper_client", None)
+    monkeypatch.setattr(scraper, "_host_states", {})
+    monkeypatch.setattr(scraper, "ARCHIVE_FETCHED_PAGES", False)
+    monkeypatch.setattr(scraper, "REQUESTS_PER_SECOND_PER_HOST", 100)
+    monkeypatch.setattr(scraper, "BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(scraper, "MAX_RETRIES", 2)
+    monkeypatch.setattr(scraper, "PARSE_WORKERS", 0)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubWikiHandler)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.responses = {}
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target = server.serve_forever, daemon = True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+def fetch(url: str, stop: threading.Event = None) -> tuple:
+
+    async def run() -> tuple:
+        blocked = asyncio.Event()
+        page = await scraper._fetch_page(url, blocked, stop)
+        return page, blocked.is_set()
+
+    return asyncio.run(run())
+
+#  ================================ Fetching engine - Retries tests ================================ #
+
+def test_page_is_fetched(wiki):
+    page, blocked = fetch(wiki.url + "/wiki/Kafka")
+
+    assert page.status_code == 200
+    assert "Stellaron Hunters" in page.text
+    assert not blocked
+    assert [path for path, _ in wiki.requests] == ["/wiki/Kafka"]
+
+def test_throttled_request_waits_for_retry_after(wiki):
+    wiki.responses["/wiki/Kafka"] = [(429, {"Retry-After": "1"})]
+
+    page, blocked = fetch(wiki.url + "/wiki/Kafka")
+
+    assert page.status_code == 200
+    assert not blocked
+    assert len(wiki.requests) == 2
+    assert wiki.requests[1][1] - wiki.requests[0][1] >= 1
+
+    # the host was throttled, so its request rate was lowered
+    assert scraper.get_host_state(wiki.url).rate_limiter.requests_per_second == 50
+
+def test_failed_request_is_retried(wiki):
+    wiki.responses["/wiki/Kafka"] = [(500, {}), (503, {})]
+
+    page, blocked = fetch(wiki.url + "/wiki/Kafka")
+
+    assert page.status_code == 200
+    assert not blocked
+    assert len(wiki.requests) == 3
+
+def test_persistent_throttling_blocks_the_scraper(wiki):
+    wiki.responses["/wiki/Kafka"] = [(429, {"Retry-After": "0"})] * 3
+
+    page, blocked = fetch(wiki.url + "/wiki/Kafka")
+
+    assert page.status_code == 429
+    assert blocked
+    assert len(wiki.requests) == scraper.MAX_RETRIES + 1
+
+def test_no_request_once_stopped(wiki):
+    stop = threading.Event()
+    stop.set()
+
+    page, _ = fetch(wiki.url + "/wiki/Kafka", stop)
+
+    assert page is None
+    assert wiki.requests == []
+
+def test_retry_delay_from_http_date():
+    page = scraper.FetchedPage("https://example.org", 429, "", "Too Many Requests",
+                               headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})
+
+    assert scraper.get_retry_delay(page, 0) == 0 # the date is in the past
+
+    page.headers["Retry-After"] = "120"
+    assert scraper.get_retry_delay(page, 0) == 120
+
+#  ============================ Fetching engine - Fetch and parse tests ============================ #
+
+def test_pages_are_parsed_in_order(wiki):
+    urls = [f"{wiki.url}/wiki/Character_{i}" for i in range(3)]
+    wiki.responses[f"/wiki/Character_0"] = [(503, {})] # the first page arrives last
+
+    results = list(scraper.iter_fetch_and_parse_pages(urls, scraper.parse_hsr_character_page))
+
+    assert [url for url, _, _ in results] == urls
+    assert all(record == {"faction": "Stellaron Hunters", "release_date": "April 26, 2023"} for _, _, record in results)
+
+def test_early_close_cancels_the_pending_fetches(wiki, monkeypatch):
+    monkeypatch.setattr(scraper, "REQUESTS_PER_SECOND_PER_HOST", 0.5) # one request every 2-3 seconds
+    urls = [f"{wiki.url}/wiki/Character_{i}" for i in range(5)]
+
+    pages = scraper.iter_fetch_and_parse_pages(urls, scraper.parse_hsr_character_page)
+    next(pages)
+    start = time.monotonic()
+    pages.close()
+
+    assert time.monotonic() - start < 1
+    time.sleep(0.5)
+    assert len(wiki.requests) == 1
@@ -0,0 +1,105 @@
+import pytest
+from etl_funcs import html_parser
+from etl_funcs.html_parser import get_available_backends, read_table_rows
+from etl_funcs.scraper import parse_wuwa_character_page, parse_genshin_character_list, parse_zzz_character_page, \
+    parse_hsr_character_list, parse_hsr_character_page, parse_ow_character_list
+
+#  ================================== HTML parsing - Page fixtures ================================= #
+
+def build_character_page(fields: dict) -> str:
+
+    # Fandom infoboxes have several classes, so a backend matching the whole class attribute misses them
+    infobox = "".join(f'<div class="pi-item pi-data" data-source="{source}"><h3 class="pi-data-label">{source}</h3>'
+                      f'<div class="pi-data-value">{value}</div></div>' for source, value in fields.items())
+
+    return (f"<html><body><h1 class='page-header__title'><span class='mw-page-title-main'>Shorekeeper</span></h1>"
+            f"<main><p>Intro with <aside class='other'>a side note</aside></p>"
+            f"<aside class='portable-infobox pi-background pi-border-color pi-theme-wikia pi-layout-default'>{infobox}</aside>"
+            f"<p>Story</p></main></body></html>")
+
+def build_table_page(rows: list, tables_before: int = 0, tbody: bool = True) -> str:
+
+    body_start, body_end = ("<tbody>", "</tbody>") if tbody else ("", "")
+    other_tables = f"<table>{body_start}<tr><td>Navigation</td></tr>{body_end}</table>" * tables_before
+    body = "".join("<tr>" + "".join(cell if cell.startswith("<td") else f"<td>{cell}</td>" for cell in row) + "</tr>" for row in rows)
+
+    return f"<html><body>{other_tables}<table>{body_start}<tr><th>Header</th></tr>{body}{body_end}</table></body></html>"
+
+@pytest.fixture(params = get_available_backends())
+def backend(request, monkeypatch):
+    monkeypatch.setattr(html_parser, "HTML_PARSER_BACKEND", request.param)
+    return request.param
+
+#  ================================ HTML parsing - Character pages ================================= #
+
+def test_wuwa_character_page(backend):
+    page = build_character_page({"gender": "Female", "birthplace": "Black Shores", "releaseDate": "September 29, 2024<br/>Version 1.3"})
+
+    assert parse_wuwa_character_page(page) == {"name": "Shorekeeper", "gender": "Female", "region": "Black Shores",
+                                               "release_date": "September 29, 2024"}
+
+def test_zzz_character_page(backend):
+    page = build_character_page({"gender": "Female", "faction": "Victoria Housekeeping Co. Victoria Housekeeping Co.",
+                                 "releaseDate": "July 4, 2024<br/>Version 1.0"})
+
+    assert parse_zzz_character_page(page) == {"name": "Shorekeeper", "gender": "Female", "faction": "Victoria Housekeeping Co.",
+                                              "release_date": "July 4, 2024"}
+
+def test_hsr_character_page(backend):
+    page = build_character_page({"faction": "Stellaron Hunters", "release_date": "April 26, 2023"})
+
+    assert parse_hsr_character_page(page) == {"faction": "Stellaron Hunters", "release_date": "April 26, 2023"}
+
+def test_missing_infobox_fields(backend):
+    page = build_character_page({"releaseDate": ""})
+
+    assert parse_wuwa_character_page(page) == {"name": "Shorekeeper", "gender": "Any", "region": "Unknown", "release_date": "Unknown"}
+
+    with pytest.raises(IndexError):
+        parse_hsr_character_page(page)
+
+#  ================================= HTML parsing - Character lists ================================ #
+
+@pytest.mark.parametrize("tbody", [True, False])
+def test_table_rows(backend, tbody):
+    rows = [["a", "b", "c"], ["d", "e"], ["f", "g", "h", "i"]]
+
+    assert read_table_rows(build_table_page(rows, 2, tbody), 2) == rows
+    assert read_table_rows(build_table_page(rows, 2, tbody), 2, skip_rows = 2) == rows[1:]
+
+def test_table_rowspans(backend):
+    rows = [["Icon", '<td rowspan="2">Mondstadt</td>', "x"], ["Icon", "y"], ["Icon", "z", "w"]]
+
+    assert read_table_rows(build_table_page(rows), 0, expand_rowspans = True) == [["Icon", "Mondstadt", "x"], ["Icon", "Mondstadt", "y"],
+                                                                                  ["Icon", "z", "w"]]
+    assert read_table_rows(build_table_page(rows), 0) == [["Icon", "Mondstadt", "x"], ["Icon", "y"], ["Icon", "z", "w"]]
+
+def test_nested_tables(backend):
+    page = "<table><tr><th>Header</th></tr><tr><td>a<table><tr><td>inner</td></tr></table></td><td>b</td></tr></table>"
+
+    assert read_table_rows(page, 0) == [["ainner", "b"]]
+    assert read_table_rows(page, 1, skip_rows = 0) == [["inner"]]
+
+def test_genshin_character_list(backend):
+    rows = [["Icon", "Traveler", "5", "None", "Sword", "None", "Medium Male", "September 28, 2020", "1.0"],
+            ["Icon", "Nahida", "5", "Dendro", "Catalyst", "Sumeru", "Short Female", "", "3.2"]]
+
+    assert parse_genshin_character_list(build_table_page(rows)) == [
+        {"name": "Traveler", "gender": "Any", "region": "Unknown", "release_date": "September 28, 2020"},
+        {"name": "Nahida", "gender": "Female", "region": "Sumeru", "release_date": "Unknown"}
+    ]
+
+def test_hsr_character_list(backend):
+    rows = [["Kafka", "Nihility", "Tall Female"], ["Trailblazer", "Destruction", "Medium Male"]]
+
+    assert parse_hsr_character_list(build_table_page(rows)) == [{"name": "Kafka", "gender": "Female"}, {"name": "Trailblazer", "gender": "Any"}]
+
+@pytest.mark.parametrize("tbody", [True, False])
+def test_ow_character_list(backend, tbody):
+    rows = [["Icon", "Damage", "Tracer", "Hitscan", "Lena Oxton", "United Kingdom", "24-May-16"],
+            ["Icon", "Tank", "Torbjörn", "Engineer", "Torbjörn Lindholm", "Sweden", "Gothenburg", "24-May-16"]]
+
+    assert parse_ow_character_list(build_table_page(rows, 1, tbody), {"Tracer": "Female"}) == [
+        {"name": "Tracer", "gender": "Female", "region": "United Kingdom", "release_date": "24-May-16"},
+        {"name": "Torbjörn", "gender": "Male", "region": "Sweden", "release_date": "24-May-16"}
+    ]
@@ -0,0 +1,45 @@
+from etl_funcs.key_registry import KeyRegistry, CHARACTER_KEY
+
+#  ================================= Key registry - Surrogate keys ================================= #
+
+def test_new_values_get_ids_in_order(tmp_path):
+    registry = KeyRegistry(str(tmp_path / "key_registry.sqlite"))
+
+    assert registry.get_ids("wuwa", "region", ["Huanglong", "Rinascita", "Huanglong", None]) == {"Huanglong": 1, "Rinascita": 2}
+    assert registry.get_ids("wuwa", "region", ["Black Shores", "Rinascita"]) == {"Black Shores": 3, "Rinascita": 2}
+
+    # ids are given per dimension and per schema
+    assert registry.get_ids("wuwa", "gender", ["Female"]) == {"Female": 1}
+    assert registry.get_ids("zzz", "region", ["Rinascita"]) == {"Rinascita": 1}
+
+    registry.close()
+
+def test_ids_are_kept_across_runs(tmp_path):
+    path = str(tmp_path / "key_registry.sqlite")
+
+    registry = KeyRegistry(path)
+    first_run = registry.get_ids("hsr", CHARACTER_KEY, ["Kafka", "Himeko", "Welt"])
+    registry.close()
+
+    registry = KeyRegistry(path)
+    assert registry.get_ids("hsr", CHARACTER_KEY, ["Acheron", "Welt", "Kafka"]) == {"Acheron": 4, "Welt": 3, "Kafka": 1}
+    assert registry.get_ids("hsr", CHARACTER_KEY, ["Kafka", "Himeko", "Welt"]) == first_run
+    registry.close()
+
+def test_seed_keeps_the_loaded_ids(tmp_path):
+    registry = KeyRegistry(str(tmp_path / "key_registry.sqlite"))
+
+    assert not registry.has_keys("genshin")
+
+    # ids read from the database, with a gap left by a deleted row
+    registry.seed("genshin", "region", {"Mondstadt": 1, "Liyue": 2, "Inazuma": 5})
+
+    assert registry.has_keys("genshin")
+    assert not registry.has_keys("ow")
+    assert registry.get_ids("genshin", "region", ["Inazuma", "Sumeru", "Mondstadt"]) == {"Inazuma": 5, "Sumeru": 6, "Mondstadt": 1}
+
+    # registered values keep their ids when seeded again
+    registry.seed("genshin", "region", {"Mondstadt": 7, "Fontaine": 8})
+    assert registry.get_ids("genshin", "region", ["Mondstadt", "Fontaine", "Natlan"]) == {"Mondstadt": 1, "Fontaine": 8, "Natlan": 9}
+
+    registry.close()